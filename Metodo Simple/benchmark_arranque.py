@@ -0,0 +1,50 @@
+"""Re-resolver tras pequeños cambios en b o c: arranque en frío contra arranque en caliente.
+
+    python benchmark_arranque.py [filas] [columnas] [metodo]
+"""
+import sys
+import numpy as np
+from simplex import Simplex
+
+
+def modelo_aleatorio(m, n, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0, 10, (m, n))
+    b = rng.uniform(100, 1000, m)
+    c = rng.uniform(1, 10, n)
+    return A, b, c
+
+
+def medir(A, b, c, method, basis=None, repeticiones=5):
+    """Resuelve ``repeticiones`` veces y devuelve la corrida más rápida (y su valor)."""
+    mejor = None
+    for _ in range(repeticiones):
+        solver = Simplex("max")
+        solver.max_iterations = 100000
+        _, valor, _ = solver.solve(A, b.tolist(), c.tolist(), ['<='] * len(b), method=method, basis=basis)
+        if mejor is None or solver.elapsed < mejor[0].elapsed:
+            mejor = solver, valor
+    return mejor
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    method = sys.argv[3] if len(sys.argv) > 3 else "revised"
+    A, b, c = modelo_aleatorio(m, n)
+    rng = np.random.default_rng(1)
+
+    # La primera corrida importa scipy (BLAS o LU): se hace antes de medir
+    medir(*modelo_aleatorio(2, 2), method, repeticiones=1)
+    base, _ = medir(A, b, c, method, repeticiones=1)
+    print(f"Modelo {m}x{n} ({method}), corrida inicial: {base.reporte()}")
+    cambios = {
+        "b +-5%": (b * rng.uniform(0.95, 1.05, m), c),
+        "c +-5%": (b, c * rng.uniform(0.95, 1.05, n)),
+    }
+    for nombre, (b2, c2) in cambios.items():
+        frio, v_frio = medir(A, b2, c2, method)
+        caliente, v_caliente = medir(A, b2, c2, method, basis=base)
+        print(f"  {nombre}: frío     {frio.iterations:6d} iteraciones {frio.elapsed*1e3:10.2f} ms  z = {v_frio:.4f}")
+        print(f"  {'':{len(nombre)}}  caliente {caliente.iterations:6d} iteraciones {caliente.elapsed*1e3:10.2f} ms  "
+              f"z = {v_caliente:.4f} ({caliente.warm_start})")
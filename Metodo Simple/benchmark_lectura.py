@@ -0,0 +1,121 @@
+"""Lectura de un modelo en texto: parser anterior, ``parse_restriccion`` y ``cargar_modelo``.
+
+Genera un modelo disperso (``k`` variables por restricción), lo escribe en un
+archivo temporal y compara el tiempo de leerlo línea por línea con el parser
+anterior basado en ``re.findall`` (copiado aquí como referencia) y con
+``parse_restriccion``, el de leerlo entero con ``cargar_modelo`` y el de resolverlo.
+
+    python benchmark_lectura.py [restricciones] [variables] [k]
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+
+import numpy as np
+import scipy.sparse  # noqa: F401  (importado antes de medir: cargar_modelo lo carga en su primer uso)
+from simplex import Simplex, cargar_modelo
+
+
+def modelo_texto(m, n, k, seed=0):
+    rng = np.random.default_rng(seed)
+    lineas = ["max z = " + " + ".join(f"{c:.3f}x{j+1}" for j, c in enumerate(rng.uniform(1, 10, n)))]
+    for _ in range(m):
+        columnas = np.sort(rng.choice(n, k, replace=False))
+        terminos = " + ".join(f"{a:.3f}x{j+1}" for j, a in zip(columnas, rng.uniform(1, 10, k)))
+        lineas.append(f"{terminos} <= {rng.uniform(100, 1000):.3f}")
+    return "\n".join(lineas) + "\n"
+
+
+# ---------------- Parser anterior (referencia) ----------------
+def parse_ecuacion_z_regex(ecuacion):
+    ecuacion = ecuacion.strip().replace(" ", "").lower()
+    if not ecuacion.startswith('z='):
+        raise ValueError("La ecuación debe comenzar con 'z='")
+    ecuacion = ecuacion[2:]
+    pattern = r'([+-]?\d*\.?\d*)?x\^?(\d+)'
+    matches = re.findall(pattern, ecuacion)
+    max_index = max(int(idx) for _, idx in matches)
+    coeficientes = [0.0] * max_index
+    for coef_str, idx_str in matches:
+        idx = int(idx_str) - 1
+        if not coef_str or coef_str == '+':
+            coeficientes[idx] = 1.0
+        elif coef_str == '-':
+            coeficientes[idx] = -1.0
+        else:
+            coeficientes[idx] = float(coef_str)
+    return coeficientes
+
+def parse_restriccion_regex(restr, n_vars):
+    restr = restr.strip().replace(" ", "")
+    operator_match = re.search(r'([<=>]=?)(-?\d*\.?\d*)$', restr)
+    if not operator_match:
+        raise ValueError(f"Formato de restricción inválido: {restr}")
+    operator, rhs_str = operator_match.groups()
+    rhs = float(rhs_str)
+    left_side = restr[:operator_match.start()]
+    pattern = r'([+-]?\d*\.?\d*)?x\^?(\d+)'
+    matches = re.findall(pattern, left_side)
+    coeficientes = [0.0] * n_vars
+    for coef_str, idx_str in matches:
+        idx = int(idx_str) - 1
+        if not coef_str or coef_str == '+':
+            coeficientes[idx] = 1.0
+        elif coef_str == '-':
+            coeficientes[idx] = -1.0
+        else:
+            coeficientes[idx] = float(coef_str)
+    return coeficientes, rhs, operator
+
+
+def por_lineas(ruta, parse_z, parse_restr, repeticiones=5):
+    """Lee el archivo línea por línea con las funciones dadas; devuelve ``(segundos, filas)`` de la lectura más rápida."""
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        with open(ruta, encoding="utf-8") as archivo:
+            c = parse_z(archivo.readline().split("max", 1)[1])
+            filas = [parse_restr(linea, len(c)) for linea in archivo]
+        segundos = time.perf_counter() - inicio
+        if mejor is None or segundos < mejor[0]:
+            mejor = segundos, filas
+    return mejor
+
+
+def cargar(ruta, repeticiones=5):
+    """Como ``por_lineas`` pero con ``cargar_modelo``: ``(segundos, modelo)`` de la lectura más rápida."""
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        modelo = cargar_modelo(ruta)
+        segundos = time.perf_counter() - inicio
+        if mejor is None or segundos < mejor[0]:
+            mejor = segundos, modelo
+    return mejor
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    k = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as archivo:
+        archivo.write(modelo_texto(m, n, k))
+    try:
+        solver = Simplex("max")
+        t_regex, filas_regex = por_lineas(archivo.name, parse_ecuacion_z_regex, parse_restriccion_regex)
+        t_lineas, filas = por_lineas(archivo.name, solver.parse_ecuacion_z, solver.parse_restriccion)
+        t_modelo, modelo = cargar(archivo.name)
+    finally:
+        os.remove(archivo.name)
+
+    assert filas == filas_regex, "parse_restriccion no coincide con el parser anterior"
+    solver = Simplex(modelo.sentido)
+    solver.max_iterations = 100000
+    solver.solve(*modelo.argumentos(), method="sparse")
+    print(f"Modelo {m}x{n}, {k} variables por restricción ({modelo.A.nnz} no nulos)")
+    print(f"  parser anterior por línea:   {t_regex*1e3:10.2f} ms (filas densas)")
+    print(f"  parse_restriccion por línea: {t_lineas*1e3:10.2f} ms (filas densas)")
+    print(f"  cargar_modelo:               {t_modelo*1e3:10.2f} ms (CSR)")
+    print(f"  resolver (sparse):           {solver.elapsed*1e3:10.2f} ms  {solver.reporte()}")
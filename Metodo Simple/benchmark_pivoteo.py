@@ -0,0 +1,82 @@
+"""Benchmark por iteración de los kernels de pivoteo sobre tableaux de 500x1000.
+
+Compara los kernels vectorizados de SimplexMaximizacion con la versión
+anterior en Python puro (copiada aquí como referencia).
+
+    python benchmark_pivoteo.py [filas] [columnas] [repeticiones]
+"""
+import sys
+import time
+import numpy as np
+from simplex import SimplexMaximizacion
+from simplex.pricing import crear_pricing
+
+
+# ---------------- Kernels anteriores (referencia) ----------------
+def find_pivot_column_loop(z_row):
+    min_val = 0
+    pivot_col = None
+    for j in range(len(z_row)-1):
+        if z_row[j] < min_val - 1e-9:
+            min_val = z_row[j]
+            pivot_col = j
+    return pivot_col
+
+def find_pivot_row_loop(tableau, pivot_col):
+    m = len(tableau)-1
+    min_ratio = float('inf')
+    pivot_row = None
+    for i in range(m):
+        if tableau[i,pivot_col] > 1e-9:
+            ratio = tableau[i,-1]/tableau[i,pivot_col]
+            if ratio >=0 and ratio < min_ratio-1e-9:
+                min_ratio = ratio
+                pivot_row = i
+    return pivot_row
+
+def pivot_loop(tableau, pivot_row, pivot_col):
+    pivot_element = tableau[pivot_row,pivot_col]
+    tableau[pivot_row] /= pivot_element
+    for i in range(len(tableau)):
+        if i!=pivot_row:
+            factor = tableau[i,pivot_col]
+            tableau[i] -= factor*tableau[pivot_row]
+
+
+def tableau_aleatorio(m, n, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0, 10, (m, n)).tolist()
+    b = rng.uniform(100, 1000, m).tolist()
+    c = rng.uniform(1, 10, n).tolist()
+    return SimplexMaximizacion().build_tableau(A, b, c, ['<='] * m)
+
+
+def medir(tableau, buscar_columna, buscar_fila, pivotear, repeticiones):
+    """Tiempo medio de una iteración completa (pricing + razón + pivoteo)."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        col = buscar_columna(tableau[-1, :-1])
+        if col is None:
+            break
+        fila = buscar_fila(tableau, col)
+        if fila is None:
+            break
+        pivotear(tableau, fila, col)
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    repeticiones = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    solver = SimplexMaximizacion()
+    # El primer pivoteo importa BLAS de scipy: se hace antes de medir
+    solver._pivot(tableau_aleatorio(2, 2), 0, 0)
+    t_loop = medir(tableau_aleatorio(m, n), find_pivot_column_loop, find_pivot_row_loop, pivot_loop, repeticiones)
+    t_vec = medir(tableau_aleatorio(m, n), crear_pricing("dantzig").elegir, solver._find_pivot_row, solver._pivot, repeticiones)
+
+    print(f"Tableau {m}x{n}, {repeticiones} iteraciones")
+    print(f"  Python puro : {t_loop*1e3:9.3f} ms/iteración")
+    print(f"  NumPy       : {t_vec*1e3:9.3f} ms/iteración")
+    print(f"  Aceleración : {t_loop/t_vec:9.1f}x")
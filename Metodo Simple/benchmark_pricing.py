@@ -0,0 +1,46 @@
+"""Iteraciones y tiempo de cada regla de pricing sobre un problema de transporte degenerado.
+
+El problema de transporte balanceado con ofertas y demandas enteras iguales
+produce muchas bases degeneradas, donde Dantzig tiende a estancarse.
+
+    python benchmark_pricing.py [origenes] [destinos] [max_iterations]
+"""
+import sys
+import numpy as np
+from simplex import Simplex
+from simplex.pricing import REGLAS
+
+
+def transporte_degenerado(m, n, seed=0):
+    """LP de transporte (minimizar) con igualdades en ofertas y demandas."""
+    rng = np.random.default_rng(seed)
+    costos = rng.integers(1, 20, (m, n)).astype(float)
+    ofertas = np.full(m, 10.0 * n)
+    demandas = np.full(n, 10.0 * m)
+    A = np.zeros((m + n, m * n))
+    for i in range(m):
+        A[i, i * n:(i + 1) * n] = 1.0
+    for j in range(n):
+        A[m + j, j::n] = 1.0
+    b = np.concatenate([ofertas, demandas])
+    return A.tolist(), b.tolist(), costos.ravel().tolist(), ['='] * (m + n)
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    max_iterations = int(sys.argv[3]) if len(sys.argv) > 3 else 5000
+    A, b, c, operators = transporte_degenerado(m, n)
+    # La primera corrida de cada método importa scipy (BLAS y LU): se hace antes de medir
+    for method in ("tableau", "revised"):
+        Simplex("min").solve(*transporte_degenerado(2, 2), method=method)
+
+    print(f"Transporte {m}x{n}: {len(b)} restricciones, {len(c)} variables")
+    for method in ("tableau", "revised"):
+        for regla in REGLAS:
+            solver = Simplex("min")
+            solver.max_iterations = max_iterations
+            solver.pricing = regla
+            _, valor, _ = solver.solve(A, b, c, operators, method=method)
+            valor = f"{valor:12.2f}" if valor is not None else f"{'-':>12}"
+            print(f"  {method:8} {solver.reporte():60} z = {valor}")
@@ -0,0 +1,152 @@
+import tkinter as tk
+from tkinter import messagebox, scrolledtext
+
+TITULOS = {"max": "Maximización", "min": "Minimización"}
+
+# ---------------- GUI ----------------
+class SimplexGUI:
+    def __init__(self, master, sense="max"):
+        self.master = master
+        self.sense = sense
+        master.title(f"Método Simplex - {TITULOS[sense]}")
+        master.geometry("700x700")
+
+        self.label_z = tk.Label(master, text="Función objetivo Z:")
+        self.label_z.pack()
+        self.entry_z = tk.Entry(master, width=50)
+        self.entry_z.pack()
+        
+        self.label_m = tk.Label(master, text="Número de restricciones:")
+        self.label_m.pack()
+        self.entry_m = tk.Entry(master, width=10)
+        self.entry_m.pack()
+        
+        self.btn_generar = tk.Button(master, text="Generar campos de restricciones", command=self.generar_restricciones)
+        self.btn_generar.pack()
+        
+        self.restricciones_frame = tk.Frame(master)
+        self.restricciones_frame.pack()
+        
+        self.btn_solve = tk.Button(master, text="Resolver Simplex", command=self.resolver)
+        self.btn_solve.pack()
+        
+        self.result_text = scrolledtext.ScrolledText(master, width=85, height=25)
+        self.result_text.pack()
+        
+        self.entries_restricciones = []
+    
+    def generar_restricciones(self):
+        for widget in self.restricciones_frame.winfo_children():
+            widget.destroy()
+        self.entries_restricciones = []
+        try:
+            m = int(self.entry_m.get())
+            for i in range(m):
+                label = tk.Label(self.restricciones_frame, text=f"Restricción {i+1}:")
+                label.grid(row=i, column=0)
+                entry = tk.Entry(self.restricciones_frame, width=50)
+                entry.grid(row=i, column=1)
+                self.entries_restricciones.append(entry)
+        except:
+            messagebox.showerror("Error","Número de restricciones inválido")
+    
+    def _print_tableau_gui(self, history, iteration, n_vars):
+        iteration, tableau, pivot_row, pivot_col, basic_vars = history.replay(iteration)
+        m, n = tableau.shape
+        columnas = history.nombres_columnas(n - 1)  # -1 para la columna b
+        
+        self.result_text.insert(tk.END, f"\n--- Iteración {iteration} ---\n")
+        
+        # Encabezados
+        headers = ["VB"] + columnas + ["b"]
+        self.result_text.insert(tk.END, "   " + " ".join(f"{h:>8}" for h in headers) + "\n")
+        self.result_text.insert(tk.END, "-" * (len(headers) * 9 + 3) + "\n")
+        
+        # Filas de restricciones
+        for i in range(m-1):
+            # Variable básica
+            vb = basic_vars[i] if i < len(basic_vars) else f"F{i+1}"
+            row_str = f"{vb:>3}"
+            
+            # Valores de la fila
+            for j in range(n):
+                row_str += f"{tableau[i,j]:>8.2f}"
+            
+            # Marcar fila pivote
+            if i == pivot_row:
+                row_str += "  ← fila pivote"
+            self.result_text.insert(tk.END, row_str + "\n")
+        
+        # Fila Z (W durante la Fase I, mientras hay artificiales)
+        fase_uno = any(nombre.startswith("a") for nombre in columnas)
+        z_row_str = "  W" if fase_uno else "  Z"
+        for j in range(n):
+            z_row_str += f"{tableau[-1,j]:>8.2f}"
+        self.result_text.insert(tk.END, z_row_str + "\n")
+        
+        # Información del pivote
+        if pivot_col is not None:
+            self.result_text.insert(tk.END, f"Variable entrante: {columnas[pivot_col]}\n")
+        
+        self.result_text.insert(tk.END, "-" * (len(headers) * 9 + 3) + "\n")
+    
+    def resolver(self):
+        # El solver (y NumPy) se cargan al resolver por primera vez: la ventana abre sin esperarlos
+        from simplex import Simplex, Estado
+
+        solver = Simplex(self.sense)
+        try:
+            z = self.entry_z.get()
+            c = solver.parse_ecuacion_z(z)
+            n_vars = len(c)
+            A, b, operators = [], [], []
+            for entry in self.entries_restricciones:
+                restr = entry.get()
+                a_i, b_i, op = solver.parse_restriccion(restr, n_vars)
+                A.append(a_i)
+                b.append(b_i)
+                operators.append(op)
+            
+            solution, opt_val, history = solver.solve(A,b,c,operators, history="disk")
+            if solver.status == Estado.ILIMITADO:
+                messagebox.showerror("Error","Problema ilimitado")
+                return
+            if solver.status == Estado.INFACTIBLE:
+                messagebox.showerror("Error","Problema infactible")
+                return
+            if solver.status == Estado.LIMITE_ITERACIONES:
+                messagebox.showwarning("Advertencia","Se alcanzó el límite de iteraciones")
+                if solution is None:
+                    # Cortado en la Fase I: no hay ningún punto factible que mostrar
+                    return
+            
+            self.result_text.delete(1.0, tk.END)
+            self.result_text.insert(tk.END, f"=== MÉTODO SIMPLEX - {TITULOS[self.sense].upper()} ===\n")
+            self.result_text.insert(tk.END, f"Función objetivo: Z = {z}\n")
+            n_slack = len(solution) - n_vars - 1  # -1 porque solution incluye la columna b
+            self.result_text.insert(tk.END, f"Variables: {n_vars} de decisión + {n_slack} de holgura/exceso\n\n")
+            
+            # Mostrar todas las iteraciones
+            for iteration in history.iteraciones():
+                self._print_tableau_gui(history, iteration, n_vars)
+            
+            # Mostrar solución final
+            if solver.status == Estado.OPTIMO:
+                self.result_text.insert(tk.END, f"\n🎯 SOLUCIÓN ÓPTIMA ENCONTRADA\n")
+                self.result_text.insert(tk.END, f"Valor óptimo Z = {opt_val:.2f}\n")
+            else:
+                self.result_text.insert(tk.END, f"\n⚠ SOLUCIÓN NO ÓPTIMA (límite de iteraciones)\n")
+                self.result_text.insert(tk.END, f"Valor de Z = {opt_val:.2f}\n")
+            self.result_text.insert(tk.END, f"Pricing {solver.reporte()}\n\n")
+            
+            self.result_text.insert(tk.END, "VARIABLES DE DECISIÓN:\n")
+            for i in range(n_vars):
+                self.result_text.insert(tk.END, f"x{i+1} = {solution[i]:.4f}\n")
+            
+            self.result_text.insert(tk.END, "\nVARIABLES DE HOLGURA / EXCESO:\n")
+            for i in range(n_slack):
+                self.result_text.insert(tk.END, f"s{i+1} = {solution[n_vars + i]:.4f}\n")
+            
+            
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
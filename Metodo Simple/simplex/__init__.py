@@ -0,0 +1,8 @@
+"""Núcleo del método simplex, sin dependencias de interfaz gráfica."""
+
+from .estado import Estado
+from .modelo import ErrorSintaxis, Modelo, cargar_modelo, leer_modelo
+from .revisado import SimplexRevisado
+from .solver import Simplex, SimplexMaximizacion, SimplexMinimizacion
+
+__all__ = ["Estado", "ErrorSintaxis", "Modelo", "cargar_modelo", "leer_modelo", "Simplex", "SimplexRevisado", "SimplexMaximizacion", "SimplexMinimizacion"]
@@ -0,0 +1,62 @@
+"""Backend disperso del simplex revisado: A en formato CSC y base factorizada con SuperLU."""
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from .revisado import BaseFactorizada, SimplexRevisado
+
+
+class BaseFactorizadaDispersa(BaseFactorizada):
+    """Igual que ``BaseFactorizada`` pero con una LU dispersa de la base."""
+
+    def refactorizar(self, B):
+        self.lu = splu(sp.csc_matrix(B))
+        self.etas = []
+
+    def _resolver(self, v, trans=0):
+        return self.lu.solve(np.asarray(v, dtype=float), trans="T" if trans else "N")
+
+
+class SimplexDisperso(SimplexRevisado):
+    """Simplex revisado para matrices de restricciones casi vacías.
+
+    ``A`` puede ser cualquier matriz de ``scipy.sparse`` (o un arreglo denso);
+    nunca se construye la matriz densa ni el tableau completo.
+    """
+
+    factorizacion = BaseFactorizadaDispersa
+
+    def _matriz(self, A):
+        A = sp.csc_matrix(A, dtype=float)
+        A.sum_duplicates()
+        return A
+
+    def _escalar_filas(self, A, signos):
+        return sp.csc_matrix(sp.diags(signos) @ A)
+
+    def _columna(self, A, j):
+        m, n = A.shape
+        e = np.zeros(m)
+        if j < n:
+            inicio, fin = A.indptr[j], A.indptr[j + 1]
+            e[A.indices[inicio:fin]] = A.data[inicio:fin]
+        else:
+            e[self.forma.filas_extra[j - n]] = self.forma.coef_extra[j - n]
+        return e
+
+    def _matriz_base(self, A, basis):
+        m, n = A.shape
+        filas, datos, punteros = [], [], [0]
+        for j in basis:
+            if j < n:
+                inicio, fin = A.indptr[j], A.indptr[j + 1]
+                filas.append(A.indices[inicio:fin])
+                datos.append(A.data[inicio:fin])
+            else:
+                filas.append(self.forma.filas_extra[j - n:j - n + 1])
+                datos.append(self.forma.coef_extra[j - n:j - n + 1])
+            punteros.append(punteros[-1] + len(filas[-1]))
+        return sp.csc_matrix((np.concatenate(datos), np.concatenate(filas), punteros), shape=(m, len(basis)))
+
+    def _normas_originales(self, A):
+        return np.asarray(A.multiply(A).sum(axis=0)).ravel()
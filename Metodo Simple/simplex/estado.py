@@ -0,0 +1,9 @@
+"""Códigos de estado con los que termina una resolución."""
+from enum import Enum
+
+
+class Estado(str, Enum):
+    OPTIMO = "optimo"
+    ILIMITADO = "ilimitado"
+    INFACTIBLE = "infactible"
+    LIMITE_ITERACIONES = "limite_iteraciones"
@@ -0,0 +1,75 @@
+"""Forma estándar de las restricciones para el método de dos fases.
+
+Cada fila con ``b < 0`` se multiplica por -1 (invirtiendo el operador). Luego:
+
+- ``<=`` / ``<``: holgura +1, que entra en la base inicial.
+- ``>=`` / ``>``: exceso -1 más una variable artificial básica.
+- ``=``:         solo una variable artificial básica.
+
+Las columnas se ordenan como ``x | holguras y excesos | artificiales``.
+"""
+import numpy as np
+
+MENOR = ('<=', '<')
+MAYOR = ('>=', '>')
+IGUAL = ('=', '==')
+
+INVERSO = {'<=': '>=', '<': '>', '>=': '<=', '>': '<', '=': '=', '==': '=='}
+
+
+class FormaEstandar:
+    """Columnas extra (holguras, excesos y artificiales) y base inicial de un modelo.
+
+    Atributos:
+    signos_fila    : ±1 por fila (-1 si la fila se multiplicó por -1)
+    operadores     : operador de cada fila después de multiplicar por signos_fila
+    filas_extra    : fila de cada columna extra
+    coef_extra     : coeficiente (+1 holgura, -1 exceso, +1 artificial)
+    n_holguras     : cantidad de holguras y excesos (las primeras columnas extra)
+    n_artificiales : cantidad de variables artificiales (las últimas)
+    base_inicial   : índice de columna básica de cada fila
+    """
+
+    def __init__(self, b, operators, n_vars):
+        b = np.asarray(b, dtype=float)
+        self.signos_fila = np.where(b < 0, -1.0, 1.0)
+        ops = []
+        for i, op in enumerate(operators):
+            if op not in INVERSO:
+                raise ValueError(f"Operador de restricción inválido: {op}")
+            ops.append(INVERSO[op] if b[i] < 0 else op)
+
+        filas, coefs, artificiales = [], [], []
+        for i, op in enumerate(ops):
+            if op in MENOR:
+                filas.append(i)
+                coefs.append(1.0)
+            elif op in MAYOR:
+                filas.append(i)
+                coefs.append(-1.0)
+                artificiales.append(i)
+            else:
+                artificiales.append(i)
+        self.operadores = ops
+        self.n_vars = n_vars
+        self.n_holguras = len(filas)
+        self.n_artificiales = len(artificiales)
+        self.filas_extra = np.array(filas + artificiales, dtype=int)
+        self.coef_extra = np.array(coefs + [1.0] * len(artificiales))
+
+        base = np.full(len(ops), -1, dtype=int)
+        for k, (i, coef) in enumerate(zip(filas, coefs)):
+            if coef > 0:
+                base[i] = n_vars + k
+        inicio_art = n_vars + self.n_holguras
+        for k, i in enumerate(artificiales):
+            base[i] = inicio_art + k
+        self.base_inicial = base
+
+    @property
+    def n_total(self):
+        return self.n_vars + self.n_holguras + self.n_artificiales
+
+    @property
+    def inicio_artificiales(self):
+        return self.n_vars + self.n_holguras
@@ -0,0 +1,180 @@
+"""Historial de iteraciones del simplex con consumo de memoria acotado.
+
+Modos disponibles (``crear_historial``):
+
+- ``"none"``:   no se guarda nada.
+- ``"pivots"``: solo un registro por pivoteo (fila, columna, variables entrante
+  y saliente, valor objetivo).
+- ``"ring"``:   los últimos ``size`` tableaux en memoria.
+- ``"disk"``:   todos los tableaux en un archivo; cualquier iteración se
+  recupera bajo demanda con ``replay``.
+- ``"full"``:   copia de cada tableau en memoria (comportamiento anterior).
+
+Los modos que guardan tableaux se recorren como tuplas
+``(iteration, tableau, pivot_row, pivot_col, basic_vars)``.
+"""
+import tempfile
+from collections import deque, namedtuple
+
+import numpy as np
+
+RegistroPivote = namedtuple("RegistroPivote", "iteration pivot_row pivot_col entering leaving objective")
+
+
+def nombre_variable(j, n_vars, fila=None, n_holguras=None):
+    """Nombre de la columna ``j``: x para decisión, s para holgura o exceso, a para artificial
+    (a partir de ``n_vars + n_holguras``) y F si la fila no tiene básica."""
+    if j < 0:
+        return f"F{fila+1}"
+    if j < n_vars:
+        return f"x{j+1}"
+    if n_holguras is not None and j >= n_vars + n_holguras:
+        return f"a{j+1 - n_vars - n_holguras}"
+    return f"s{j+1 - n_vars}"
+
+
+def nombres_basicos(basis, n_vars, n_holguras=None):
+    return [nombre_variable(j, n_vars, i, n_holguras) for i, j in enumerate(basis)]
+
+
+class Historial:
+    """Modo ``"none"``: descarta todo. Base de los demás modos."""
+
+    guarda_tableaux = False
+    n_vars = 0
+    n_holguras = None
+
+    def registrar(self, iteration, tableau, pivot_row, pivot_col, basis, n_vars, objective, n_holguras=None):
+        pass
+
+    def nombres_columnas(self, n_columnas):
+        """Encabezados de las ``n_columnas`` columnas de variables de un tableau registrado."""
+        return [nombre_variable(j, self.n_vars, n_holguras=self.n_holguras) for j in range(n_columnas)]
+
+    def iteraciones(self):
+        return [registro[0] for registro in self]
+
+    def replay(self, iteration):
+        for registro in self:
+            if registro[0] == iteration:
+                return registro
+        raise KeyError(f"La iteración {iteration} no está en el historial")
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+
+class HistorialPivotes(Historial):
+    """Modo ``"pivots"``: un ``RegistroPivote`` por iteración, sin tableaux."""
+
+    def __init__(self):
+        self.registros = []
+
+    def registrar(self, iteration, tableau, pivot_row, pivot_col, basis, n_vars, objective, n_holguras=None):
+        if pivot_col is None:
+            return
+        entering = nombre_variable(pivot_col, n_vars, n_holguras=n_holguras)
+        leaving = nombre_variable(basis[pivot_row], n_vars, pivot_row, n_holguras)
+        self.registros.append(RegistroPivote(iteration, pivot_row, pivot_col, entering, leaving, float(objective)))
+
+    def __iter__(self):
+        return iter(self.registros)
+
+    def __len__(self):
+        return len(self.registros)
+
+
+class HistorialCompleto(Historial):
+    """Modo ``"full"``: copia de cada tableau en memoria."""
+
+    guarda_tableaux = True
+
+    def __init__(self, size=None):
+        self.entradas = [] if size is None else deque(maxlen=size)
+
+    def registrar(self, iteration, tableau, pivot_row, pivot_col, basis, n_vars, objective, n_holguras=None):
+        self.n_vars, self.n_holguras = n_vars, n_holguras
+        self.entradas.append((iteration, tableau.copy(), pivot_row, pivot_col, np.array(basis)))
+
+    def __iter__(self):
+        for iteration, tableau, pivot_row, pivot_col, basis in self.entradas:
+            yield iteration, tableau, pivot_row, pivot_col, nombres_basicos(basis, self.n_vars, self.n_holguras)
+
+    def __len__(self):
+        return len(self.entradas)
+
+
+class HistorialAnillo(HistorialCompleto):
+    """Modo ``"ring"``: solo los últimos ``size`` tableaux."""
+
+    def __init__(self, size=10):
+        super().__init__(size)
+
+
+class HistorialDisco(Historial):
+    """Modo ``"disk"``: escribe cada tableau en un archivo y lo relee al pedirlo.
+
+    En memoria solo queda el desplazamiento de cada iteración. Sin ``ruta`` se
+    usa un archivo temporal que se borra al liberar el historial.
+    """
+
+    guarda_tableaux = True
+
+    def __init__(self, ruta=None):
+        self.archivo = open(ruta, "w+b") if ruta else tempfile.TemporaryFile()
+        self.indice = {}
+
+    def registrar(self, iteration, tableau, pivot_row, pivot_col, basis, n_vars, objective, n_holguras=None):
+        self.n_vars, self.n_holguras = n_vars, n_holguras
+        self.archivo.seek(0, 2)
+        self.indice[iteration] = (self.archivo.tell(), pivot_row, pivot_col)
+        np.lib.format.write_array(self.archivo, np.ascontiguousarray(tableau))
+        np.lib.format.write_array(self.archivo, np.asarray(basis))
+
+    def replay(self, iteration):
+        if iteration not in self.indice:
+            raise KeyError(f"La iteración {iteration} no está en el historial")
+        desplazamiento, pivot_row, pivot_col = self.indice[iteration]
+        self.archivo.seek(desplazamiento)
+        tableau = np.lib.format.read_array(self.archivo)
+        basis = np.lib.format.read_array(self.archivo)
+        return iteration, tableau, pivot_row, pivot_col, nombres_basicos(basis, self.n_vars, self.n_holguras)
+
+    def iteraciones(self):
+        return list(self.indice)
+
+    def __iter__(self):
+        for iteration in self.indice:
+            yield self.replay(iteration)
+
+    def __len__(self):
+        return len(self.indice)
+
+    def close(self):
+        self.archivo.close()
+
+
+MODOS = {
+    "none": Historial,
+    "pivots": HistorialPivotes,
+    "ring": HistorialAnillo,
+    "disk": HistorialDisco,
+    "full": HistorialCompleto,
+}
+
+
+def crear_historial(modo=None, show_iterations=False, **opciones):
+    """Crea el historial para ``modo``; si ya es un ``Historial`` se usa tal cual.
+
+    Sin ``modo``, ``show_iterations=True`` equivale a ``"full"`` y ``False`` a ``"none"``.
+    """
+    if isinstance(modo, Historial):
+        return modo
+    if modo is None:
+        modo = "full" if show_iterations else "none"
+    if modo not in MODOS:
+        raise ValueError(f"Modo de historial desconocido: {modo}")
+    return MODOS[modo](**opciones)
@@ -0,0 +1,62 @@
+"""Kernels NumPy del simplex de tableau: prueba de razón y pivoteo de rango 1."""
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def _dger():
+    """``dger`` de BLAS, importado de scipy en el primer pivoteo (``None`` sin scipy)."""
+    try:
+        from scipy.linalg.blas import dger
+    except ImportError:  # sin scipy se usa la actualización con broadcasting
+        return None
+    return dger
+
+
+def elegir_fila(ratios, prioridad=None, tol=1e-9):
+    """Fila de razón mínima; en empate la primera, o la de menor ``prioridad`` si se da."""
+    min_ratio = ratios.min()
+    if not np.isfinite(min_ratio):
+        return None
+    empatadas = np.flatnonzero(ratios <= min_ratio + tol)
+    if prioridad is None:
+        return int(empatadas[0])
+    return int(empatadas[np.argmin(prioridad[empatadas])])
+
+
+def prueba_razon(tableau, pivot_col, prioridad=None, tol=1e-9):
+    """Fila pivote por la prueba de razón mínima, o ``None`` si la columna no acota."""
+    columna = tableau[:-1, pivot_col]
+    # Con la Fase I la base siempre es factible: los b negativos son solo redondeo
+    rhs = np.maximum(tableau[:-1, -1], 0.0)
+    ratios = np.full(len(columna), np.inf)
+    np.divide(rhs, columna, out=ratios, where=columna > tol)
+    return elegir_fila(ratios, prioridad, tol)
+
+
+def prueba_razon_dual(tableau, pivot_row, tol=1e-9):
+    """Columna entrante del simplex dual para la fila ``pivot_row`` (con b negativo),
+    o ``None`` si la fila no tiene elementos negativos y el problema es infactible."""
+    fila = tableau[pivot_row, :-1]
+    # La base es dual factible: los costos reducidos negativos son solo redondeo
+    z_row = np.maximum(tableau[-1, :-1], 0.0)
+    ratios = np.full(len(fila), np.inf)
+    np.divide(z_row, -fila, out=ratios, where=fila < -tol)
+    return elegir_fila(ratios, tol=tol)
+
+
+def pivotear(tableau, pivot_row, pivot_col):
+    """Pivoteo en el lugar: normaliza la fila pivote y elimina la columna con un solo producto exterior."""
+    tableau[pivot_row] /= tableau[pivot_row, pivot_col]
+    factores = tableau[:, pivot_col].copy()
+    factores[pivot_row] = 0.0
+    fila = tableau[pivot_row].copy()
+    dger = _dger()
+    if dger is not None and tableau.dtype == np.float64 and tableau.flags.c_contiguous:
+        # tableau.T es contiguo en orden Fortran: BLAS actualiza sin copias
+        resultado = dger(-1.0, fila, factores, a=tableau.T, overwrite_a=1)
+        if not np.shares_memory(resultado, tableau):
+            tableau[:] = resultado.T
+    else:
+        tableau -= np.outer(factores, fila)
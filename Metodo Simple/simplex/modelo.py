@@ -0,0 +1,412 @@
+"""Lectura de modelos lineales escritos como texto, en una sola pasada.
+
+Formato (una expresión por línea, ``#`` inicia un comentario)::
+
+    max z = 3x1 + 5x2          # también "min: ...", "z = ..." o "maximizar z = ..."
+    sujeto a                   # opcional
+    2x1 + x2 <= 10
+    x1 + 3*x2 >= 4
+    costo_a - costo_b = 0
+
+La primera línea con contenido es la función objetivo; las demás son
+restricciones ``expresión operador expresión`` con términos (``3x``, ``-2.5*y``,
+``x``, ``7``) en ambos lados: se pasan las variables a la izquierda y las
+constantes a la derecha. Las variables pueden tener cualquier nombre
+(``x1``, ``x^2``, ``costo_a``). Si todas son de la forma ``x<k>`` la columna
+de ``xk`` es ``k-1``, como en la interfaz; si no, las columnas siguen el orden
+de aparición.
+
+Las restricciones ``términos op constante`` se leen con expresiones regulares
+compiladas (un solo ``split`` si las variables son ``x<k>``); las demás líneas
+(y las que tienen errores) pasan por un tokenizador compilado que informa línea
+y columna. Los coeficientes se acumulan en triples COO y la matriz de
+restricciones se arma al final como ``scipy.sparse.csr_matrix``, lista para
+``solve(..., method="sparse")``.
+"""
+import re
+
+import numpy as np
+
+_NUMERO = r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+_NOMBRE = r"[A-Za-z_][A-Za-z0-9_]*(?:\^\d+)?"
+_OPERADOR = r"<=|>=|==|=<|=>|<|>|="
+
+_TOKEN = re.compile(rf"""
+    (?P<espacio>\s+)
+  | (?P<numero>{_NUMERO})
+  | (?P<variable>{_NOMBRE})
+  | (?P<operador>{_OPERADOR})
+  | (?P<signo>[+-])
+  | (?P<por>\*)
+  | (?P<dos_puntos>:)
+  | (?P<comentario>\#.*)
+  | (?P<error>.)
+""", re.VERBOSE)
+
+# Camino rápido para "términos op constante": _OPERADOR_INICIO ubica el operador,
+# _LADO_DERECHO valida lo que sigue y split con _TERMINO separa los términos
+# (grupos signo, coeficiente, nombre); lo que queda entre términos debe ser vacío.
+_TERMINO = re.compile(rf"([+-]?)\s*(?:({_NUMERO})\s*(?:\*\s*)?)?({_NOMBRE})(?![A-Za-z0-9_^])")
+_OPERADOR_INICIO = re.compile(r"[<>=]")
+_LADO_DERECHO = re.compile(rf"({_OPERADOR})\s*([+-]?)\s*({_NUMERO})\s*(?:\#.*)?\s*")
+
+# Forma de la interfaz ("3x1 + 2.5x^2 <= 10"), probada antes que _TERMINO: split
+# corta en cada x<k>, seguido del signo del término siguiente o, en el último, de
+# "op constante" hasta el final; los trozos entre medio son los coeficientes.
+_TERMINO_X = re.compile(rf"x\^?([1-9]\d*) *(?:([+-]) *|({_OPERADOR})\s*([+-]?)\s*({_NUMERO})\s*(?:\#.*)?\s*\Z)")
+_UNITARIOS = {"": 1.0, "+": 1.0, "-": -1.0}
+
+_INDICE_X = re.compile(r"[xX]\^?(\d+)\Z")
+
+SENTIDOS = {"max": "max", "maximizar": "max", "maximize": "max", "min": "min", "minimizar": "min", "minimize": "min"}
+SEPARADORES = {"sujeto a", "sujeta a", "s.a.", "s.t.", "st", "subject to"}
+OPERADORES = {"<=": "<=", "=<": "<=", ">=": ">=", "=>": ">=", "<": "<=", ">": ">=", "=": "=", "==": "="}
+
+
+class ErrorSintaxis(ValueError):
+    """Error de lectura con su posición (línea y columna empiezan en 1)."""
+
+    def __init__(self, mensaje, linea, columna):
+        super().__init__(f"línea {linea}, columna {columna}: {mensaje}")
+        self.mensaje = mensaje
+        self.linea = linea
+        self.columna = columna
+
+
+class Modelo:
+    """Modelo leído: ``A`` dispersa (CSR), ``b``, ``c``, operadores y nombres de variables.
+
+    ``sentido`` es ``"max"``, ``"min"`` o ``None`` si el texto no lo indica.
+    """
+
+    def __init__(self, sentido, c, A, b, operadores, variables):
+        self.sentido = sentido
+        self.c = c
+        self.A = A
+        self.b = b
+        self.operadores = operadores
+        self.variables = variables
+
+    @property
+    def forma(self):
+        return self.A.shape
+
+    def argumentos(self):
+        """``(A, b, c, operators)`` en el orden de ``Simplex.solve``."""
+        return self.A, self.b, self.c, self.operadores
+
+
+class _Lector:
+    """Recorre líneas con ``_TOKEN`` y acumula los coeficientes por nombre de variable."""
+
+    def __init__(self):
+        self.columnas = {}
+        self.posiciones = {}    # (línea, columna) donde el tokenizador vio cada variable por primera vez
+        self.indices_x = {}     # "k" -> columna de xk, para el camino rápido de la forma x<k>
+
+    def columna(self, nombre, posicion=None):
+        columna = self.columnas.get(nombre)
+        if columna is None:
+            columna = self.columnas[nombre] = len(self.columnas)
+        if posicion is not None and nombre not in self.posiciones:
+            self.posiciones[nombre] = posicion
+        return columna
+
+    def expresion(self, linea, n_linea, inicio=0, con_operador=True, rapida=True):
+        """Términos de ``linea[inicio:]``; devuelve ``(columnas, valores, constante, operador)``.
+
+        Con ``con_operador`` la línea debe tener exactamente un operador
+        relacional y los términos de la derecha cambian de signo; la constante
+        devuelta es el lado derecho ya despejado. Con ``rapida=False`` no se
+        prueba el camino rápido (que no registra posiciones de las variables).
+        """
+        if rapida and con_operador and not inicio:
+            resultado = self._rapida_x(linea)
+            if resultado is None:
+                resultado = self._rapida(linea)
+            if resultado is not None:
+                return resultado
+        columnas, valores = [], []
+        constante = 0.0
+        operador = None
+        lado = 1.0
+        signo = None        # signo leído para el término en curso (None: no hay)
+        numero = None       # coeficiente leído y aún sin variable
+        por = False         # hubo un '*' entre el número y la variable
+        terminos = 0        # términos completos del lado actual
+        columna_numero = 0
+        for token in _TOKEN.finditer(linea, inicio):
+            tipo = token.lastgroup
+            if tipo == "espacio":
+                continue
+            if tipo == "comentario":
+                break
+            col = token.start() + 1
+            if tipo in ("numero", "variable") and signo is None and numero is None and terminos:
+                raise ErrorSintaxis("falta un '+' o '-' entre dos términos", n_linea, col)
+            if tipo == "numero":
+                if numero is not None:
+                    raise ErrorSintaxis("se esperaba una variable después del coeficiente", n_linea, col)
+                numero = float(token.group())
+                columna_numero = col
+            elif tipo == "variable":
+                nombre = token.group()
+                if nombre.lower() in SENTIDOS:
+                    raise ErrorSintaxis(f"'{nombre}' solo puede ir al inicio de la función objetivo", n_linea, col)
+                if "^" in nombre:
+                    nombre = nombre.replace("^", "")
+                coef = (1.0 if numero is None else numero) * (-1.0 if signo == "-" else 1.0) * lado
+                columnas.append(self.columna(nombre, (n_linea, col)))
+                valores.append(coef)
+                signo, numero, por = None, None, False
+                terminos += 1
+            elif tipo == "signo":
+                if por:
+                    raise ErrorSintaxis("se esperaba una variable después de '*'", n_linea, col)
+                if numero is not None:
+                    constante -= numero * (-1.0 if signo == "-" else 1.0) * lado
+                    numero = None
+                    terminos += 1
+                elif signo is not None:
+                    raise ErrorSintaxis("signo repetido", n_linea, col)
+                signo = token.group()
+            elif tipo == "por":
+                if numero is None or por:
+                    raise ErrorSintaxis("'*' debe ir entre un coeficiente y una variable", n_linea, col)
+                por = True
+            elif tipo == "operador":
+                if not con_operador:
+                    raise ErrorSintaxis("la función objetivo no lleva operador relacional", n_linea, col)
+                if operador is not None:
+                    raise ErrorSintaxis("hay más de un operador relacional", n_linea, col)
+                if por or (signo is not None and numero is None):
+                    raise ErrorSintaxis("falta un término antes del operador", n_linea, col)
+                if numero is not None:
+                    constante -= numero * (-1.0 if signo == "-" else 1.0) * lado
+                    numero = None
+                    terminos += 1
+                if not terminos:
+                    raise ErrorSintaxis("falta el lado izquierdo de la restricción", n_linea, col)
+                operador = OPERADORES[token.group()]
+                lado, signo, terminos = -1.0, None, 0
+            elif tipo == "dos_puntos":
+                raise ErrorSintaxis("':' solo puede ir en la función objetivo", n_linea, col)
+            else:
+                raise ErrorSintaxis(f"carácter inesperado {token.group()!r}", n_linea, col)
+
+        fin = len(linea.rstrip()) + 1
+        if por:
+            raise ErrorSintaxis("se esperaba una variable después de '*'", n_linea, fin)
+        if numero is not None:
+            if not con_operador:
+                raise ErrorSintaxis("la función objetivo no admite términos constantes", n_linea, columna_numero)
+            constante -= numero * (-1.0 if signo == "-" else 1.0) * lado
+            terminos += 1
+        elif signo is not None:
+            raise ErrorSintaxis("la expresión termina en un signo", n_linea, fin)
+        if con_operador and operador is None:
+            raise ErrorSintaxis("falta el operador relacional (<=, >= o =)", n_linea, fin)
+        if not terminos:
+            raise ErrorSintaxis("expresión vacía", n_linea, fin)
+        return columnas, valores, constante, operador
+
+    def _rapida_x(self, linea):
+        """``expresion`` para la forma ``x<k>``; ``None`` si la línea no la tiene."""
+        partes = _partir_x(linea)
+        if partes is None:
+            return None
+        columnas, valores = [], []
+        try:
+            for signo, coef, k in zip(["", *partes[2::6]], partes[::6], partes[1::6]):
+                columna = self.indices_x.get(k)
+                if columna is None:
+                    columna = self.indices_x[k] = self.columna("x" + k)
+                coef = signo + coef
+                valores.append(_UNITARIOS.get(coef) or float(coef))
+                columnas.append(columna)
+        except ValueError:
+            return None
+        return (columnas, valores) + _constante(*partes[-4:-1])
+
+    def _rapida(self, linea):
+        """``expresion`` por el camino rápido; ``None`` si la línea necesita el tokenizador."""
+        partes = _partir(linea)
+        if partes is None:
+            return None
+        terminos, derecho = partes
+        columnas, valores = [], []
+        for signo, numero, nombre in terminos:
+            if nombre.lower() in SENTIDOS:
+                return None
+            coef = float(numero) if numero else 1.0
+            columnas.append(self.columna(nombre.replace("^", "")))
+            valores.append(-coef if signo == "-" else coef)
+        return (columnas, valores) + _constante(*derecho.groups())
+
+    def objetivo(self, linea, n_linea):
+        """Sentido y términos de la función objetivo: ``[max|min] [z] (=|:) expresión``."""
+        sentido = None
+        prefijo = 0
+        tokens = _TOKEN.finditer(linea)
+        for token in tokens:
+            tipo = token.lastgroup
+            if tipo == "espacio":
+                continue
+            texto = token.group().lower()
+            if prefijo == 0 and tipo == "variable" and texto in SENTIDOS:
+                sentido = SENTIDOS[texto]
+                prefijo = 1
+            elif prefijo < 2 and tipo == "variable" and texto == "z":
+                prefijo = 2
+            elif prefijo and (tipo == "dos_puntos" or token.group() == "="):
+                return sentido, self.expresion(linea, n_linea, token.end(), con_operador=False)[:2]
+            elif prefijo == 1:
+                # "max 3x + 2y": sin separador
+                return sentido, self.expresion(linea, n_linea, token.start(), con_operador=False)[:2]
+            else:
+                break
+        raise ErrorSintaxis("la primera línea debe ser la función objetivo (z = ..., max z = ... o min: ...)",
+                            n_linea, len(linea) - len(linea.lstrip()) + 1)
+
+
+def _partir(linea):
+    """``(terminos, lado_derecho)`` de una línea "términos op constante", o ``None`` si no tiene esa forma."""
+    operador = _OPERADOR_INICIO.search(linea)
+    if operador is None:
+        return None
+    derecho = _LADO_DERECHO.fullmatch(linea, operador.start())
+    if derecho is None:
+        return None
+    partes = _TERMINO.split(linea[:operador.start()])
+    # partes = [separador, signo, coeficiente, nombre, separador, ...]: solo el primer término puede ir sin signo
+    if len(partes) == 1 or not all(partes[5::4]) or "".join(partes[::4]).strip():
+        return None
+    return zip(partes[1::4], partes[2::4], partes[3::4]), derecho
+
+
+def _partir_x(linea):
+    """``_TERMINO_X.split`` de una línea "términos x<k> op constante", o ``None`` si no tiene esa forma.
+
+    Devuelve ``[coef, k, signo, None, None, None, coef, k, ..., k, None, op,
+    signo, constante, ""]``; los coeficientes (con su signo) quedan para float().
+    """
+    partes = _TERMINO_X.split(linea)
+    if len(partes) == 1 or partes[-1] or partes[-4] is None:
+        return None
+    if "n" in linea or "N" in linea or "_" in linea:
+        return None     # float() también acepta "inf", "nan" y "1_000"
+    return partes
+
+
+def _constante(operador, signo, numero):
+    return -float(numero) if signo == "-" else float(numero), OPERADORES[operador]
+
+
+def _columnas_x(nombres):
+    """Columna ``k-1`` de cada ``xk`` si todos los nombres son de esa forma; si no, ``None``."""
+    indices = []
+    for nombre in nombres:
+        coincidencia = _INDICE_X.match(nombre)
+        if coincidencia is None or int(coincidencia.group(1)) == 0:
+            return None
+        indices.append(int(coincidencia.group(1)) - 1)
+    return np.array(indices, dtype=np.int64)
+
+
+def leer_modelo(lineas):
+    """Lee un modelo desde un iterable de líneas (un archivo abierto, una lista o un texto).
+
+    Recorre cada línea una sola vez; lanza ``ErrorSintaxis`` con línea y
+    columna ante el primer error.
+    """
+    from scipy.sparse import csr_matrix
+
+    if isinstance(lineas, str):
+        lineas = lineas.splitlines()
+    lector = _Lector()
+    sentido, objetivo = None, None
+    filas, columnas, valores = [], [], []
+    b, operadores = [], []
+    for n_linea, linea in enumerate(lineas, 1):
+        contenido = linea.split("#", 1)[0].strip()
+        if not contenido:
+            continue
+        if objetivo is None:
+            sentido, objetivo = lector.objetivo(linea, n_linea)
+            continue
+        if contenido.lower().rstrip(":") in SEPARADORES:
+            continue
+        cols, vals, rhs, op = lector.expresion(linea, n_linea)
+        filas.extend([len(b)] * len(cols))
+        columnas.extend(cols)
+        valores.extend(vals)
+        b.append(rhs)
+        operadores.append(op)
+    if objetivo is None:
+        raise ErrorSintaxis("no hay función objetivo", 1, 1)
+
+    nombres = list(lector.columnas)
+    mapa = _columnas_x(nombres)
+    if mapa is None:
+        n = len(nombres)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        cols_z = np.asarray(objetivo[0], dtype=np.int64)
+    else:
+        n = int(mapa.max()) + 1 if len(mapa) else 0
+        nombres = [f"x{k+1}" for k in range(n)]
+        columnas = mapa[np.asarray(columnas, dtype=np.int64)]
+        cols_z = mapa[np.asarray(objetivo[0], dtype=np.int64)]
+    c = np.zeros(n)
+    np.add.at(c, cols_z, objetivo[1])
+    A = csr_matrix((np.asarray(valores, dtype=float), (np.asarray(filas, dtype=np.int64), columnas)), shape=(len(b), n))
+    A.sum_duplicates()
+    return Modelo(sentido, c, A, np.array(b, dtype=float), operadores, nombres)
+
+
+def cargar_modelo(ruta):
+    """Lee un modelo desde un archivo de texto, línea por línea."""
+    with open(ruta, encoding="utf-8-sig") as archivo:
+        return leer_modelo(archivo)
+
+
+def ecuacion_objetivo(ecuacion):
+    """Coeficientes densos de ``z = ...`` con variables ``x<k>`` (columna ``k-1``)."""
+    lector = _Lector()
+    _, (cols, vals) = lector.objetivo(ecuacion, 1)
+    return _densos(lector, cols, vals, None)
+
+
+def restriccion(restr, n_vars):
+    """``(coeficientes, rhs, operador)`` de una restricción con variables ``x<k>``."""
+    partes = _partir_x(restr)
+    if partes is not None:
+        coeficientes = [0.0] * n_vars
+        try:
+            coeficientes[int(partes[1]) - 1] = _UNITARIOS.get(partes[0]) or float(partes[0])
+            for signo, coef, k in zip(partes[2::6], partes[6::6], partes[7::6]):
+                coeficientes[int(k) - 1] += float(signo + (coef or "1"))
+        except (ValueError, IndexError):
+            pass
+        else:
+            rhs = float(partes[-2])
+            return coeficientes, -rhs if partes[-3] == "-" else rhs, OPERADORES[partes[-4]]
+    # Otras formas, o nombres que no son x1..xn: el tokenizador da la posición del error
+    lector = _Lector()
+    cols, vals, rhs, op = lector.expresion(restr, 1, rapida=False)
+    return _densos(lector, cols, vals, n_vars), rhs, op
+
+
+def _densos(lector, cols, vals, n_vars):
+    indices = []
+    for nombre in lector.columnas:
+        posicion = lector.posiciones[nombre]
+        coincidencia = _INDICE_X.match(nombre)
+        if coincidencia is None or int(coincidencia.group(1)) == 0:
+            raise ErrorSintaxis(f"la variable '{nombre}' debe ser de la forma x1, x2, ...", *posicion)
+        indices.append(int(coincidencia.group(1)) - 1)
+        if n_vars is not None and indices[-1] >= n_vars:
+            raise ErrorSintaxis(f"la variable '{nombre}' no está en la función objetivo", *posicion)
+    coeficientes = [0.0] * (max(indices) + 1 if n_vars is None else n_vars)
+    for columna, valor in zip(cols, vals):
+        coeficientes[indices[columna]] += valor
+    return coeficientes
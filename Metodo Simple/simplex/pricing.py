@@ -0,0 +1,139 @@
+"""Reglas de pricing (elección de la columna entrante) del simplex.
+
+Todas reciben la fila Z en la convención del tableau (puede entrar cualquier
+columna con valor negativo) y devuelven el índice elegido, o ``None`` en el
+óptimo. Las reglas con pesos los piden al motor, que expone:
+
+- ``basis``:              variable básica de cada fila
+- ``n_columnas()``:       cantidad de columnas de variables
+- ``fila_pivote(r)``:     fila ``r`` de B^-1 A
+- ``proyeccion(d)``:      (B^-1 a_j)·d para todas las columnas
+- ``normas_columnas()``:  ||B^-1 a_j||² exactas, o ``None`` si no son baratas
+
+Reglas disponibles (``crear_pricing``): ``"dantzig"``, ``"bland"``,
+``"partial"``, ``"devex"`` y ``"steepest"``.
+"""
+import numpy as np
+
+TOL = 1e-9
+
+
+class Dantzig:
+    """Costo reducido más negativo; en empate, el primer índice."""
+
+    nombre = "dantzig"
+    # Si es True, la prueba de razón desempata por el menor índice de variable básica
+    desempate_por_indice = False
+
+    def reiniciar(self, motor):
+        pass
+
+    def elegir(self, z_row):
+        pivot_col = int(np.argmin(z_row))
+        if z_row[pivot_col] < -TOL:
+            return pivot_col
+        return None
+
+    def actualizar(self, motor, pivot_row, pivot_col, columna):
+        pass
+
+
+class Bland(Dantzig):
+    """Regla de Bland: menor índice que mejora, tanto al entrar como al salir. No cicla."""
+
+    nombre = "bland"
+    desempate_por_indice = True
+
+    def elegir(self, z_row):
+        candidatas = np.flatnonzero(z_row < -TOL)
+        return int(candidatas[0]) if len(candidatas) else None
+
+
+class Parcial(Dantzig):
+    """Pricing parcial: Dantzig dentro del primer bloque de columnas con candidatas.
+
+    Los bloques se recorren en forma circular empezando por el siguiente al
+    último elegido. Sin ``tamano`` se usan bloques de sqrt(n) columnas.
+    """
+
+    nombre = "partial"
+
+    def __init__(self, tamano=None):
+        self.tamano = tamano
+        self.inicio = 0
+
+    def reiniciar(self, motor):
+        self.inicio = 0
+
+    def elegir(self, z_row):
+        n = len(z_row)
+        tamano = self.tamano or max(1, int(np.sqrt(n)))
+        for k in range(-(-n // tamano)):
+            inicio = (self.inicio + k * tamano) % n
+            bloque = np.arange(inicio, inicio + tamano) % n
+            local = int(np.argmin(z_row[bloque]))
+            if z_row[bloque[local]] < -TOL:
+                self.inicio = (inicio + tamano) % n
+                return int(bloque[local])
+        return None
+
+
+class Devex(Dantzig):
+    """Devex (Forrest y Goldfarb): pesos de referencia aproximados del steepest edge."""
+
+    nombre = "devex"
+
+    def reiniciar(self, motor):
+        self.pesos = np.ones(motor.n_columnas())
+
+    def elegir(self, z_row):
+        puntaje = np.where(z_row < -TOL, z_row ** 2 / self.pesos, -1.0)
+        pivot_col = int(np.argmax(puntaje))
+        return pivot_col if puntaje[pivot_col] > 0 else None
+
+    def actualizar(self, motor, pivot_row, pivot_col, columna):
+        fila = motor.fila_pivote(pivot_row)
+        alfa = fila[pivot_col]
+        peso_q = self.pesos[pivot_col]
+        self.pesos = np.maximum(self.pesos, (fila / alfa) ** 2 * peso_q)
+        self.pesos[motor.basis[pivot_row]] = max(peso_q / alfa ** 2, 1.0)
+
+
+class SteepestEdge(Devex):
+    """Steepest edge con la actualización exacta de Goldfarb y Reid.
+
+    Si el motor no puede dar las normas iniciales, parte de pesos unitarios.
+    """
+
+    nombre = "steepest"
+
+    def reiniciar(self, motor):
+        normas = motor.normas_columnas()
+        self.pesos = 1.0 + normas if normas is not None else np.ones(motor.n_columnas())
+
+    def actualizar(self, motor, pivot_row, pivot_col, columna):
+        fila = motor.fila_pivote(pivot_row)
+        alfa = fila[pivot_col]
+        razon = fila / alfa
+        peso_q = self.pesos[pivot_col]
+        self.pesos = np.maximum(self.pesos - 2.0 * razon * motor.proyeccion(columna) + razon ** 2 * peso_q,
+                                1.0 + razon ** 2)
+        self.pesos[motor.basis[pivot_row]] = max(peso_q / alfa ** 2, 1.0)
+
+
+REGLAS = {
+    "dantzig": Dantzig,
+    "bland": Bland,
+    "partial": Parcial,
+    "devex": Devex,
+    "steepest": SteepestEdge,
+}
+
+
+def crear_pricing(regla="dantzig"):
+    """Crea la regla de pricing ``regla``; si ya es una instancia se usa tal cual."""
+    if not isinstance(regla, str):
+        return regla
+    if regla not in REGLAS:
+        raise ValueError(f"Regla de pricing desconocida: {regla}")
+    return REGLAS[regla]()
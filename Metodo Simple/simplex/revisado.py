@@ -0,0 +1,326 @@
+"""Simplex revisado: mantiene solo la base factorizada y calcula columnas bajo demanda."""
+import warnings
+from functools import lru_cache
+
+import numpy as np
+
+from .historial import crear_historial
+from .estado import Estado
+from .estandar import FormaEstandar
+from .kernels import elegir_fila
+from .pricing import crear_pricing
+
+
+@lru_cache(maxsize=None)
+def _lu():
+    """``(lu_factor, lu_solve)`` de scipy, importados en la primera factorización (``None`` sin scipy)."""
+    try:
+        from scipy.linalg import lu_factor, lu_solve
+    except ImportError:  # sin scipy se resuelve con np.linalg.solve
+        return None, None
+    return lu_factor, lu_solve
+
+
+class BaseFactorizada:
+    """Factorización LU de la base más un archivo de etas (forma producto de la inversa).
+
+    Cada pivoteo agrega una matriz eta en O(m); la LU se recalcula al llamar a
+    ``refactorizar``, lo que descarta las etas acumuladas.
+    """
+
+    def __init__(self, B):
+        self.refactorizar(B)
+
+    def refactorizar(self, B):
+        B = np.asarray(B, dtype=float)
+        lu_factor, _ = _lu()
+        self.lu = lu_factor(B) if lu_factor is not None else B.copy()
+        self.etas = []
+
+    def _resolver(self, v, trans=0):
+        _, lu_solve = _lu()
+        if lu_solve is not None:
+            return lu_solve(self.lu, v, trans=trans)
+        return np.linalg.solve(self.lu.T if trans else self.lu, v)
+
+    def ftran(self, a):
+        """Resuelve B x = a."""
+        x = self._resolver(a)
+        for r, eta in self.etas:
+            xr = x[r]
+            x += eta * xr
+            x[r] = eta[r] * xr
+        return x
+
+    def btran(self, c):
+        """Resuelve y^T B = c^T."""
+        z = np.array(c, dtype=float)
+        for r, eta in reversed(self.etas):
+            z[r] = z @ eta
+        return self._resolver(z, trans=1)
+
+    def actualizar(self, r, d):
+        """Registra el cambio de base en la fila ``r`` con columna entrante ``d = B^-1 a_q``."""
+        eta = -d / d[r]
+        eta[r] = 1.0 / d[r]
+        self.etas.append((r, eta))
+
+
+class SimplexRevisado:
+    """Simplex revisado con la misma salida ``(solution, optimal_value, history)`` que el tableau.
+
+    ``sense`` es ``"max"`` o ``"min"``. Las restricciones se llevan a la forma
+    estándar de ``FormaEstandar``; si hay variables artificiales se resuelve
+    primero la Fase I y luego se descartan.
+    """
+
+    factorizacion = BaseFactorizada
+
+    def __init__(self, sense="max", max_iterations=1000, refactor_frequency=50, pricing="dantzig"):
+        if sense not in ("max", "min"):
+            raise ValueError("sense debe ser 'max' o 'min'")
+        self.sense = sense
+        self.max_iterations = max_iterations
+        self.refactor_frequency = refactor_frequency
+        self.pricing = pricing
+        self.status = None
+        self.iterations = 0
+        self.warm_start = None
+
+    def _signo(self):
+        return -1.0 if self.sense == "max" else 1.0
+
+    def _matriz(self, A):
+        return np.asarray(A, dtype=float)
+
+    def _escalar_filas(self, A, signos):
+        return A * signos[:, None]
+
+    def _preparar(self, A, b, c, operators):
+        A = self._matriz(A)
+        b = np.asarray(b, dtype=float)
+        c = np.asarray(c, dtype=float)
+        forma = FormaEstandar(b, operators, A.shape[1])
+        if (forma.signos_fila < 0).any():
+            A = self._escalar_filas(A, forma.signos_fila)
+        return A, b * forma.signos_fila, c, forma
+
+    def _columna(self, A, j):
+        m, n = A.shape
+        if j < n:
+            return A[:, j].copy()
+        e = np.zeros(m)
+        e[self.forma.filas_extra[j - n]] = self.forma.coef_extra[j - n]
+        return e
+
+    def _matriz_base(self, A, basis):
+        return np.column_stack([self._columna(A, j) for j in basis])
+
+    def _productos(self, A, y):
+        """y^T a_j para todas las columnas; una columna extra de la fila i es coef·e_i."""
+        return np.concatenate([A.T @ y, self.forma.coef_extra * y[self.forma.filas_extra]])
+
+    # Interfaz que usan las reglas de pricing (ver pricing.py)
+    def n_columnas(self):
+        return self.forma.n_total
+
+    def fila_pivote(self, r):
+        e = np.zeros(len(self.basis))
+        e[r] = 1.0
+        return self._productos(self.A, self.factor.btran(e))
+
+    def proyeccion(self, d):
+        return self._productos(self.A, self.factor.btran(d))
+
+    def _normas_originales(self, A):
+        return (A ** 2).sum(axis=0)
+
+    def normas_columnas(self):
+        """||B^-1 a_j||² solo con la base inicial (identidad); si no, ``None``."""
+        if (self.basis < self.A.shape[1]).any() or len(self.factor.etas):
+            return None
+        return np.concatenate([self._normas_originales(self.A), self.forma.coef_extra ** 2])
+
+    def _tableau(self, A, costos, signo, columnas):
+        """Reconstruye el tableau denso equivalente (solo para mostrar iteraciones)."""
+        m = A.shape[0]
+        tableau = np.zeros((m + 1, len(columnas) + 1))
+        for k, j in enumerate(columnas):
+            tableau[:-1, k] = self.factor.ftran(self._columna(A, j))
+        tableau[:-1, -1] = self.x_B
+        y = self.factor.btran(costos[self.basis])
+        tableau[-1, :-1] = signo * (costos - self._productos(A, y))[columnas]
+        tableau[-1, -1] = -signo * (costos[self.basis] @ self.x_B)
+        return tableau
+
+    def _cambiar_base(self, A, pivot_row, pivot_col, columna):
+        """Actualiza x_B, la base y la factorización tras el pivoteo."""
+        theta = self.x_B[pivot_row] / columna[pivot_row]
+        self.x_B -= theta * columna
+        self.x_B[pivot_row] = theta
+        self.basis[pivot_row] = pivot_col
+        self.factor.actualizar(pivot_row, columna)
+        if len(self.factor.etas) >= self.refactor_frequency:
+            self.factor.refactorizar(self._matriz_base(A, self.basis))
+            self.x_B = self.factor.ftran(self.b)
+
+    def _iterar(self, A, costos, signo, permitidas, historial):
+        """Pivotea hasta el óptimo; devuelve OPTIMO, ILIMITADO o LIMITE_ITERACIONES."""
+        m, n = A.shape
+        columnas = np.flatnonzero(permitidas)
+        pricing = crear_pricing(self.pricing)
+        pricing.reiniciar(self)
+        prioridad = self.basis if pricing.desempate_por_indice else None
+        while self.iterations < self.max_iterations:
+            y = self.factor.btran(costos[self.basis])
+            # Misma convención que la fila Z del tableau: se busca el más negativo
+            z_row = signo * (costos - self._productos(A, y))
+            z_row[~permitidas] = 0.0
+            pivot_col = pricing.elegir(z_row)
+            if pivot_col is None:
+                return Estado.OPTIMO
+
+            columna = self.factor.ftran(self._columna(A, pivot_col))
+            validas = columna > 1e-9
+            if not validas.any():
+                return Estado.ILIMITADO
+            ratios = np.full(m, np.inf)
+            ratios[validas] = np.maximum(self.x_B[validas], 0.0) / columna[validas]
+            pivot_row = elegir_fila(ratios, prioridad)
+
+            tableau = self._tableau(A, costos, signo, columnas) if historial.guarda_tableaux else None
+            historial.registrar(self.iterations+1, tableau, pivot_row, pivot_col, self.basis, n,
+                                costos[self.basis] @ self.x_B, self.forma.n_holguras)
+
+            pricing.actualizar(self, pivot_row, pivot_col, columna)
+            self._cambiar_base(A, pivot_row, pivot_col, columna)
+            self.iterations += 1
+        return Estado.LIMITE_ITERACIONES
+
+    def _iterar_dual(self, A, costos, signo, permitidas, historial):
+        """Simplex dual desde una base dual factible; devuelve OPTIMO, INFACTIBLE o LIMITE_ITERACIONES."""
+        n = A.shape[1]
+        while self.iterations < self.max_iterations:
+            pivot_row = int(np.argmin(self.x_B))
+            if self.x_B[pivot_row] >= -1e-9:
+                return Estado.OPTIMO
+
+            y = self.factor.btran(costos[self.basis])
+            z_row = np.maximum(signo * (costos - self._productos(A, y)), 0.0)
+            fila = self.fila_pivote(pivot_row)
+            validas = (fila < -1e-9) & permitidas
+            if not validas.any():
+                return Estado.INFACTIBLE
+            ratios = np.full(len(fila), np.inf)
+            ratios[validas] = z_row[validas] / -fila[validas]
+            pivot_col = elegir_fila(ratios)
+
+            tableau = self._tableau(A, costos, signo, np.flatnonzero(permitidas)) if historial.guarda_tableaux else None
+            historial.registrar(self.iterations+1, tableau, pivot_row, pivot_col, self.basis, n,
+                                costos[self.basis] @ self.x_B, self.forma.n_holguras)
+
+            self._cambiar_base(A, pivot_row, pivot_col, self.factor.ftran(self._columna(A, pivot_col)))
+            self.iterations += 1
+        return Estado.LIMITE_ITERACIONES
+
+    def _arranque_caliente(self, A, warm, costos, signo, permitidas, historial):
+        """Factoriza la base ``warm`` y la optimiza con el simplex primal o dual.
+
+        Devuelve el estado final, o ``None`` si la base no sirve (otro tamaño,
+        singular, artificiales fuera de nivel cero o ni primal ni dual
+        factible) y hay que arrancar en frío.
+        """
+        m = A.shape[0]
+        inicio = self.forma.inicio_artificiales
+        basis = np.array(warm, dtype=int)
+        if basis.shape != (m,) or len(np.unique(basis)) != m or basis.min() < 0 or basis.max() >= self.forma.n_total:
+            return None
+        B = self._matriz_base(A, basis)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                factor = self.factorizacion(B)
+                x_B = factor.ftran(self.b)
+        except (np.linalg.LinAlgError, RuntimeError):
+            return None
+        if not np.isfinite(x_B).all() or np.abs(B @ x_B - self.b).max() > 1e-7 * (1.0 + np.abs(self.b).max()):
+            return None
+        if (np.abs(x_B[basis >= inicio]) > 1e-7).any():
+            return None
+
+        self.basis, self.factor, self.x_B = basis, factor, x_B
+        self._sacar_artificiales(A)
+        permitidas[inicio:] = False
+        if self.x_B.min() >= -1e-9:
+            self.warm_start = "primal"
+            return self._iterar(A, costos, signo, permitidas, historial)
+        z_row = signo * (costos - self._productos(A, self.factor.btran(costos[self.basis])))
+        if z_row[permitidas].min() >= -1e-9:
+            self.warm_start = "dual"
+            return self._iterar_dual(A, costos, signo, permitidas, historial)
+        permitidas[inicio:] = True
+        return None
+
+    def _sacar_artificiales(self, A):
+        """Reemplaza las artificiales que quedaron básicas en nivel cero.
+
+        Si la fila de B^-1 A no tiene elementos fuera de las artificiales, la
+        restricción es redundante y la artificial se queda en la base en cero.
+        """
+        m = A.shape[0]
+        inicio = self.forma.inicio_artificiales
+        for r in np.flatnonzero(self.basis >= inicio):
+            e = np.zeros(m)
+            e[r] = 1.0
+            fila = self._productos(A, self.factor.btran(e))[:inicio]
+            candidatas = np.flatnonzero(np.abs(fila) > 1e-9)
+            if len(candidatas):
+                q = int(candidatas[0])
+                self._cambiar_base(A, r, q, self.factor.ftran(self._columna(A, q)))
+
+    def solve(self, A, b, c, operators, show_iterations=False, history=None, basis=None):
+        A, self.b, c, self.forma = self._preparar(A, b, c, operators)
+        self.A = A
+        m, n = A.shape
+        forma = self.forma
+        self.iterations = 0
+        self.warm_start = None
+        historial = crear_historial(history, show_iterations)
+        permitidas = np.ones(forma.n_total, dtype=bool)
+        # Fase II: costo cero para holguras, excesos y artificiales
+        costos = np.concatenate([c, np.zeros(forma.n_total - n)])
+        signo = self._signo()
+
+        estado = self._arranque_caliente(A, basis, costos, signo, permitidas, historial) if basis is not None else None
+        if estado is None:
+            self.basis = forma.base_inicial.copy()
+            self.factor = self.factorizacion(self._matriz_base(A, self.basis))
+            self.x_B = self.factor.ftran(self.b)
+            if forma.n_artificiales:
+                # Fase I: minimizar la suma de las variables artificiales
+                costos_w = np.zeros(forma.n_total)
+                costos_w[forma.inicio_artificiales:] = 1.0
+                estado = self._iterar(A, costos_w, 1.0, permitidas, historial)
+                if estado != Estado.OPTIMO:
+                    self.status = estado
+                    return None, None, historial
+                if costos_w[self.basis] @ self.x_B > 1e-7 * (1.0 + np.abs(self.b).max()):
+                    self.status = Estado.INFACTIBLE
+                    return None, None, historial
+                self._sacar_artificiales(A)
+                permitidas[forma.inicio_artificiales:] = False
+            estado = self._iterar(A, costos, signo, permitidas, historial)
+        if estado in (Estado.ILIMITADO, Estado.INFACTIBLE):
+            self.status = estado
+            return None, None, historial
+
+        tableau = self._tableau(A, costos, signo, np.flatnonzero(permitidas)) if historial.guarda_tableaux else None
+        historial.registrar(self.iterations+1, tableau, None, None, self.basis, n,
+                            costos[self.basis] @ self.x_B, forma.n_holguras)
+
+        solution = np.zeros(forma.inicio_artificiales + 1)
+        reales = self.basis < forma.inicio_artificiales
+        solution[self.basis[reales]] = self.x_B[reales]
+        optimal_value = float(costos[self.basis] @ self.x_B)
+        self.status = estado
+        return solution.tolist(), optimal_value, historial
@@ -0,0 +1,328 @@
+from typing import List
+import numpy as np
+import time
+from .revisado import SimplexRevisado
+from .kernels import prueba_razon, prueba_razon_dual, pivotear
+from .historial import crear_historial
+from .estado import Estado
+from .estandar import FormaEstandar
+from .modelo import ecuacion_objetivo, restriccion
+from .pricing import crear_pricing
+
+
+class _VistaTableau:
+    """Datos que piden las reglas de pricing, leídos directamente del tableau."""
+
+    def __init__(self, tableau, basis):
+        self.tableau = tableau
+        self.basis = basis
+
+    def n_columnas(self):
+        return self.tableau.shape[1] - 1
+
+    def fila_pivote(self, r):
+        return self.tableau[r, :-1].copy()
+
+    def proyeccion(self, d):
+        return d @ self.tableau[:-1, :-1]
+
+    def normas_columnas(self):
+        return np.einsum("ij,ij->j", self.tableau[:-1, :-1], self.tableau[:-1, :-1])
+
+
+def _mismo_modelo(previo, A, forma):
+    """``True`` si ``previo`` tiene la misma ``A`` y las mismas filas en forma estándar."""
+    A_previo, forma_previa, _, _ = previo
+    return (A_previo.shape == A.shape and forma_previa.operadores == forma.operadores
+            and np.array_equal(forma_previa.signos_fila, forma.signos_fila) and np.array_equal(A_previo, A))
+
+
+# Clase Simplex (maximización o minimización según sense)
+class Simplex:
+    def __init__(self, sense="max"):
+        if sense not in ("max", "min"):
+            raise ValueError("sense debe ser 'max' o 'min'")
+        self.sense = sense
+        self.max_iterations = 1000
+        self.refactor_frequency = 50
+        # Regla de pricing: "dantzig", "bland", "partial", "devex" o "steepest"
+        self.pricing = "dantzig"
+        self.status = None
+        self.iterations = 0
+        self.elapsed = 0.0
+        # Base final de la última corrida óptima (sirve para arrancar en caliente)
+        self.basis = None
+        self.warm_start = None
+        # Con el método tableau, también (A, forma, tableau final, filas) de esa corrida
+        self._final = None
+    
+    def parse_ecuacion_z(self, ecuacion: str) -> List[float]:
+        return ecuacion_objetivo(ecuacion)
+    
+    def parse_restriccion(self, restr: str, n_vars: int):
+        return restriccion(restr, n_vars)
+    
+    def build_tableau(self, A, b, c, operators):
+        return self._build_tableau(A, b, c, FormaEstandar(b, operators, len(c)))
+    
+    def _build_tableau(self, A, b, c, forma):
+        A = A.toarray() if hasattr(A, "toarray") else np.asarray(A, dtype=float)
+        m, n = A.shape[0], len(c)
+        tableau = np.zeros((m + 1, forma.n_total + 1))
+        tableau[:-1, :n] = A * forma.signos_fila[:, None]
+        tableau[forma.filas_extra, n + np.arange(len(forma.filas_extra))] = forma.coef_extra
+        tableau[:-1, -1] = np.asarray(b, dtype=float) * forma.signos_fila
+        # Fila Z: -c para maximizar, c para minimizar (min c·x = -max -c·x)
+        tableau[-1, :n] = self._signo() * np.asarray(c, dtype=float)
+        return tableau
+    
+    def _signo(self):
+        return -1.0 if self.sense == "max" else 1.0
+    
+    def _find_pivot_row(self, tableau, pivot_col, prioridad=None):
+        return prueba_razon(tableau, pivot_col, prioridad)
+    
+    def _pivot(self, tableau, pivot_row, pivot_col):
+        pivotear(tableau, pivot_row, pivot_col)
+    
+    def _set_objective(self, tableau, basis, fila):
+        """Coloca ``fila`` como fila Z y la expresa en términos de la base actual"""
+        tableau[-1] = fila
+        tableau[-1] -= tableau[-1, basis] @ tableau[:-1]
+    
+    def _drop_artificials(self, tableau, basis, forma):
+        """Saca de la base las artificiales en nivel cero y elimina sus columnas.
+        
+        Si una fila no tiene ningún elemento distinto de cero fuera de las
+        artificiales, la restricción es redundante y se elimina. Devuelve
+        también los índices originales de las filas que quedan.
+        """
+        inicio = forma.inicio_artificiales
+        redundantes = []
+        for i in np.flatnonzero(basis >= inicio):
+            candidatas = np.flatnonzero(np.abs(tableau[i, :inicio]) > 1e-9)
+            if len(candidatas):
+                self._pivot(tableau, i, candidatas[0])
+                basis[i] = candidatas[0]
+            else:
+                redundantes.append(i)
+        filas = np.delete(np.arange(len(basis)), redundantes)
+        tableau = np.delete(tableau, redundantes, axis=0)
+        basis = np.delete(basis, redundantes)
+        return np.delete(tableau, np.s_[inicio:-1], axis=1), basis, filas
+    
+    def _extract_solution(self, tableau, basis):
+        solution = np.zeros(tableau.shape[1])
+        filas = np.flatnonzero(basis >= 0)
+        solution[basis[filas]] = tableau[filas, -1]
+        optimal_value = -self._signo() * tableau[-1,-1]
+        return solution.tolist(), optimal_value
+    
+    def reporte(self):
+        """Resumen de la última corrida: regla de pricing, estado, iteraciones y tiempo."""
+        estado = self.status.value if self.status is not None else "-"
+        return f"{crear_pricing(self.pricing).nombre}: {estado}, {self.iterations} iteraciones, {self.elapsed*1e3:.2f} ms"
+    
+    def solve(self, A,b,c,operators, show_iterations=False, method="tableau", history=None, basis=None):
+        """Resuelve el modelo; devuelve ``(solution, optimal_value, history)``.
+        
+        ``basis`` permite un arranque en caliente desde la base final de una
+        corrida anterior (``solver.basis``, o el propio solver). Si sigue siendo
+        factible se continúa con el simplex primal, si solo es dual factible
+        (cambió ``b``) con el simplex dual, y si no con las dos fases desde cero.
+        Pasando el propio solver con el método tableau y la misma ``A``, se
+        reutiliza su tableau final y solo se recalculan ``B⁻¹b`` y la fila Z.
+        """
+        inicio = time.perf_counter()
+        try:
+            return self._solve(A,b,c,operators, show_iterations, method, history,
+                               getattr(basis, "basis", basis), getattr(basis, "_final", None))
+        finally:
+            self.elapsed = time.perf_counter() - inicio
+    
+    def _solve(self, A,b,c,operators, show_iterations, method, history, warm, previo=None):
+        self.basis = None
+        self.warm_start = None
+        self._final = None
+        if method in ("revised", "sparse"):
+            if method == "sparse":
+                from .disperso import SimplexDisperso as motor
+            else:
+                motor = SimplexRevisado
+            revisado = motor(self.sense, self.max_iterations, self.refactor_frequency, self.pricing)
+            resultado = revisado.solve(A,b,c,operators, show_iterations, history, warm)
+            self.status = revisado.status
+            self.iterations = revisado.iterations
+            self.warm_start = revisado.warm_start
+            if self.status == Estado.OPTIMO:
+                self.basis = revisado.basis.copy()
+            return resultado
+        if method != "tableau":
+            raise ValueError(f"Método desconocido: {method}")
+        n_original = len(c)
+        forma = FormaEstandar(b, operators, n_original)
+        # Copia propia de A: se guarda para reconocer el mismo modelo al arrancar en caliente
+        A = A.toarray() if hasattr(A, "toarray") else np.array(A, dtype=float)
+        historial = crear_historial(history, show_iterations)
+        self.iterations = 0
+        
+        caliente = self._warm_start(A, b, c, forma, warm, previo, historial) if warm is not None else None
+        if caliente is not None:
+            tableau, basis, filas, estado = caliente
+        else:
+            tableau = self._build_tableau(A, b, c, forma)
+            basis = forma.base_inicial.copy()
+            filas = np.arange(len(basis))
+            if forma.n_artificiales:
+                # Fase I: minimizar la suma de las variables artificiales
+                fila_z = np.delete(tableau[-1], np.s_[forma.inicio_artificiales:-1])
+                fila_w = np.zeros(tableau.shape[1])
+                fila_w[forma.inicio_artificiales:-1] = 1.0
+                self._set_objective(tableau, basis, fila_w)
+                # W > 0 es infactible; la tolerancia sigue la escala de b
+                tol_w = 1e-7 * (1.0 + np.abs(tableau[:-1, -1]).max())
+                estado = self._iterate(tableau, basis, historial, forma, 1.0)
+                if estado != Estado.OPTIMO:
+                    self.status = estado
+                    return None, None, historial
+                if -tableau[-1,-1] > tol_w:
+                    self.status = Estado.INFACTIBLE
+                    return None, None, historial
+                # Fase II: sin artificiales, con la función objetivo original
+                tableau, basis, filas = self._drop_artificials(tableau, basis, forma)
+                self._set_objective(tableau, basis, fila_z)
+            estado = self._iterate(tableau, basis, historial, forma, self._signo())
+        if estado in (Estado.ILIMITADO, Estado.INFACTIBLE):
+            self.status = estado
+            return None, None, historial
+        
+        # Agregar el tableau final a la historia
+        historial.registrar(self.iterations+1, tableau, None, None, basis, n_original, -self._signo() * tableau[-1,-1], forma.n_holguras)
+        
+        solution, opt_val = self._extract_solution(tableau,basis)
+        self.status = estado
+        if self.status == Estado.OPTIMO:
+            # Base sobre todas las filas: las redundantes conservan su artificial
+            self.basis = forma.base_inicial.copy()
+            self.basis[filas] = basis
+            self._final = (A, forma, tableau, filas)
+        return solution, opt_val, historial
+    
+    def _matriz_base(self, A, forma, basis):
+        """Columnas ``basis`` de ``[A | holguras y excesos | artificiales]`` en forma estándar, sin armar el tableau."""
+        B = np.zeros((len(basis), len(basis)))
+        reales = basis < forma.n_vars
+        B[:, reales] = A[:, basis[reales]] * forma.signos_fila[:, None]
+        extra = np.flatnonzero(~reales)
+        k = basis[extra] - forma.n_vars
+        B[forma.filas_extra[k], extra] = forma.coef_extra[k]
+        return B
+    
+    def _warm_start(self, A, b, c, forma, warm, previo, historial):
+        """Lleva el modelo a la base ``warm`` y lo optimiza con el simplex primal o dual.
+        
+        Si ``previo`` (el ``_final`` del solver que dio la base) es del mismo
+        modelo salvo ``b`` y ``c``, su tableau final ya es ``B⁻¹[A | holguras]``:
+        basta con ``x_B = B⁻¹b`` y rehacer la fila Z. Si cada fila tiene su
+        holgura o exceso, ``B⁻¹`` está en esas columnas; si hay filas ``=``, se
+        resuelve ``B x_B = b``. Sin ``previo`` se arma el tableau y se lleva
+        entero a la base.
+        
+        Devuelve ``(tableau, basis, filas, estado)``, o ``None`` si la base no
+        sirve (otro tamaño, singular, artificiales fuera de nivel cero o ni
+        primal ni dual factible) y hay que arrancar en frío.
+        """
+        m = len(forma.base_inicial)
+        basis = np.array(warm, dtype=int)
+        if basis.shape != (m,) or len(np.unique(basis)) != m or basis.min() < 0 or basis.max() >= forma.n_total:
+            return None
+        reutilizar = previo is not None and _mismo_modelo(previo, A, forma)
+        if reutilizar and forma.n_holguras == m:
+            # Columna k = coef_k · e_(fila_k): en el tableau final vale coef_k · B⁻¹ e_(fila_k)
+            n, filas_extra = forma.n_vars, forma.filas_extra[:m]
+            derecha = np.asarray(b, dtype=float)[filas_extra] * forma.signos_fila[filas_extra]
+            cuerpo = previo[2][:-1, n:n + m] @ (forma.coef_extra[:m] * derecha)
+        else:
+            if reutilizar:
+                B, derecha = self._matriz_base(A, forma, basis), np.asarray(b, dtype=float) * forma.signos_fila
+            else:
+                tableau = self._build_tableau(A, b, c, forma)
+                B, derecha = tableau[:-1, basis], tableau[:-1]
+            try:
+                cuerpo = np.linalg.solve(B, derecha)
+            except np.linalg.LinAlgError:
+                return None
+        x_B = cuerpo if reutilizar else cuerpo[:, -1]
+        if not np.isfinite(cuerpo).all() or (np.abs(x_B[basis >= forma.inicio_artificiales]) > 1e-7).any():
+            return None
+        
+        if reutilizar:
+            _, _, tableau, filas = previo
+            tableau = tableau.copy()
+            tableau[:-1, -1] = x_B[filas]
+            fila_z = np.zeros(tableau.shape[1])
+            fila_z[:forma.n_vars] = self._signo() * np.asarray(c, dtype=float)
+            basis = basis[filas]
+        else:
+            fila_z = np.delete(tableau[-1], np.s_[forma.inicio_artificiales:-1])
+            tableau = np.vstack([cuerpo, tableau[-1:]])
+            tableau, basis, filas = self._drop_artificials(tableau, basis, forma)
+        self._set_objective(tableau, basis, fila_z)
+        if tableau[:-1, -1].min() >= -1e-9:
+            self.warm_start = "primal"
+            return tableau, basis, filas, self._iterate(tableau, basis, historial, forma, self._signo())
+        if tableau[-1, :-1].min() >= -1e-9:
+            self.warm_start = "dual"
+            return tableau, basis, filas, self._iterate_dual(tableau, basis, historial, forma, self._signo())
+        return None
+    
+    def _iterate(self, tableau, basis, historial, forma, signo):
+        """Pivotea hasta el óptimo; devuelve OPTIMO, ILIMITADO o LIMITE_ITERACIONES"""
+        pricing = crear_pricing(self.pricing)
+        vista = _VistaTableau(tableau, basis)
+        pricing.reiniciar(vista)
+        prioridad = basis if pricing.desempate_por_indice else None
+        while self.iterations < self.max_iterations:
+            z_row = tableau[-1,:-1]  # Excluir la columna b para buscar pivote
+            pivot_col = pricing.elegir(z_row)
+            if pivot_col is None:
+                return Estado.OPTIMO
+            pivot_row = self._find_pivot_row(tableau,pivot_col, prioridad)
+            if pivot_row is None:
+                return Estado.ILIMITADO
+            
+            # Registrar la iteración antes del pivoteo
+            historial.registrar(self.iterations+1, tableau, pivot_row, pivot_col, basis, forma.n_vars, -signo * tableau[-1,-1], forma.n_holguras)
+            
+            pricing.actualizar(vista, pivot_row, pivot_col, tableau[:-1, pivot_col].copy())
+            self._pivot(tableau,pivot_row,pivot_col)
+            basis[pivot_row] = pivot_col
+            self.iterations +=1
+        return Estado.LIMITE_ITERACIONES
+    
+    def _iterate_dual(self, tableau, basis, historial, forma, signo):
+        """Simplex dual desde una base dual factible; devuelve OPTIMO, INFACTIBLE o LIMITE_ITERACIONES"""
+        while self.iterations < self.max_iterations:
+            pivot_row = int(np.argmin(tableau[:-1, -1]))
+            if tableau[pivot_row, -1] >= -1e-9:
+                return Estado.OPTIMO
+            pivot_col = prueba_razon_dual(tableau, pivot_row)
+            if pivot_col is None:
+                return Estado.INFACTIBLE
+            
+            historial.registrar(self.iterations+1, tableau, pivot_row, pivot_col, basis, forma.n_vars, -signo * tableau[-1,-1], forma.n_holguras)
+            
+            self._pivot(tableau,pivot_row,pivot_col)
+            basis[pivot_row] = pivot_col
+            self.iterations +=1
+        return Estado.LIMITE_ITERACIONES
+
+
+class SimplexMaximizacion(Simplex):
+    def __init__(self):
+        super().__init__("max")
+
+
+class SimplexMinimizacion(Simplex):
+    def __init__(self):
+        super().__init__("min")
@@ -0,0 +1,84 @@
+"""Arranque en caliente (solve(..., basis=...)): debe dar el mismo resultado que en frío.
+
+    python -m pytest test_arranque.py
+"""
+import numpy as np
+import pytest
+from simplex import Estado, Simplex
+
+METODOS = ("tableau", "revised", "sparse")
+
+
+def modelo_mixto(m, n, rng, operadores=("<=", ">=", "=")):
+    """Restricciones que cumple un punto x0 >= 0; las filas <= acotan la región."""
+    A = rng.uniform(1, 10, (m, n))
+    x0 = rng.uniform(0, 5, n)
+    lhs = A @ x0
+    operators = [operadores[i % len(operadores)] for i in range(m)]
+    holgura = rng.uniform(1, 20, m)
+    b = np.where([op == "<=" for op in operators], lhs + holgura,
+                 np.where([op == ">=" for op in operators], lhs - holgura, lhs))
+    return A, b, rng.uniform(1, 10, n), operators
+
+
+def resolver(A, b, c, operators, method, basis=None):
+    solver = Simplex("max")
+    solution, valor, _ = solver.solve(A, b.tolist(), c.tolist(), operators, method=method, basis=basis)
+    return solver, solution, valor
+
+
+@pytest.mark.parametrize("method", METODOS)
+@pytest.mark.parametrize("operadores", [("<=", ">="), ("<=", ">=", "=")])
+@pytest.mark.parametrize("seed", range(10))
+def test_caliente_igual_a_frio(method, operadores, seed):
+    rng = np.random.default_rng(seed)
+    A, b, c, operators = modelo_mixto(8, 6, rng, operadores)
+    base, _, _ = resolver(A, b, c, operators, method)
+    assert base.status == Estado.OPTIMO
+    cambios = [
+        (b * rng.uniform(0.9, 1.1, len(b)), c),
+        (b, c * rng.uniform(0.5, 1.5, len(c))),
+        (b * rng.uniform(0.5, 1.5, len(b)), c * rng.uniform(0.5, 1.5, len(c))),
+    ]
+    for b2, c2 in cambios:
+        frio, x_frio, z_frio = resolver(A, b2, c2, operators, method)
+        caliente, x_caliente, z_caliente = resolver(A, b2, c2, operators, method, basis=base)
+        assert caliente.status == frio.status
+        if frio.status == Estado.OPTIMO:
+            assert z_caliente == pytest.approx(z_frio, rel=1e-9, abs=1e-9)
+            x = np.array(x_caliente[:A.shape[1]])
+            assert (x >= -1e-9).all()
+            lhs = A @ x
+            for fila, op, bi in zip(lhs, operators, b2):
+                if op == "<=":
+                    assert fila <= bi + 1e-7 * (1 + abs(bi))
+                elif op == ">=":
+                    assert fila >= bi - 1e-7 * (1 + abs(bi))
+                else:
+                    assert fila == pytest.approx(bi, rel=1e-9, abs=1e-7)
+
+
+@pytest.mark.parametrize("method", METODOS)
+def test_caliente_con_b_de_otro_signo(method):
+    # Una fila que cambia de signo se invierte en forma estándar: el tableau guardado ya no sirve
+    A = np.array([[1.0, 1.0], [1.0, -1.0]])
+    c = np.array([3.0, 2.0])
+    base, _, _ = resolver(A, np.array([4.0, 2.0]), c, ["<=", "<="], method)
+    frio, _, z_frio = resolver(A, np.array([4.0, -2.0]), c, ["<=", "<="], method)
+    caliente, _, z_caliente = resolver(A, np.array([4.0, -2.0]), c, ["<=", "<="], method, basis=base)
+    assert caliente.status == frio.status == Estado.OPTIMO
+    assert z_caliente == pytest.approx(z_frio)
+
+
+@pytest.mark.parametrize("method", METODOS)
+def test_base_de_otro_modelo(method):
+    # La misma base sobre otra A se refactoriza (o se descarta) en vez de reutilizar el tableau
+    rng = np.random.default_rng(7)
+    A, b, c, operators = modelo_mixto(6, 5, rng, ("<=", ">="))
+    base, _, _ = resolver(A, b, c, operators, method)
+    A2 = A * rng.uniform(0.8, 1.2, A.shape)
+    frio, _, z_frio = resolver(A2, b, c, operators, method)
+    caliente, _, z_caliente = resolver(A2, b, c, operators, method, basis=base)
+    assert caliente.status == frio.status
+    if frio.status == Estado.OPTIMO:
+        assert z_caliente == pytest.approx(z_frio, rel=1e-9)
@@ -0,0 +1,83 @@
+"""Lectura de restricciones: el camino rápido debe dar lo mismo que el tokenizador.
+
+    python -m pytest test_modelo.py
+"""
+import numpy as np
+import pytest
+from simplex import ErrorSintaxis, leer_modelo
+from simplex.modelo import _densos, _Lector, restriccion
+
+N_VARS = 12
+
+VALIDAS = [
+    "3x1 + 2.5x^2 <= 10",
+    "x1 - x3 >= -4\n",
+    "-x2 + x2 + 2x2 = 7",
+    "1e3x1 + 2E-2x2 <= 5",
+    "3 x1 + .5x2 < 1.",
+    "- x4 +x5 -3x6 > +2",
+    "x1 =< 2", "x1 => 2", "x1 == 2",
+    "x1 <= 3 # comentario",
+    "x1 <= 3   # con n, N y _\n",
+    "2x1 + 3 <= 10",
+    "2x1 <= 10 + x2", "x1 <= 3 x2",
+    "3 + 2x1 - 1 <= 4 - x3",
+    "2 * x1 + x12 >= 1",
+]
+INVALIDAS = [
+    "x1 2 <= 3", "x1 < = 3", "x1 <= 4 2", "x1 + -3x2 <= 1", "x1 + <= 3", "x1 <= 3 <= 4",
+    "x1x2 <= 3", "infx1 <= 3", "1_0x1 <= 3", "x0 <= 1", "x13 <= 1", "x1 + x2",
+    "x1 <= nan", "x1.5 <= 2", "y1 <= 2",
+]
+
+
+def tokenizador(restr, n_vars=N_VARS):
+    """``restriccion`` sin camino rápido."""
+    lector = _Lector()
+    cols, vals, rhs, op = lector.expresion(restr, 1, rapida=False)
+    return _densos(lector, cols, vals, n_vars), rhs, op
+
+
+def leer(funcion, linea):
+    try:
+        return funcion(linea, N_VARS)
+    except ErrorSintaxis:
+        return ErrorSintaxis
+
+
+def linea_aleatoria(rng):
+    """Restricciones casi bien formadas: espacios, signos y operadores que a veces sobran."""
+    terminos = [rng.choice(["", "-", "+", "3", "2.5", "-1e3", "- ", ".5", "1_0", "inf"]) + rng.choice(["", " "])
+                + rng.choice(["x1", "x^2", "x3", "x12", "x0", "x13", "y"]) for _ in range(rng.integers(1, 5))]
+    izquierda = rng.choice([" + ", " - ", "+", " ", " +- ", "+ +"]).join(terminos)
+    return (izquierda + rng.choice([" <= ", ">=", " = ", " < = ", "<", " =< "])
+            + rng.choice(["5", "-2.5", "1e3", " 3 # nota", "4 2", "x1", "3 + 2", "", "- 7"])
+            + rng.choice(["", "\n", "  "]))
+
+
+@pytest.mark.parametrize("linea", VALIDAS)
+def test_restriccion_igual_al_tokenizador(linea):
+    assert restriccion(linea, N_VARS) == tokenizador(linea)
+
+
+@pytest.mark.parametrize("linea", INVALIDAS)
+def test_restriccion_invalida(linea):
+    with pytest.raises(ErrorSintaxis):
+        restriccion(linea, N_VARS)
+
+
+def test_leer_modelo_igual_al_tokenizador():
+    objetivo = "max z = " + " + ".join(f"x{k}" for k in range(1, N_VARS + 1))
+    modelo = leer_modelo([objetivo] + VALIDAS)
+    esperado = [tokenizador(linea) for linea in VALIDAS]
+    np.testing.assert_array_equal(modelo.A.toarray(), [fila for fila, _, _ in esperado])
+    np.testing.assert_array_equal(modelo.b, [rhs for _, rhs, _ in esperado])
+    assert modelo.operadores == [op for _, _, op in esperado]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_restriccion_aleatoria(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(400):
+        linea = linea_aleatoria(rng)
+        assert leer(restriccion, linea) == leer(tokenizador, linea), linea
@@ -0,0 +1,88 @@
+"""Regresión de Simplex(sense): min c·x y -max(-c·x) deben coincidir en los tres motores.
+
+    python -m pytest test_sentido.py
+"""
+import numpy as np
+import pytest
+from simplex import Estado, Simplex
+
+METODOS = ("tableau", "revised", "sparse")
+
+
+def modelo_mixto(m, n, seed):
+    """Restricciones <=, >= y = que cumple un punto x0 >= 0; las <= acotan la región."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(1, 10, (m, n))
+    x0 = rng.uniform(0, 5, n)
+    lhs = A @ x0
+    operators = [("<=", ">=", "=")[i % 3] for i in range(m)]
+    holgura = rng.uniform(1, 20, m)
+    b = np.where([op == "<=" for op in operators], lhs + holgura,
+                 np.where([op == ">=" for op in operators], lhs - holgura, lhs))
+    c = rng.uniform(-10, 10, n)
+    return A.tolist(), b.tolist(), c, operators
+
+
+def modelo_escalado(m, n, seed):
+    """Restricciones <= y >= alternadas con b entre 1e6 y 1e8 que cumple un punto x0 >= 0."""
+    rng = np.random.default_rng(seed)
+    x0 = rng.uniform(0, 1, n)
+    A = rng.uniform(1, 10, (m, n))
+    A *= (10 ** rng.uniform(6, 8, m) / (A @ x0))[:, None]
+    lhs = A @ x0
+    operators = ["<=" if i % 2 == 0 else ">=" for i in range(m)]
+    holgura = rng.uniform(0.01, 0.2, m) * lhs
+    b = np.where([op == "<=" for op in operators], lhs + holgura, lhs - holgura)
+    return A.tolist(), b.tolist(), rng.uniform(-10, 10, n), operators
+
+
+def resolver(sense, A, b, c, operators, method, max_iterations=1000):
+    solver = Simplex(sense)
+    solver.max_iterations = max_iterations
+    solution, valor, _ = solver.solve(A, b, list(c), operators, method=method)
+    assert solver.status == Estado.OPTIMO
+    return np.array(solution[:len(c)]), valor
+
+
+@pytest.mark.parametrize("method", METODOS)
+@pytest.mark.parametrize("seed", range(5))
+def test_min_es_menos_max_del_opuesto(method, seed):
+    A, b, c, operators = modelo_mixto(6, 4, seed)
+    x_min, z_min = resolver("min", A, b, c, operators, method)
+    x_max, z_max = resolver("max", A, b, -c, operators, method)
+    assert z_min == pytest.approx(-z_max, rel=1e-7, abs=1e-7)
+    assert c @ x_min == pytest.approx(z_min, rel=1e-7, abs=1e-7)
+    assert c @ x_max == pytest.approx(z_min, rel=1e-7, abs=1e-7)
+
+
+@pytest.mark.parametrize("method", METODOS)
+def test_igualdades_y_mayor_igual(method):
+    # min x1 + 2x2  s.a.  x1 + x2 = 4,  x1 >= 1,  x1 <= 3  ->  x = (3, 1), z = 5
+    A = [[1, 1], [1, 0], [1, 0]]
+    b = [4, 1, 3]
+    operators = ["=", ">=", "<="]
+    x_min, z_min = resolver("min", A, b, [1, 2], operators, method)
+    x_max, z_max = resolver("max", A, b, [-1, -2], operators, method)
+    assert z_min == pytest.approx(5.0)
+    assert z_max == pytest.approx(-5.0)
+    np.testing.assert_allclose(x_min, [3, 1], atol=1e-9)
+    np.testing.assert_allclose(x_max, [3, 1], atol=1e-9)
+
+
+@pytest.mark.parametrize("method", METODOS)
+def test_infactible_en_ambos_sentidos(method):
+    A, b, operators = [[1, 1], [1, 1]], [2, 5], ["<=", ">="]
+    for sense in ("min", "max"):
+        solver = Simplex(sense)
+        solver.solve(A, b, [1, 1], operators, method=method)
+        assert solver.status == Estado.INFACTIBLE
+
+
+@pytest.mark.parametrize("method", METODOS)
+@pytest.mark.parametrize("seed", range(3))
+def test_b_grande_no_es_infactible(method, seed):
+    # Con b ~ 1e8 el error de redondeo supera cualquier tolerancia absoluta fija
+    A, b, c, operators = modelo_escalado(60, 120, seed)
+    _, z = resolver("max", A, b, c, operators, method, max_iterations=100000)
+    _, z_ref = resolver("max", A, b, c, operators, "revised", max_iterations=100000)
+    assert z == pytest.approx(z_ref, rel=1e-7)
@@ -0,0 +1,62 @@
+"""Benchmark del método de costo mínimo sobre un problema de 2000x2000.
+
+Compara ``transporte.costo_minimo`` (argsort de NumPy) con la versión
+anterior basada en una lista de tuplas ordenada en Python (copiada aquí como
+referencia): tiempo y pico de memoria medido con ``tracemalloc``.
+
+    python benchmark_costo_minimo.py [origenes] [destinos]
+"""
+import sys
+import time
+import tracemalloc
+import numpy as np
+from transporte import costo_minimo
+
+
+# ---------------- Versión anterior (referencia) ----------------
+def costo_minimo_tuplas(costos, ofertas, demandas):
+    num_origenes, num_destinos = len(ofertas), len(demandas)
+    asignaciones = np.zeros((num_origenes, num_destinos))
+    ofertas_restantes = list(ofertas)
+    demandas_restantes = list(demandas)
+
+    celdas = [(i, j, costos[i][j]) for i in range(num_origenes) for j in range(num_destinos)]
+    celdas.sort(key=lambda x: x[2])
+
+    for i, j, _ in celdas:
+        if ofertas_restantes[i] > 0 and demandas_restantes[j] > 0:
+            cantidad = min(ofertas_restantes[i], demandas_restantes[j])
+            asignaciones[i][j] = cantidad
+            ofertas_restantes[i] -= cantidad
+            demandas_restantes[j] -= cantidad
+
+    return asignaciones
+
+
+def medir(metodo, costos, ofertas, demandas):
+    """Tiempo (sin trazar) y pico de memoria (con tracemalloc) de una corrida."""
+    inicio = time.perf_counter()
+    resultado = metodo(costos, ofertas, demandas)
+    tiempo = time.perf_counter() - inicio
+    tracemalloc.start()
+    metodo(costos, ofertas, demandas)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, tiempo, pico
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rng = np.random.default_rng(0)
+    costos = rng.integers(1, 1000, (m, n)).astype(float).tolist()
+    ofertas = rng.integers(1, 100, m).astype(float).tolist()
+    demandas = rng.multinomial(int(sum(ofertas)), np.ones(n) / n).astype(float).tolist()
+
+    viejo, t_viejo, m_viejo = medir(costo_minimo_tuplas, costos, ofertas, demandas)
+    nuevo, t_nuevo, m_nuevo = medir(costo_minimo, costos, ofertas, demandas)
+
+    print(f"Costo mínimo {m}x{n} (mismas asignaciones: {np.array_equal(viejo, nuevo.densa(viejo.shape))})")
+    print(f"  Lista de tuplas : {t_viejo:8.2f} s  pico {m_viejo / 2**20:8.1f} MB")
+    print(f"  NumPy           : {t_nuevo:8.2f} s  pico {m_nuevo / 2**20:8.1f} MB")
+    print(f"  Aceleración     : {t_viejo / t_nuevo:8.1f}x")
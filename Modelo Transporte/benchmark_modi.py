@@ -0,0 +1,31 @@
+"""Tiempo de MODI desde cada solución inicial en un problema balanceado aleatorio.
+
+    python benchmark_modi.py [origenes] [destinos]
+"""
+import sys
+import time
+import numpy as np
+from transporte import costo_minimo, esquina_noroeste, modi
+
+
+def problema_aleatorio(m, n, seed=0):
+    rng = np.random.default_rng(seed)
+    costos = rng.integers(1, 100, (m, n)).astype(float)
+    ofertas = rng.integers(1, 50, m).astype(float)
+    demandas = rng.multinomial(int(ofertas.sum()), np.ones(n) / n).astype(float)
+    return costos, ofertas, demandas
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    costos, ofertas, demandas = problema_aleatorio(m, n)
+
+    print(f"Transporte {m}x{n}")
+    for nombre, inicial in (("Costo mínimo", costo_minimo(costos, ofertas, demandas)),
+                            ("Esquina noroeste", esquina_noroeste(costos, ofertas, demandas))):
+        inicio = time.perf_counter()
+        asignaciones, iteraciones = modi(costos, inicial)
+        tiempo = time.perf_counter() - inicio
+        print(f"  {nombre:17} {inicial.costo_total():12.2f} -> {asignaciones.costo_total():12.2f}"
+              f"  ({iteraciones} iteraciones, {tiempo:.2f} s)")
@@ -0,0 +1,30 @@
+"""Tiempo por etapa del motor de transporte (sin interfaz) para cada solución inicial.
+
+    python benchmark_motor.py [origenes] [destinos]
+"""
+import sys
+import numpy as np
+from transporte import resolver, INICIALIZADORES, NOMBRES
+
+
+def problema_aleatorio(m, n, seed=0):
+    """Problema con algo más de oferta que demanda (el motor agrega un destino ficticio)."""
+    rng = np.random.default_rng(seed)
+    costos = rng.integers(1, 100, (m, n)).astype(float)
+    ofertas = rng.integers(1, 50, m).astype(float)
+    demandas = rng.multinomial(int(ofertas.sum() * 0.95), np.ones(n) / n).astype(float)
+    return costos, ofertas, demandas
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    costos, ofertas, demandas = problema_aleatorio(m, n)
+
+    print(f"Transporte {m}x{n}")
+    print(f"  {'Solución inicial':17} {'balanceo':>10} {'inicial':>10} {'MODI':>10} {'iter.':>7} {'costo':>12}")
+    for nombre in INICIALIZADORES:
+        solucion = resolver(costos, ofertas, demandas, inicial=nombre)
+        tiempos = solucion.tiempos
+        print(f"  {NOMBRES[nombre]:17} {tiempos['balanceo']*1e3:8.1f}ms {tiempos['inicial']*1e3:8.1f}ms "
+              f"{tiempos['optimizacion']*1e3:8.1f}ms {solucion.iteraciones:7d} {solucion.costo_total:12.2f}")
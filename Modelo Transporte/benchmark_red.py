@@ -0,0 +1,35 @@
+"""Tiempo del simplex de redes sobre una red de transporte dispersa aleatoria.
+
+Cada destino tiene ``rutas`` orígenes permitidos elegidos al azar.
+
+    python benchmark_red.py [origenes] [destinos] [rutas]
+"""
+import sys
+import time
+import numpy as np
+from transporte import simplex_red
+
+
+def red_aleatoria(m, n, rutas, seed=0):
+    rng = np.random.default_rng(seed)
+    destinos = np.repeat(np.arange(n), rutas)
+    origenes = rng.integers(0, m, n * rutas)
+    pares = np.unique(origenes * n + destinos)
+    origenes, destinos = pares // n, pares % n
+    costos = rng.integers(1, 1000, len(pares)).astype(float)
+    demandas = rng.integers(1, 20, n).astype(float)
+    ofertas = rng.multinomial(int(demandas.sum()), np.ones(m) / m).astype(float)
+    return origenes, destinos, costos, ofertas, demandas
+
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 4000
+    rutas = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    origenes, destinos, costos, ofertas, demandas = red_aleatoria(m, n, rutas)
+
+    inicio = time.perf_counter()
+    flujos, iteraciones = simplex_red(origenes, destinos, costos, ofertas, demandas)
+    tiempo = time.perf_counter() - inicio
+    print(f"Red {m}x{n} con {len(costos)} arcos: costo {costos @ flujos:.2f}, "
+          f"{iteraciones} iteraciones, {tiempo:.2f} s")
@@ -0,0 +1,122 @@
+import customtkinter as ctk
+import numpy as np
+
+
+class GrillaVirtual(ctk.CTkFrame):
+    """Vista paginada y editable de una ``TablaCostos``.
+
+    Solo existen las entradas de la ventana visible (``filas`` x ``columnas``
+    costos, más sus ofertas y demandas); al cambiar de página se reutilizan
+    con los valores de la tabla. Cada edición se guarda en la tabla al
+    momento y, si es una oferta o demanda, se actualiza solo el total.
+    """
+
+    def __init__(self, master, tabla, filas=10, columnas=8, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.tabla = tabla
+        self.filas = min(filas, tabla.num_origenes)
+        self.columnas = min(columnas, tabla.num_destinos)
+        self.fila0 = 0
+        self.columna0 = 0
+        negrita = ctk.CTkFont(weight="bold")
+
+        # Navegación por páginas
+        barra = ctk.CTkFrame(self, fg_color="transparent")
+        barra.grid(row=0, column=0, columnspan=self.columnas + 2, pady=(0, 5))
+        for texto, filas_mov, columnas_mov in (("▲", -1, 0), ("▼", 1, 0), ("◀", 0, -1), ("▶", 0, 1)):
+            ctk.CTkButton(
+                barra, text=texto, width=36, command=lambda f=filas_mov, c=columnas_mov: self.mover(f, c)
+            ).pack(side="left", padx=2)
+        self.posicion = ctk.CTkLabel(barra, text="")
+        self.posicion.pack(side="left", padx=10)
+
+        # Encabezados
+        ctk.CTkLabel(self, text="Origen/Destino", font=negrita).grid(row=1, column=0, padx=8, pady=8)
+        self.encabezados_columnas = []
+        for c in range(self.columnas):
+            label = ctk.CTkLabel(self, text="", font=negrita)
+            label.grid(row=1, column=c+1, padx=8, pady=8)
+            self.encabezados_columnas.append(label)
+        ctk.CTkLabel(self, text="Oferta", font=negrita).grid(row=1, column=self.columnas+1, padx=8, pady=8)
+        self.encabezados_filas = []
+        for r in range(self.filas):
+            label = ctk.CTkLabel(self, text="", font=negrita)
+            label.grid(row=r+2, column=0, padx=8, pady=5)
+            self.encabezados_filas.append(label)
+        ctk.CTkLabel(self, text="Demanda", font=negrita).grid(row=self.filas+2, column=0, padx=8, pady=5)
+
+        # Entradas de la ventana: la columna ``columnas`` son ofertas y la fila ``filas`` demandas
+        self.entradas = {}
+        for r in range(self.filas + 1):
+            for c in range(self.columnas + 1):
+                if r == self.filas and c == self.columnas:
+                    continue
+                entry = ctk.CTkEntry(self, width=70, justify="center")
+                entry.grid(row=r+2, column=c+1, padx=5, pady=5)
+                entry.bind("<KeyRelease>", lambda e, r=r, c=c: self._editar(r, c))
+                self.entradas[r, c] = entry
+        self.borde = entry.cget("border_color")
+
+        # Cuadro verde (totales)
+        self.total_label = ctk.CTkLabel(
+            self,
+            text="0 / 0",
+            text_color="lightgreen",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            width=80,
+            height=30,
+            corner_radius=8,
+            fg_color="gray25",
+        )
+        self.total_label.grid(row=self.filas+2, column=self.columnas+1, padx=5, pady=5)
+
+        self._refrescar()
+        self.actualizar_totales()
+
+    def _celda(self, r, c):
+        """Celda de la tabla que muestra la entrada ``(r, c)`` de la ventana."""
+        i = self.tabla.num_origenes if r == self.filas else self.fila0 + r
+        j = self.tabla.num_destinos if c == self.columnas else self.columna0 + c
+        return i, j
+
+    def mover(self, filas, columnas):
+        """Desplaza la ventana la cantidad de páginas indicada en cada dirección."""
+        self.fila0 = min(max(self.fila0 + filas * self.filas, 0), self.tabla.num_origenes - self.filas)
+        self.columna0 = min(max(self.columna0 + columnas * self.columnas, 0), self.tabla.num_destinos - self.columnas)
+        self._refrescar()
+
+    def _refrescar(self):
+        for (r, c), entry in self.entradas.items():
+            valor = self.tabla.valor(*self._celda(r, c))
+            entry.delete(0, "end")
+            if not np.isnan(valor):
+                entry.insert(0, f"{valor:g}")
+            entry.configure(border_color=self.borde)
+        for c, label in enumerate(self.encabezados_columnas):
+            label.configure(text=f"D{self.columna0 + c + 1}")
+        for r, label in enumerate(self.encabezados_filas):
+            label.configure(text=f"O{self.fila0 + r + 1}")
+        self.posicion.configure(
+            text=f"Orígenes {self.fila0 + 1}-{self.fila0 + self.filas} de {self.tabla.num_origenes}   "
+                 f"Destinos {self.columna0 + 1}-{self.columna0 + self.columnas} de {self.tabla.num_destinos}"
+        )
+
+    def _editar(self, r, c):
+        entry = self.entradas[r, c]
+        texto = entry.get().strip()
+        try:
+            valor = float(texto) if texto else np.nan
+            entry.configure(border_color=self.borde)
+        except ValueError:
+            # Un valor inválido deja la celda vacía hasta que se corrija
+            valor = np.nan
+            entry.configure(border_color="red")
+        self.tabla.asignar(*self._celda(r, c), valor)
+        if r == self.filas or c == self.columnas:
+            self.actualizar_totales()
+
+    def actualizar_totales(self):
+        color = "lightgreen" if self.tabla.balanceado() else "red"
+        self.total_label.configure(
+            text=f"{self.tabla.total_oferta:.0f} / {self.tabla.total_demanda:.0f}", text_color=color
+        )
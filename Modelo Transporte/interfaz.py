@@ -0,0 +1,232 @@
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from transporte import cargar_problema, resolver, TablaCostos, NOMBRES
+
+# Apariencia y tema
+ctk.set_appearance_mode("dark")  # "light" o "dark"
+ctk.set_default_color_theme("blue")  # temas: "blue", "green", "dark-blue"
+
+# Orígenes que se listan en los resultados
+MAX_FILAS_RESULTADOS = 200
+
+
+class TransporteApp(ctk.CTk):
+    """Ventana del modelo de transporte; ``inicializadores`` son claves de ``transporte.INICIALIZADORES``."""
+
+    def __init__(self, titulo, inicializadores):
+        super().__init__()
+        self.titulo = titulo
+        # Nombre en el menú -> método del motor (el primero es el predeterminado)
+        self.inicializadores = {NOMBRES[nombre]: nombre for nombre in inicializadores}
+
+        self.title(f"🚚 {titulo} - Modelo de Transporte")
+        self.geometry("1000x750")
+        self.minsize(900, 650)
+
+        # Variables principales
+        self.num_origenes = 0
+        self.num_destinos = 0
+        self.ofertas = []
+        self.demandas = []
+        self.costos = []
+        self.tabla = None
+
+        self._build_ui()
+
+    # ================================
+    # INTERFAZ PRINCIPAL
+    # ================================
+    def _build_ui(self):
+        title = ctk.CTkLabel(
+            self,
+            text=self.titulo,
+            font=ctk.CTkFont(size=24, weight="bold"),
+        )
+        title.pack(pady=(20, 10))
+
+        # Frame configuración inicial
+        config_frame = ctk.CTkFrame(self, corner_radius=15)
+        config_frame.pack(padx=20, pady=10, fill="x")
+
+        ctk.CTkLabel(config_frame, text="Número de Orígenes:").grid(
+            row=0, column=0, padx=10, pady=10
+        )
+        self.entry_origenes = ctk.CTkEntry(config_frame, width=100)
+        self.entry_origenes.grid(row=0, column=1, padx=10, pady=10)
+
+        ctk.CTkLabel(config_frame, text="Número de Destinos:").grid(
+            row=0, column=2, padx=10, pady=10
+        )
+        self.entry_destinos = ctk.CTkEntry(config_frame, width=100)
+        self.entry_destinos.grid(row=0, column=3, padx=10, pady=10)
+
+        btn_configurar = ctk.CTkButton(
+            config_frame, text="⚙️ Configurar Matriz", command=self.configurar_matriz
+        )
+        btn_configurar.grid(row=0, column=4, padx=20, pady=10)
+
+        ctk.CTkLabel(config_frame, text="Solución inicial:").grid(
+            row=1, column=0, padx=10, pady=10
+        )
+        self.menu_inicial = ctk.CTkOptionMenu(
+            config_frame, values=list(self.inicializadores), width=160
+        )
+        self.menu_inicial.grid(row=1, column=1, columnspan=2, padx=10, pady=10, sticky="w")
+
+        btn_cargar = ctk.CTkButton(
+            config_frame, text="📂 Cargar archivo", command=self.cargar_archivo
+        )
+        btn_cargar.grid(row=1, column=4, padx=20, pady=10)
+
+        # Contenedor de matriz
+        self.matriz_frame = ctk.CTkScrollableFrame(
+            self, label_text="Matriz de Costos", corner_radius=15
+        )
+        self.matriz_frame.pack(padx=20, pady=10, fill="both", expand=True)
+
+        # Botones acción
+        acciones = ctk.CTkFrame(self, fg_color="transparent")
+        acciones.pack(pady=10)
+
+        self.btn_calcular = ctk.CTkButton(
+            acciones, text="📊 Calcular Solución", command=self.calcular_solucion
+        )
+        self.btn_calcular.pack(side="left", padx=10)
+
+        self.btn_limpiar = ctk.CTkButton(
+            acciones, text="🧹 Limpiar", command=self.limpiar
+        )
+        self.btn_limpiar.pack(side="left", padx=10)
+
+        # Resultados
+        self.resultados_frame = ctk.CTkScrollableFrame(
+            self, label_text="Resultados", corner_radius=15
+        )
+        self.resultados_frame.pack(padx=20, pady=10, fill="both", expand=True)
+
+    # ================================
+    # MATRIZ DE COSTOS
+    # ================================
+    def configurar_matriz(self):
+        try:
+            num_origenes = int(self.entry_origenes.get())
+            num_destinos = int(self.entry_destinos.get())
+        except ValueError:
+            messagebox.showerror("Error", "Debe ingresar números válidos.")
+            return
+
+        if num_origenes <= 0 or num_destinos <= 0:
+            messagebox.showerror("Error", "Los valores deben ser mayores a 0.")
+            return
+
+        self.mostrar_tabla(TablaCostos(num_origenes, num_destinos))
+
+    def mostrar_tabla(self, tabla):
+        """Muestra la tabla en una grilla paginada: solo se crean las entradas visibles."""
+        from grilla import GrillaVirtual  # la grilla se carga con la primera tabla
+
+        for widget in self.matriz_frame.winfo_children():
+            widget.destroy()
+        self.tabla = tabla
+        self.num_origenes, self.num_destinos = tabla.num_origenes, tabla.num_destinos
+        GrillaVirtual(self.matriz_frame, tabla).pack(padx=5, pady=5, anchor="w")
+
+    def cargar_archivo(self):
+        ruta = filedialog.askopenfilename(
+            title="Cargar modelo de transporte",
+            filetypes=[("Modelos (CSV, NumPy)", "*.csv *.txt *.npy *.npz"), ("Todos los archivos", "*.*")],
+        )
+        if not ruta:
+            return
+        try:
+            costos, ofertas, demandas = cargar_problema(ruta)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Error", f"No se pudo cargar el archivo:\n{error}")
+            return
+
+        for entry, valor in ((self.entry_origenes, len(ofertas)), (self.entry_destinos, len(demandas))):
+            entry.delete(0, "end")
+            entry.insert(0, str(valor))
+        self.mostrar_tabla(TablaCostos.desde_arreglos(costos, ofertas, demandas))
+
+    # ================================
+    # LÓGICA DEL MÉTODO
+    # ================================
+    def obtener_datos(self):
+        if self.tabla is None:
+            messagebox.showerror("Error", "Primero configure la matriz o cargue un archivo.")
+            return False
+        try:
+            # Los costos ya traen la fila y columna de reserva para un ficticio
+            self.costos, self.ofertas, self.demandas = self.tabla.datos()
+            return True
+        except ValueError:
+            messagebox.showerror("Error", "Por favor complete todos los valores numéricos correctamente.")
+            return False
+
+    def calcular_solucion(self):
+        if not self.obtener_datos():
+            return
+
+        # Balanceo (origen o destino ficticio), solución inicial y MODI en el motor
+        solucion = resolver(
+            self.costos, self.ofertas, self.demandas, inicial=self.inicializadores[self.menu_inicial.get()]
+        )
+        self.mostrar_resultados(solucion)
+
+    # ================================
+    # RESULTADOS
+    # ================================
+    def mostrar_resultados(self, solucion):
+        for widget in self.resultados_frame.winfo_children():
+            widget.destroy()
+
+        titulo = ctk.CTkLabel(
+            self.resultados_frame,
+            text=f"COSTO TOTAL: {solucion.costo_total:.2f}",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color="lightblue",
+        )
+        titulo.pack(pady=10)
+
+        ctk.CTkLabel(
+            self.resultados_frame,
+            text=f"Solución inicial: {solucion.costo_inicial:.2f}  →  óptimo MODI en {solucion.iteraciones} iteraciones"
+                 f"  ({solucion.tiempo_total * 1e3:.1f} ms)",
+        ).pack(pady=(0, 10))
+
+        # Solo se recorren las celdas de la asignación (ordenadas por origen)
+        reales, ficticias = solucion.separar()
+        filas_txt = [f"O{i+1}:  " for i in range(self.num_origenes)]
+        for i, j, cantidad, _ in reales.celdas():
+            if cantidad > 0:
+                filas_txt[i] += f"D{j+1} → {cantidad:.0f}  |  "
+        for fila_txt in filas_txt[:MAX_FILAS_RESULTADOS]:
+            ctk.CTkLabel(self.resultados_frame, text=fila_txt).pack(pady=3)
+        if len(filas_txt) > MAX_FILAS_RESULTADOS:
+            ctk.CTkLabel(
+                self.resultados_frame, text=f"... y {len(filas_txt) - MAX_FILAS_RESULTADOS} orígenes más"
+            ).pack(pady=3)
+
+        # Asignaciones al ficticio: lo que no se envía o no se recibe
+        if solucion.problema.ficticio is not None:
+            if solucion.problema.ficticio == "destino":
+                encabezado, prefijo = "OFERTA SIN ENVIAR (destino ficticio)", "O"
+            else:
+                encabezado, prefijo = "DEMANDA INSATISFECHA (origen ficticio)", "D"
+            ctk.CTkLabel(
+                self.resultados_frame, text=encabezado, font=ctk.CTkFont(weight="bold"), text_color="orange"
+            ).pack(pady=(10, 3))
+            texto = "  |  ".join(f"{prefijo}{k+1} → {cantidad:.0f}" for k, cantidad in enumerate(ficticias) if cantidad > 0)
+            ctk.CTkLabel(self.resultados_frame, text=texto).pack(pady=3)
+
+    # ================================
+    # LIMPIAR
+    # ================================
+    def limpiar(self):
+        self.tabla = None
+        self.entry_origenes.delete(0, "end")
+        self.entry_destinos.delete(0, "end")
+        for f in [self.matriz_frame, self.resultados_frame]:
+            for w in f.winfo_children():
+                w.destroy()
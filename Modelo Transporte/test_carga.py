@@ -0,0 +1,48 @@
+"""Carga de modelos desde CSV: encabezados y etiquetas de fila opcionales.
+
+    python -m pytest test_carga.py
+"""
+import numpy as np
+import pytest
+from transporte import cargar_problema, guardar_problema
+
+COSTOS = [[1, 2], [3, 4]]
+OFERTAS = [10, 20]
+DEMANDAS = [15, 15]
+
+TABLAS = {
+    "solo números": "1,2,10\n3,4,20\n15,15,30\n",
+    "sin esquina": "1,2,10\n3,4,20\n15,15\n",
+    "encabezado": "D1,D2,Oferta\n1,2,10\n3,4,20\n15,15\n",
+    "etiquetas": "O1,1,2,10\nO2,3,4,20\nDemanda,15,15\n",
+    "encabezado y etiquetas": ",D1,D2,Oferta\nO1,1,2,10\nO2,3,4,20\nDemanda,15,15,\n",
+    "punto y coma": "O1;1;2;10\nO2;3;4;20\nDemanda;15;15\n",
+}
+
+
+def comprobar(costos, ofertas, demandas):
+    np.testing.assert_allclose(costos[:-1, :-1], COSTOS)
+    np.testing.assert_allclose(ofertas, OFERTAS)
+    np.testing.assert_allclose(demandas, DEMANDAS)
+
+
+@pytest.mark.parametrize("nombre", TABLAS)
+def test_tabla_csv(tmp_path, nombre):
+    ruta = tmp_path / "modelo.csv"
+    ruta.write_text(TABLAS[nombre], encoding="utf-8")
+    comprobar(*cargar_problema(str(ruta)))
+
+
+def test_tres_archivos(tmp_path):
+    (tmp_path / "costos.csv").write_text("O1,1,2\nO2,3,4\n", encoding="utf-8")
+    (tmp_path / "ofertas.csv").write_text("Oferta\n10\n20\n", encoding="utf-8")
+    (tmp_path / "demandas.csv").write_text("15,15\n", encoding="utf-8")
+    comprobar(*cargar_problema(str(tmp_path / "costos.csv"), str(tmp_path / "ofertas.csv"),
+                               str(tmp_path / "demandas.csv")))
+
+
+@pytest.mark.parametrize("extension", [".csv", ".npy", ".npz"])
+def test_guardar_y_cargar(tmp_path, extension):
+    ruta = str(tmp_path / f"modelo{extension}")
+    guardar_problema(ruta, COSTOS, OFERTAS, DEMANDAS)
+    comprobar(*cargar_problema(ruta))
@@ -0,0 +1,58 @@
+"""Soluciones iniciales: Vogel debe dar siempre una base de m+n-1 celdas sin ciclos.
+
+    python -m pytest test_metodos.py
+"""
+import numpy as np
+import pytest
+from transporte import vogel
+
+
+def problema_balanceado(m, n, rng):
+    """Costos, ofertas y demandas enteras pequeñas (muchos empates y líneas en cero)."""
+    ofertas = rng.integers(0, 6, m).astype(float)
+    demandas = rng.integers(0, 6, n).astype(float)
+    diferencia = ofertas.sum() - demandas.sum()
+    if diferencia > 0:
+        demandas[rng.integers(n)] += diferencia
+    else:
+        ofertas[rng.integers(m)] -= diferencia
+    return rng.integers(1, 6, (m, n)).astype(float), ofertas, demandas
+
+
+def es_arbol(m, n, origenes, destinos):
+    """m+n-1 celdas que unen los m+n nodos (filas y columnas) sin formar ciclos."""
+    grupo = list(range(m + n))
+
+    def raiz(a):
+        while grupo[a] != a:
+            a = grupo[a]
+        return a
+
+    for i, j in zip(origenes, destinos):
+        ri, rj = raiz(i), raiz(m + j)
+        if ri == rj:
+            return False
+        grupo[ri] = rj
+    return len(origenes) == m + n - 1
+
+
+def test_empate_al_final_deja_celda_en_cero():
+    # La columna 1 y la fila 1 se agotan juntas; la fila 2 cierra la columna 0 y también la 1 (con cero)
+    asignacion = vogel([[1, 5], [5, 1], [3, 3]], [5, 5, 1], [6, 5])
+    assert len(asignacion.cantidades) == 4
+    assert es_arbol(3, 2, asignacion.origenes, asignacion.destinos)
+    np.testing.assert_allclose(asignacion.densa((3, 2)), [[5, 0], [0, 5], [1, 0]])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_vogel_es_base(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(50):
+        m, n = rng.integers(1, 8, 2)
+        costos, ofertas, demandas = problema_balanceado(m, n, rng)
+        asignacion = vogel(costos, ofertas, demandas)
+        assert es_arbol(m, n, asignacion.origenes.tolist(), asignacion.destinos.tolist())
+        densa = asignacion.densa((m, n))
+        np.testing.assert_allclose(densa.sum(axis=1), ofertas)
+        np.testing.assert_allclose(densa.sum(axis=0), demandas)
+        assert (asignacion.cantidades >= 0).all()
@@ -0,0 +1,77 @@
+"""MODI contra scipy.optimize.linprog: desde cualquier solución inicial debe llegar al costo óptimo.
+
+    python -m pytest test_modi.py
+"""
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+from transporte import costo_minimo, esquina_noroeste, modi, vogel
+
+INICIALES = {"costo_minimo": costo_minimo, "esquina_noroeste": esquina_noroeste, "vogel": vogel}
+
+
+def problema_balanceado(m, n, rng, enteros):
+    """Con enteros pequeños hay empates y bases degeneradas; si no, cantidades reales."""
+    if enteros:
+        costos = rng.integers(1, 6, (m, n)).astype(float)
+        ofertas = rng.integers(0, 6, m).astype(float)
+        demandas = rng.multinomial(int(ofertas.sum()), np.ones(n) / n).astype(float)
+    else:
+        costos = rng.uniform(1, 100, (m, n))
+        ofertas = rng.uniform(1, 50, m)
+        demandas = rng.dirichlet(np.ones(n)) * ofertas.sum()
+        demandas[-1] = ofertas.sum() - demandas[:-1].sum()
+    return costos, ofertas, demandas
+
+
+def optimo_linprog(costos, ofertas, demandas):
+    m, n = costos.shape
+    filas = np.kron(np.eye(m), np.ones(n))
+    columnas = np.tile(np.eye(n), m)
+    resultado = linprog(costos.ravel(), A_eq=np.vstack([filas, columnas]),
+                        b_eq=np.concatenate([ofertas, demandas]), method="highs")
+    assert resultado.status == 0
+    return resultado.fun
+
+
+def es_arbol(m, n, origenes, destinos):
+    """m+n-1 celdas que unen los m+n nodos (filas y columnas) sin formar ciclos."""
+    grupo = list(range(m + n))
+
+    def raiz(a):
+        while grupo[a] != a:
+            a = grupo[a]
+        return a
+
+    for i, j in zip(origenes, destinos):
+        ri, rj = raiz(i), raiz(m + j)
+        if ri == rj:
+            return False
+        grupo[ri] = rj
+    return len(origenes) == m + n - 1
+
+
+@pytest.mark.parametrize("inicial", INICIALES)
+@pytest.mark.parametrize("enteros", [True, False])
+@pytest.mark.parametrize("seed", range(5))
+def test_modi_igual_a_linprog(inicial, enteros, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(20):
+        m, n = rng.integers(1, 9, 2)
+        costos, ofertas, demandas = problema_balanceado(m, n, rng, enteros)
+        asignacion, _ = modi(costos, INICIALES[inicial](costos, ofertas, demandas))
+        assert asignacion.costo_total() == pytest.approx(optimo_linprog(costos, ofertas, demandas),
+                                                         rel=1e-9, abs=1e-7)
+        assert es_arbol(m, n, asignacion.origenes.tolist(), asignacion.destinos.tolist())
+        densa = asignacion.densa((m, n))
+        np.testing.assert_allclose(densa.sum(axis=1), ofertas, atol=1e-7)
+        np.testing.assert_allclose(densa.sum(axis=0), demandas, atol=1e-7)
+        assert (asignacion.cantidades >= -1e-9).all()
+
+
+def test_modi_desde_matriz():
+    rng = np.random.default_rng(0)
+    costos, ofertas, demandas = problema_balanceado(6, 5, rng, enteros=False)
+    matriz = esquina_noroeste(costos, ofertas, demandas).densa((6, 5))
+    asignacion, _ = modi(costos, matriz)
+    assert asignacion.costo_total() == pytest.approx(optimo_linprog(costos, ofertas, demandas), rel=1e-9)
@@ -0,0 +1,54 @@
+"""Simplex de redes contra scipy.optimize.linprog sobre listas de arcos aleatorias.
+
+    python -m pytest test_red.py
+"""
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+from scipy.sparse import coo_matrix
+from transporte import simplex_red
+
+
+def red_aleatoria(m, n, rng, densidad):
+    """Al menos un arco al azar (sin repetir) entre m orígenes y n destinos; puede no haber solución factible."""
+    celdas = np.flatnonzero(rng.random(m * n) < densidad)
+    if not len(celdas):
+        celdas = rng.integers(0, m * n, 1)
+    origenes, destinos = np.divmod(celdas, n)
+    costos = rng.integers(1, 20, len(celdas)).astype(float)
+    demandas = rng.integers(0, 8, n).astype(float)
+    ofertas = rng.multinomial(int(demandas.sum()), np.ones(m) / m).astype(float)
+    return origenes, destinos, costos, ofertas, demandas
+
+
+def linprog_red(origenes, destinos, costos, ofertas, demandas):
+    m, n, n_arcos = len(ofertas), len(demandas), len(costos)
+    A_eq = coo_matrix((np.ones(2 * n_arcos), (np.concatenate([origenes, m + destinos]), np.tile(np.arange(n_arcos), 2))),
+                      shape=(m + n, n_arcos))
+    return linprog(costos, A_eq=A_eq, b_eq=np.concatenate([ofertas, demandas]), method="highs")
+
+
+@pytest.mark.parametrize("bloque", [None, 3])
+@pytest.mark.parametrize("densidad", [0.5, 0.8, 1.0])
+@pytest.mark.parametrize("seed", range(5))
+def test_red_igual_a_linprog(bloque, densidad, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(20):
+        m, n = rng.integers(1, 9, 2)
+        origenes, destinos, costos, ofertas, demandas = red_aleatoria(m, n, rng, densidad)
+        esperado = linprog_red(origenes, destinos, costos, ofertas, demandas)
+        assert esperado.status in (0, 2)
+        if esperado.status == 2:
+            with pytest.raises(ValueError, match="factible"):
+                simplex_red(origenes, destinos, costos, ofertas, demandas, bloque=bloque)
+            continue
+        flujos, _ = simplex_red(origenes, destinos, costos, ofertas, demandas, bloque=bloque)
+        assert costos @ flujos == pytest.approx(esperado.fun, rel=1e-9, abs=1e-9)
+        assert (flujos >= -1e-9).all()
+        np.testing.assert_allclose(np.bincount(origenes, flujos, len(ofertas)), ofertas, atol=1e-7)
+        np.testing.assert_allclose(np.bincount(destinos, flujos, len(demandas)), demandas, atol=1e-7)
+
+
+def test_red_desbalanceada():
+    with pytest.raises(ValueError, match="balanceado"):
+        simplex_red([0], [0], [1.0], [5.0], [4.0])
@@ -0,0 +1,16 @@
+"""Motor del modelo de transporte, sin dependencias de interfaz gráfica."""
+
+from .asignacion import Asignacion
+from .metodos import costo_minimo, esquina_noroeste, costo_total, esta_balanceado, vogel
+from .balanceo import balancear, matriz_costos
+from .carga import cargar_problema, guardar_problema
+from .modi import modi
+from .motor import resolver, Solucion, INICIALIZADORES, OPTIMIZADORES, NOMBRES
+from .tabla import TablaCostos
+from .red import simplex_red
+
+__all__ = [
+    "Asignacion", "costo_minimo", "esquina_noroeste", "vogel", "costo_total", "esta_balanceado",
+    "balancear", "matriz_costos", "cargar_problema", "guardar_problema", "modi", "simplex_red",
+    "TablaCostos", "resolver", "Solucion", "INICIALIZADORES", "OPTIMIZADORES", "NOMBRES",
+]
@@ -0,0 +1,129 @@
+"""Árbol generador de la base del simplex de redes (compartido por MODI y ``simplex_red``).
+
+Cada nodo ``w`` distinto de la raíz guarda la arista que lo une a su padre:
+``arco[w]`` (identificador del arco en el problema), ``arriba[w]`` (True si el
+arco va de ``w`` hacia el padre), ``costo[w]`` y ``flujo[w]``. Los potenciales
+cumplen ``costo + pot[origen] - pot[destino] = 0`` en todas las aristas del
+árbol, así que el costo reducido de un arco ``u -> v`` es ``c + pot[u] - pot[v]``.
+
+Al pivotear, el ciclo se obtiene subiendo alternadamente por los padres de
+ambos extremos hasta el ancestro común (sin guardar profundidades) y solo se
+recorre el subárbol que cambia de lugar: sus potenciales se desplazan en el
+costo reducido del arco entrante.
+"""
+import numpy as np
+
+TOL = 1e-9
+
+
+class ArbolExpansion:
+    """Base de un problema de flujo sin capacidades como árbol con raíz en ``raiz``.
+
+    ``aristas`` son tuplas ``(u, v, costo, flujo, arco)`` que deben formar un
+    árbol generador de los ``n_nodos`` nodos.
+    """
+
+    def __init__(self, n_nodos, aristas, raiz=0, tol=TOL):
+        self.raiz = raiz
+        self.tol = tol
+        vecinos = [[] for _ in range(n_nodos)]
+        for u, v, costo, flujo, arco in aristas:
+            # (vecino, True si el arco va del vecino hacia este nodo, ...)
+            vecinos[u].append((v, False, costo, flujo, arco))
+            vecinos[v].append((u, True, costo, flujo, arco))
+
+        self.parent = [-1] * n_nodos
+        self.children = [set() for _ in range(n_nodos)]
+        self.arriba = np.zeros(n_nodos, dtype=bool)
+        self.costo = np.zeros(n_nodos)
+        self.flujo = np.zeros(n_nodos)
+        self.arco = np.full(n_nodos, -1, dtype=np.int64)
+        visitados = [False] * n_nodos
+        visitados[raiz] = True
+        pila = [raiz]
+        while pila:
+            v = pila.pop()
+            for w, arriba, costo, flujo, arco in vecinos[v]:
+                if not visitados[w]:
+                    visitados[w] = True
+                    self.parent[w] = v
+                    self.children[v].add(w)
+                    self.arriba[w], self.costo[w], self.flujo[w], self.arco[w] = arriba, costo, flujo, arco
+                    pila.append(w)
+        if not all(visitados):
+            raise ValueError("Las aristas de la base no conectan todos los nodos")
+        self.recalcular_potenciales()
+
+    def recalcular_potenciales(self):
+        """Potenciales desde cero (pot[raiz] = 0), sin el error acumulado de los pivoteos."""
+        self.pot = np.zeros(len(self.parent))
+        pila = [self.raiz]
+        while pila:
+            v = pila.pop()
+            for w in self.children[v]:
+                self.pot[w] = self.pot[v] - self.costo[w] if self.arriba[w] else self.pot[v] + self.costo[w]
+                pila.append(w)
+
+    def pivotear(self, u, v, costo, reducido, arco):
+        """Hace básico el arco ``u -> v`` y saca el arco bloqueante del ciclo."""
+        parent, children = self.parent, self.children
+        arriba, flujo = self.arriba, self.flujo
+        camino_a, camino_b = [u], [v]
+        pos_a, pos_b = {u: 0}, {v: 0}
+        a, b = u, v
+        while True:
+            if a in pos_b:
+                nodos_a, nodos_b = camino_a[:-1], camino_b[:pos_b[a]]
+                break
+            if b in pos_a:
+                nodos_a, nodos_b = camino_a[:pos_a[b]], camino_b[:-1]
+                break
+            if parent[a] >= 0:
+                a = parent[a]
+                pos_a[a] = len(camino_a)
+                camino_a.append(a)
+            if parent[b] >= 0:
+                b = parent[b]
+                pos_b[b] = len(camino_b)
+                camino_b.append(b)
+
+        # Ciclo de v a u por el árbol: sube desde v y baja hasta u. Los arcos
+        # recorridos en su sentido ganan theta y los recorridos al revés lo pierden.
+        camino = np.array(nodos_b + nodos_a[::-1], dtype=np.int64)
+        adelante = np.concatenate([arriba[nodos_b], ~arriba[nodos_a[::-1]]])
+        atras = np.flatnonzero(~adelante)
+        theta = flujo[camino[atras]].min()
+        # Entre los bloqueantes sale el último recorriendo el ciclo desde el ancestro
+        # común en el sentido del arco entrante (regla de Cunningham, evita ciclar)
+        bloqueantes = atras[flujo[camino[atras]] <= theta + self.tol]
+        orden = np.where(bloqueantes >= len(nodos_b), bloqueantes - len(nodos_b), bloqueantes + len(nodos_a))
+        salida = int(bloqueantes[np.argmax(orden)])
+        theta = flujo[camino[salida]]
+        flujo[camino[adelante]] += theta
+        flujo[camino[~adelante]] -= theta
+        q = int(camino[salida])
+
+        # El extremo del arco entrante que queda del lado de q pasa a ser la raíz de ese subárbol
+        r, s = (u, v) if salida >= len(nodos_b) else (v, u)
+        nuevo = (s, theta, r == u, costo, arco)
+        w = r
+        while True:
+            viejo = (parent[w], flujo[w], arriba[w], self.costo[w], self.arco[w])
+            children[parent[w]].discard(w)
+            parent[w], flujo[w], arriba[w], self.costo[w], self.arco[w] = nuevo
+            children[nuevo[0]].add(w)
+            if w == q:
+                break
+            nuevo = (w, viejo[1], not viejo[2], viejo[3], viejo[4])
+            w = viejo[0]
+
+        # Potenciales: el subárbol que cuelga de r se desplaza en el costo reducido
+        nodos = [r]
+        for x in nodos:
+            nodos.extend(children[x])
+        self.pot[nodos] += -reducido if r == u else reducido
+
+    def aristas(self):
+        """Identificadores y flujos de las aristas del árbol."""
+        nodos = np.flatnonzero(self.arco >= 0)
+        return self.arco[nodos], np.maximum(self.flujo[nodos], 0.0)
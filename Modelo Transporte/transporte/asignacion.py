@@ -0,0 +1,50 @@
+"""Resultado disperso (formato COO) de una solución del modelo de transporte.
+
+Una solución básica tiene a lo sumo m+n-1 celdas con asignación, así que en
+lugar de una matriz m x n casi toda en cero se guardan cuatro vectores
+paralelos: origen, destino, cantidad y costo unitario de cada celda.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+
+class Asignacion(namedtuple("Asignacion", "origenes destinos cantidades costos")):
+    """Celdas ``(origenes[k], destinos[k])`` con ``cantidades[k]`` unidades a ``costos[k]`` c/u.
+
+    Una base puede incluir celdas con cantidad cero (solución degenerada).
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def crear(cls, costos, origenes, destinos, cantidades):
+        """Asignación sobre las celdas dadas, tomando sus costos de la matriz ``costos``."""
+        origenes = np.asarray(origenes, dtype=np.int64)
+        destinos = np.asarray(destinos, dtype=np.int64)
+        costos = np.asarray(costos, dtype=float)
+        return cls(origenes, destinos, np.asarray(cantidades, dtype=float), costos[origenes, destinos])
+
+    @classmethod
+    def desde_matriz(cls, costos, asignaciones, tol=0.0):
+        """Celdas de una matriz de asignaciones con cantidad mayor que ``tol``, por filas."""
+        asignaciones = np.asarray(asignaciones, dtype=float)
+        origenes, destinos = np.nonzero(asignaciones > tol)
+        return cls.crear(costos, origenes, destinos, asignaciones[origenes, destinos])
+
+    def costo_total(self):
+        return float(np.dot(self.cantidades, self.costos))
+
+    def densa(self, forma):
+        """Matriz de asignaciones de tamaño ``forma``."""
+        asignaciones = np.zeros(forma)
+        asignaciones[self.origenes, self.destinos] = self.cantidades
+        return asignaciones
+
+    def filtrar(self, mascara):
+        """Subconjunto de celdas según una máscara (o índices) sobre las celdas."""
+        return Asignacion(*(campo[mascara] for campo in self))
+
+    def celdas(self):
+        """Itera ``(origen, destino, cantidad, costo)`` como valores de Python."""
+        return zip(*(campo.tolist() for campo in self))
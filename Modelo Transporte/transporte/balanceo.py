@@ -0,0 +1,71 @@
+"""Balanceo automático del modelo de transporte con un origen o destino ficticio.
+
+Los costos se guardan con una fila y una columna de reserva (``matriz_costos``)
+para que el problema balanceado sea solo una vista de esa matriz: el ficticio
+ocupa la fila o la columna de reserva y los costos no se copian.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+
+class ProblemaBalanceado(namedtuple("ProblemaBalanceado", "costos ofertas demandas ficticio")):
+    """Problema balanceado; ``ficticio`` es ``"destino"``, ``"origen"`` o ``None``."""
+
+    __slots__ = ()
+
+    def separar(self, asignacion):
+        """Divide una ``Asignacion`` en ``(reales, ficticias)``.
+
+        ``reales`` son las celdas entre orígenes y destinos reales. Con destino
+        ficticio, ``ficticias`` es la oferta sin enviar de cada origen; con
+        origen ficticio, la demanda insatisfecha de cada destino; sin
+        ficticio es ``None``.
+        """
+        if self.ficticio == "destino":
+            reales = len(self.ofertas)
+            otro, linea = asignacion.origenes, asignacion.destinos == len(self.demandas) - 1
+        elif self.ficticio == "origen":
+            reales = len(self.demandas)
+            otro, linea = asignacion.destinos, asignacion.origenes == len(self.ofertas) - 1
+        else:
+            return asignacion, None
+        ficticias = np.bincount(otro[linea], asignacion.cantidades[linea], minlength=reales)
+        return asignacion.filtrar(~linea), ficticias
+
+
+def matriz_costos(costos):
+    """Copia los costos (m x n) en una matriz (m+1) x (n+1) con fila y columna de reserva."""
+    costos = np.asarray(costos, dtype=float)
+    m, n = costos.shape
+    reservada = np.zeros((m + 1, n + 1))
+    reservada[:m, :n] = costos
+    return reservada
+
+
+def balancear(costos, ofertas, demandas, penalizaciones=None, tol=1e-6):
+    """Agrega un destino ficticio si sobra oferta, o un origen ficticio si sobra demanda.
+
+    ``costos`` debería venir de ``matriz_costos``: así el resultado es una vista
+    y las penalizaciones se escriben en la fila o columna de reserva. Con forma
+    m x n se reserva una copia. ``penalizaciones`` es el costo por unidad de
+    cada ruta al ficticio (una por origen para un destino ficticio, una por
+    destino para un origen ficticio); por defecto 0.
+    """
+    ofertas = np.asarray(ofertas, dtype=float)
+    demandas = np.asarray(demandas, dtype=float)
+    m, n = len(ofertas), len(demandas)
+    costos = np.asarray(costos, dtype=float)
+    if costos.shape == (m, n):
+        costos = matriz_costos(costos)
+    elif costos.shape != (m + 1, n + 1):
+        raise ValueError(f"La matriz de costos debe ser {m}x{n} o {m+1}x{n+1}")
+
+    diferencia = ofertas.sum() - demandas.sum()
+    if diferencia > tol:
+        costos[:m, n] = 0.0 if penalizaciones is None else penalizaciones
+        return ProblemaBalanceado(costos[:m, :], ofertas, np.append(demandas, diferencia), "destino")
+    if diferencia < -tol:
+        costos[m, :n] = 0.0 if penalizaciones is None else penalizaciones
+        return ProblemaBalanceado(costos[:, :n], np.append(ofertas, -diferencia), demandas, "origen")
+    return ProblemaBalanceado(costos[:m, :n], ofertas, demandas, None)
@@ -0,0 +1,126 @@
+"""Carga de modelos de transporte desde archivos CSV o NumPy, sin pasar por la interfaz.
+
+Formatos aceptados:
+
+- Un solo archivo ``.csv``/``.txt`` o ``.npy`` con la misma disposición que la
+  tabla de la interfaz: ``m+1`` filas por ``n+1`` columnas, los costos en
+  ``[:m, :n]``, las ofertas en la última columna y las demandas en la última
+  fila (la esquina se ignora y en un CSV puede quedar vacía). Un CSV puede
+  traer encabezados (``D1, D2, ..., Oferta``) y etiquetas de fila (``O1``,
+  ``Demanda``); se detectan y se saltan.
+- Un ``.npz`` con los arreglos ``costos``, ``ofertas`` y ``demandas``.
+- Tres archivos separados (costos, ofertas, demandas) en cualquiera de los
+  formatos anteriores.
+
+Los ``.npy`` se abren como memoria mapeada (copia en escritura): en la
+disposición de un solo archivo esa matriz ya es la de ``matriz_costos`` y el
+balanceo escribe el ficticio sobre ella sin copiar los costos a memoria.
+"""
+import csv
+import os
+
+import numpy as np
+
+from .balanceo import matriz_costos
+
+
+def _es_numero(texto):
+    try:
+        float(texto)
+        return True
+    except ValueError:
+        return False
+
+
+def _leer_csv(ruta):
+    """Matriz de un CSV, saltando encabezado y etiquetas de fila; la última fila puede ser más corta."""
+    with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+        lineas = [linea for linea in archivo.read().splitlines() if linea.strip()]
+    if not lineas:
+        raise ValueError(f"{os.path.basename(ruta)}: el archivo está vacío")
+    try:
+        separador = csv.Sniffer().sniff(lineas[0], delimiters=",;\t").delimiter
+    except csv.Error:
+        separador = ","
+    # Etiquetas de fila: la segunda línea siempre es de datos, haya encabezado o no
+    referencia = lineas[1] if len(lineas) > 1 else lineas[0]
+    inicio = 0 if _es_numero(referencia.split(separador)[0]) else 1
+    # Encabezado: la primera línea tiene texto fuera de la columna de etiquetas
+    if not all(_es_numero(campo) for campo in lineas[0].split(separador)[inicio:] if campo.strip()):
+        lineas = lineas[1:]
+    filas = [linea.split(separador)[inicio:] for linea in lineas]
+
+    # Fila de demandas sin la esquina (o con la esquina vacía): completarla con 0
+    ancho = len(filas[0])
+    if len(filas) > 1 and len(filas[-1]) == ancho - 1:
+        filas[-1].append("0")
+    if len(filas) > 1 and not filas[-1][-1].strip():
+        filas[-1][-1] = "0"
+    try:
+        return np.array([[float(campo) for campo in fila] for fila in filas])
+    except ValueError as error:
+        raise ValueError(f"{os.path.basename(ruta)}: {error}") from None
+
+
+def _leer(ruta):
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".npy":
+        return np.load(ruta, mmap_mode="c")
+    if extension in (".csv", ".txt"):
+        return _leer_csv(ruta)
+    raise ValueError(f"Formato no soportado: {extension or ruta}")
+
+
+def cargar_problema(ruta, ofertas=None, demandas=None):
+    """Lee un modelo de transporte y devuelve ``(costos, ofertas, demandas)``.
+
+    Con una sola ruta se usa la disposición de la tabla (o un ``.npz``); con
+    ``ofertas`` y ``demandas`` se leen tres archivos separados. ``costos``
+    viene siempre en la disposición de ``matriz_costos`` ((m+1) x (n+1), con
+    fila y columna de reserva), lista para ``balancear``; las ofertas y
+    demandas son copias, así el balanceo puede escribir en la reserva.
+    """
+    if (ofertas is None) != (demandas is None):
+        raise ValueError("Indique archivos de ofertas y de demandas, o ninguno")
+    if ofertas is not None:
+        costos = _leer(ruta)
+        ofertas, demandas = np.ravel(_leer(ofertas)), np.ravel(_leer(demandas))
+        costos = matriz_costos(costos)
+    elif os.path.splitext(ruta)[1].lower() == ".npz":
+        with np.load(ruta) as datos:
+            faltan = {"costos", "ofertas", "demandas"} - set(datos.files)
+            if faltan:
+                raise ValueError(f"Faltan arreglos en {os.path.basename(ruta)}: {', '.join(sorted(faltan))}")
+            costos = matriz_costos(datos["costos"])
+            ofertas, demandas = np.ravel(datos["ofertas"]), np.ravel(datos["demandas"])
+    else:
+        costos = _leer(ruta)
+        if costos.ndim != 2 or min(costos.shape) < 2:
+            raise ValueError("Se esperaba una tabla de al menos 2x2: costos, ofertas (última columna) y demandas (última fila)")
+        ofertas, demandas = costos[:-1, -1], costos[-1, :-1]
+
+    ofertas = np.array(ofertas, dtype=float)
+    demandas = np.array(demandas, dtype=float)
+    if costos.shape != (len(ofertas) + 1, len(demandas) + 1):
+        raise ValueError(f"Los costos son {costos.shape[0] - 1}x{costos.shape[1] - 1} "
+                         f"pero hay {len(ofertas)} ofertas y {len(demandas)} demandas")
+    return costos, ofertas, demandas
+
+
+def guardar_problema(ruta, costos, ofertas, demandas):
+    """Guarda un modelo en un ``.npz`` o en la disposición de tabla (``.npy``/``.csv``)."""
+    costos = np.asarray(costos, dtype=float)
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".npz":
+        np.savez(ruta, costos=costos, ofertas=ofertas, demandas=demandas)
+        return
+    tabla = matriz_costos(costos)
+    tabla[:-1, -1] = ofertas
+    tabla[-1, :-1] = demandas
+    tabla[-1, -1] = np.sum(ofertas)
+    if extension == ".npy":
+        np.save(ruta, tabla)
+    elif extension in (".csv", ".txt"):
+        np.savetxt(ruta, tabla, delimiter=",", fmt="%.10g")
+    else:
+        raise ValueError(f"Formato no soportado: {extension or ruta}")
@@ -0,0 +1,189 @@
+"""Soluciones iniciales del modelo de transporte."""
+import heapq
+
+import numpy as np
+
+from .asignacion import Asignacion
+
+
+def esta_balanceado(ofertas, demandas, tol=1e-6):
+    return abs(sum(ofertas) - sum(demandas)) <= tol
+
+
+def costo_total(costos, asignaciones):
+    if isinstance(asignaciones, Asignacion):
+        return asignaciones.costo_total()
+    return float(np.sum(np.asarray(asignaciones) * np.asarray(costos, dtype=float)))
+
+
+def _columnas(celdas):
+    """Listas de orígenes, destinos y cantidades a partir de tuplas ``(i, j, cantidad)``."""
+    if not celdas:
+        return [], [], []
+    return tuple(map(list, zip(*celdas)))
+
+
+def costo_minimo(costos, ofertas, demandas):
+    """Método de costo mínimo: asigna primero a las celdas más baratas.
+
+    Las celdas se recorren en el orden de ``argsort`` (estable, así los empates
+    se resuelven igual que antes: por fila y luego por columna) en bloques de
+    tamaño creciente. En cada bloque se descartan de una vez las celdas cuya
+    fila o columna ya se agotó, y se termina apenas se agota toda la oferta o
+    toda la demanda. Devuelve una ``Asignacion`` con las celdas asignadas.
+    """
+    costos = np.asarray(costos, dtype=float)
+    num_origenes, num_destinos = costos.shape
+    celdas = []
+    ofertas_restantes = np.array(ofertas, dtype=float)
+    demandas_restantes = np.array(demandas, dtype=float)
+    filas_activas = ofertas_restantes > 0
+    columnas_activas = demandas_restantes > 0
+    pendientes_filas, pendientes_columnas = int(filas_activas.sum()), int(columnas_activas.sum())
+
+    orden = np.argsort(costos, axis=None, kind="stable")
+    inicio, tamano = 0, num_origenes + num_destinos
+    while inicio < len(orden) and pendientes_filas and pendientes_columnas:
+        bloque = orden[inicio:inicio + tamano]
+        inicio += len(bloque)
+        tamano *= 2
+        filas, columnas = np.divmod(bloque, num_destinos)
+        vivas = filas_activas[filas] & columnas_activas[columnas]
+        for i, j in zip(filas[vivas].tolist(), columnas[vivas].tolist()):
+            if not (filas_activas[i] and columnas_activas[j]):
+                continue
+            cantidad = min(ofertas_restantes[i], demandas_restantes[j])
+            celdas.append((i, j, cantidad))
+            ofertas_restantes[i] -= cantidad
+            demandas_restantes[j] -= cantidad
+            if ofertas_restantes[i] <= 0:
+                filas_activas[i] = False
+                pendientes_filas -= 1
+            if demandas_restantes[j] <= 0:
+                columnas_activas[j] = False
+                pendientes_columnas -= 1
+            if not (pendientes_filas and pendientes_columnas):
+                break
+
+    return Asignacion.crear(costos, *_columnas(celdas))
+
+
+def esquina_noroeste(costos, ofertas, demandas, tol=1e-9):
+    """Método de la esquina noroeste como ``Asignacion`` con sus celdas básicas.
+
+    El recorrido cambia de fila cada vez que la oferta acumulada supera una
+    frontera de ``cumsum(ofertas)`` y de columna con las de
+    ``cumsum(demandas)``; ordenar esas m+n-2 fronteras da las m+n-1 celdas
+    del camino en O((m+n) log(m+n)), sin recorrer la matriz. La cantidad de
+    cada celda es la distancia entre fronteras consecutivas, y las menores
+    que ``tol`` (relativa a la oferta total) se dejan en cero: si una fila y
+    una columna se agotan juntas se avanza primero la fila y la celda
+    siguiente queda básica con cantidad cero. ``costos`` no influye en el
+    recorrido; solo se copia el costo de cada celda al resultado.
+    """
+    ofertas = np.asarray(ofertas, dtype=float)
+    demandas = np.asarray(demandas, dtype=float)
+    num_origenes, num_destinos = len(ofertas), len(demandas)
+    if not (num_origenes and num_destinos):
+        return Asignacion.crear(costos, [], [], [])
+    fronteras_filas = np.cumsum(ofertas)
+    fronteras_columnas = np.cumsum(demandas)
+    total = fronteras_filas[-1]
+
+    # Fronteras interiores; con empates (orden estable) primero las de filas
+    fronteras = np.concatenate([fronteras_filas[:-1], fronteras_columnas[:-1]])
+    orden = np.argsort(fronteras, kind="stable")
+    cambia_fila = orden < num_origenes - 1
+    filas = np.concatenate([[0], np.cumsum(cambia_fila)])
+    columnas = np.concatenate([[0], np.cumsum(~cambia_fila)])
+
+    cantidades = np.diff(np.concatenate([[0.0], fronteras[orden], [total]]))
+    cantidades[cantidades <= tol * max(1.0, abs(total))] = 0.0
+    return Asignacion.crear(costos, filas, columnas, cantidades)
+
+
+def vogel(costos, ofertas, demandas):
+    """Método de aproximación de Vogel (VAM).
+
+    Cada fila y cada columna guarda sus celdas ordenadas por costo con dos
+    punteros a las dos más baratas que siguen activas; como las filas y
+    columnas solo se agotan, los punteros solo avanzan. Las penalizaciones
+    están en un heap con invalidación perezosa y, al agotarse una fila (o
+    columna), solo se recalculan las columnas (o filas) que la tenían entre
+    sus dos celdas más baratas: O(log n) por penalización que cambia.
+
+    Empates: mayor penalización, luego menor costo y luego filas antes que
+    columnas. Cada asignación descarta una sola línea: si una fila y una
+    columna se agotan juntas se descarta la fila, salvo que sea la última; en
+    ese caso se descarta la columna y la fila sigue activa con cero para las
+    columnas que quedaron en cero. Las líneas que empiezan en cero también
+    entran. Así la solución tiene siempre m+n-1 celdas básicas (algunas con
+    cantidad cero si es degenerada).
+    """
+    costos = np.asarray(costos, dtype=float)
+    num_origenes, num_destinos = costos.shape
+    celdas = []
+    # Índice 0: orígenes (filas), 1: destinos (columnas)
+    restantes = [np.array(ofertas, dtype=float), np.array(demandas, dtype=float)]
+    activas = [np.ones(num_origenes, dtype=bool), np.ones(num_destinos, dtype=bool)]
+    pendientes = [num_origenes, num_destinos]
+    tablas = [costos, costos.T]
+    orden = [np.argsort(costos, axis=1, kind="stable").tolist(), np.argsort(costos.T, axis=1, kind="stable").tolist()]
+    primera = [[0] * num_origenes, [0] * num_destinos]
+    segunda = [[1] * num_origenes, [1] * num_destinos]
+    version = [[0] * num_origenes, [0] * num_destinos]
+    # observadores[lado][k]: líneas del otro lado que tienen a k entre sus dos más baratas
+    observadores = [[set() for _ in range(num_origenes)], [set() for _ in range(num_destinos)]]
+    penalizaciones = []
+
+    def actualizar(lado, k):
+        """Avanza los punteros de la línea k y publica su penalización."""
+        otro, celdas, vivas = 1 - lado, orden[lado][k], activas[1 - lado]
+        a = primera[lado][k]
+        while a < len(celdas) and not vivas[celdas[a]]:
+            a += 1
+        b = max(segunda[lado][k], a + 1)
+        while b < len(celdas) and not vivas[celdas[b]]:
+            b += 1
+        primera[lado][k], segunda[lado][k] = a, b
+        version[lado][k] += 1
+        if a == len(celdas):
+            return
+        minimo = tablas[lado][k, celdas[a]]
+        observadores[otro][celdas[a]].add(k)
+        if b < len(celdas):
+            penalizacion = tablas[lado][k, celdas[b]] - minimo
+            observadores[otro][celdas[b]].add(k)
+        else:
+            penalizacion = minimo
+        heapq.heappush(penalizaciones, (-penalizacion, minimo, lado, k, version[lado][k]))
+
+    def agotar(lado, k):
+        activas[lado][k] = False
+        pendientes[lado] -= 1
+        otro = 1 - lado
+        for x in observadores[lado][k]:
+            if activas[otro][x]:
+                actualizar(otro, x)
+        observadores[lado][k] = set()
+
+    for lado in (0, 1):
+        for k in np.flatnonzero(activas[lado]).tolist():
+            actualizar(lado, k)
+
+    while penalizaciones and pendientes[0] and pendientes[1]:
+        _, _, lado, k, ver = heapq.heappop(penalizaciones)
+        if not activas[lado][k] or ver != version[lado][k]:
+            continue
+        x = orden[lado][k][primera[lado][k]]
+        i, j = (k, x) if lado == 0 else (x, k)
+        cantidad = min(restantes[0][i], restantes[1][j])
+        celdas.append((i, j, cantidad))
+        restantes[0][i] -= cantidad
+        restantes[1][j] -= cantidad
+        if restantes[0][i] <= 0 and (restantes[1][j] > 0 or pendientes[0] > 1):
+            agotar(0, i)
+        else:
+            agotar(1, j)
+
+    return Asignacion.crear(costos, *_columnas(celdas))
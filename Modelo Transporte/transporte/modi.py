@@ -0,0 +1,98 @@
+"""Método MODI (potenciales u-v): lleva una solución inicial del transporte al óptimo.
+
+La base se guarda como un árbol generador (``ArbolExpansion``) sobre los
+orígenes (nodos ``i``) y los destinos (nodos ``m + j``); cada arista es una
+celda básica. En cada iteración:
+
+- se busca una celda con costo reducido ``c_ij - u_i - v_j`` negativo,
+  revisando los orígenes por bloques (pricing parcial);
+- el ciclo que forma con el árbol se obtiene subiendo por los padres hasta el
+  ancestro común, en O(largo del ciclo);
+- al cambiar de base solo se recorre el subárbol que se cuelga de la celda
+  entrante: sus potenciales se desplazan en el costo reducido y el resto del
+  árbol no se toca.
+"""
+import numpy as np
+
+from .arbol import ArbolExpansion, TOL
+from .asignacion import Asignacion
+
+
+def _celdas_base(costos, asignacion):
+    """Celdas de la asignación más celdas en cero (las más baratas) hasta tener m+n-1 que no formen ciclo."""
+    m, n = costos.shape
+    grupo = list(range(m + n))
+
+    def raiz(a):
+        while grupo[a] != a:
+            grupo[a] = grupo[grupo[a]]
+            a = grupo[a]
+        return a
+
+    celdas = []
+    for i, j, cantidad, _ in asignacion.celdas():
+        ri, rj = raiz(i), raiz(m + j)
+        if ri == rj:
+            raise ValueError("La solución inicial no es básica: sus celdas forman un ciclo")
+        grupo[ri] = rj
+        celdas.append((i, j, cantidad))
+
+    # Solución degenerada: unir las componentes con la celda más barata entre ellas
+    while len(celdas) < m + n - 1:
+        componente = np.array([raiz(a) for a in range(m + n)])
+        distintas = componente[:m, None] != componente[None, m:]
+        i, j = np.unravel_index(np.argmin(np.where(distintas, costos, np.inf)), (m, n))
+        grupo[raiz(int(i))] = raiz(m + int(j))
+        celdas.append((int(i), int(j), 0.0))
+    return celdas
+
+
+def modi(costos, asignaciones, max_iterations=None, bloque=None, tol=TOL):
+    """Mejora una solución básica factible de un problema balanceado hasta el óptimo.
+
+    ``asignaciones`` es la ``Asignacion`` de ``costo_minimo``, ``vogel`` o
+    ``esquina_noroeste`` (también se acepta una matriz m x n); si tiene menos
+    de m+n-1 celdas se completa con celdas en cero.
+    ``bloque`` es la cantidad de orígenes cuyos costos reducidos se revisan por
+    vez (por defecto, unas 8k celdas). Devuelve ``(asignacion, iteraciones)``
+    con las m+n-1 celdas básicas ordenadas por origen y destino.
+    """
+    costos = np.asarray(costos, dtype=float)
+    m, n = costos.shape
+    # Cada celda (i, j) es el arco i -> m + j; con u_i = -pot[i] y v_j = pot[m + j]
+    if not isinstance(asignaciones, Asignacion):
+        asignaciones = Asignacion.desde_matriz(costos, asignaciones, tol)
+    aristas = [(i, m + j, costos[i, j], cantidad, i * n + j)
+               for i, j, cantidad in _celdas_base(costos, asignaciones)]
+    arbol = ArbolExpansion(m + n, aristas, raiz=0, tol=tol)
+    filas_bloque = min(m, bloque or max(1, 8192 // n))
+    inicio = 0
+
+    def elegir():
+        nonlocal inicio
+        for k in range(-(-m // filas_bloque)):
+            filas = (inicio + k * filas_bloque + np.arange(filas_bloque)) % m
+            reducidos = costos[filas] + arbol.pot[filas, None] - arbol.pot[None, m:]
+            f, j = np.unravel_index(np.argmin(reducidos), reducidos.shape)
+            if reducidos[f, j] < -tol:
+                inicio = int(filas[-1] + 1) % m
+                return int(filas[f]), int(j), reducidos[f, j]
+        return None
+
+    iteraciones = 0
+    while max_iterations is None or iteraciones < max_iterations:
+        entrante = elegir()
+        if entrante is None:
+            # Confirmar el óptimo con potenciales sin error acumulado
+            arbol.recalcular_potenciales()
+            entrante = elegir()
+            if entrante is None:
+                break
+        i, j, reducido = entrante
+        arbol.pivotear(i, m + j, costos[i, j], reducido, i * n + j)
+        iteraciones += 1
+
+    celdas, flujos = arbol.aristas()
+    orden = np.argsort(celdas)
+    origenes, destinos = np.divmod(celdas[orden], n)
+    return Asignacion.crear(costos, origenes, destinos, flujos[orden]), iteraciones
@@ -0,0 +1,94 @@
+"""Flujo completo de un modelo de transporte, común a todas las interfaces.
+
+``resolver`` balancea el problema, construye la solución inicial con el
+método elegido y la optimiza, midiendo cada etapa. Los métodos se eligen por
+nombre en ``INICIALIZADORES`` y ``OPTIMIZADORES``; para agregar uno basta con
+registrarlo en el diccionario con la misma firma.
+"""
+import time
+from collections import namedtuple
+
+from .balanceo import balancear
+from .metodos import costo_minimo, esquina_noroeste, vogel
+from .modi import modi
+
+# nombre -> función(costos, ofertas, demandas) que devuelve una Asignacion
+INICIALIZADORES = {
+    "costo_minimo": costo_minimo,
+    "esquina_noroeste": esquina_noroeste,
+    "vogel": vogel,
+}
+
+# nombre -> función(costos, asignacion) que devuelve (asignacion, iteraciones)
+OPTIMIZADORES = {
+    "modi": modi,
+}
+
+# Nombres para mostrar en las interfaces
+NOMBRES = {
+    "costo_minimo": "Costo Mínimo",
+    "esquina_noroeste": "Esquina Noroeste",
+    "vogel": "Vogel (VAM)",
+    "modi": "MODI",
+}
+
+ETAPAS = ("balanceo", "inicial", "optimizacion")
+
+
+class Solucion(namedtuple("Solucion", "problema inicial asignacion iteraciones tiempos")):
+    """Resultado de ``resolver``.
+
+    ``problema`` es el ``ProblemaBalanceado``, ``inicial`` la solución del
+    inicializador, ``asignacion`` la final (igual a ``inicial`` si no se
+    optimiza) y ``tiempos`` los segundos de cada etapa de ``ETAPAS``.
+    """
+
+    __slots__ = ()
+
+    @property
+    def costo_inicial(self):
+        return self.inicial.costo_total()
+
+    @property
+    def costo_total(self):
+        return self.asignacion.costo_total()
+
+    @property
+    def tiempo_total(self):
+        return sum(self.tiempos.values())
+
+    def separar(self):
+        """``(reales, ficticias)`` de la asignación final (ver ``ProblemaBalanceado.separar``)."""
+        return self.problema.separar(self.asignacion)
+
+
+def resolver(costos, ofertas, demandas, inicial="costo_minimo", optimizador="modi",
+             penalizaciones=None, observador=None):
+    """Balancea, construye la solución inicial y la optimiza.
+
+    ``inicial`` y ``optimizador`` son nombres de ``INICIALIZADORES`` y
+    ``OPTIMIZADORES`` (``optimizador=None`` se queda con la solución
+    inicial). ``observador(etapa, segundos)``, si se da, se llama al terminar
+    cada etapa.
+    """
+    if inicial not in INICIALIZADORES:
+        raise ValueError(f"Método inicial desconocido: {inicial!r} (opciones: {', '.join(INICIALIZADORES)})")
+    if optimizador is not None and optimizador not in OPTIMIZADORES:
+        raise ValueError(f"Optimizador desconocido: {optimizador!r} (opciones: {', '.join(OPTIMIZADORES)})")
+    tiempos = {}
+
+    def medir(etapa, funcion, *args):
+        inicio = time.perf_counter()
+        resultado = funcion(*args)
+        tiempos[etapa] = time.perf_counter() - inicio
+        if observador is not None:
+            observador(etapa, tiempos[etapa])
+        return resultado
+
+    problema = medir("balanceo", balancear, costos, ofertas, demandas, penalizaciones)
+    solucion_inicial = medir("inicial", INICIALIZADORES[inicial], problema.costos, problema.ofertas, problema.demandas)
+    if optimizador is None:
+        asignacion, iteraciones = solucion_inicial, 0
+    else:
+        asignacion, iteraciones = medir("optimizacion", OPTIMIZADORES[optimizador], problema.costos, solucion_inicial)
+    return Solucion(problema, solucion_inicial, asignacion, iteraciones, tiempos)
@@ -0,0 +1,74 @@
+"""Simplex de redes para problemas de transporte grandes y dispersos.
+
+El problema se da como lista de arcos permitidos (``origenes[k]``,
+``destinos[k]``, ``costos[k]``); las rutas que no existen simplemente no
+están, sin matrices densas ni costos big-M por celda. La base inicial une
+cada origen y cada destino a un nodo raíz artificial; solo esos m+n arcos
+artificiales llevan un costo alto y, si alguno conserva flujo al final, no hay
+solución factible con los arcos dados.
+"""
+import numpy as np
+
+from .arbol import ArbolExpansion, TOL
+from .metodos import esta_balanceado
+
+
+def simplex_red(origenes, destinos, costos, ofertas, demandas, max_iterations=None, bloque=None, tol=TOL):
+    """Resuelve el transporte balanceado sobre la lista de arcos dada.
+
+    ``origenes`` y ``destinos`` son índices (0..m-1 y 0..n-1) de cada arco.
+    ``bloque`` es la cantidad de arcos cuyos costos reducidos se revisan por
+    vez (por defecto, la raíz cuadrada de la cantidad de arcos, mínimo 4096).
+    Devuelve ``(flujos, iteraciones)`` con el flujo de cada arco de la lista.
+    """
+    origenes = np.asarray(origenes, dtype=np.int64)
+    destinos = np.asarray(destinos, dtype=np.int64)
+    costos = np.asarray(costos, dtype=float)
+    ofertas = np.asarray(ofertas, dtype=float)
+    demandas = np.asarray(demandas, dtype=float)
+    if not esta_balanceado(ofertas, demandas):
+        raise ValueError("El problema no está balanceado")
+    m, n, n_arcos = len(ofertas), len(demandas), len(costos)
+
+    # Nodos: orígenes 0..m-1, destinos m..m+n-1 y la raíz artificial m+n
+    raiz = m + n
+    cabeza = destinos + m
+    grande = 1.0 + (m + n) * (np.abs(costos).max() if n_arcos else 1.0)
+    aristas = [(i, raiz, grande, ofertas[i], n_arcos + i) for i in range(m)]
+    aristas += [(raiz, m + j, grande, demandas[j], n_arcos + m + j) for j in range(n)]
+    arbol = ArbolExpansion(m + n + 1, aristas, raiz=raiz, tol=tol)
+
+    tamano = min(n_arcos, bloque or max(4096, int(np.sqrt(n_arcos))))
+    inicio = 0
+
+    def elegir():
+        nonlocal inicio
+        for _ in range(-(-n_arcos // tamano) + 1):
+            fin = min(inicio + tamano, n_arcos)
+            reducidos = costos[inicio:fin] + arbol.pot[origenes[inicio:fin]] - arbol.pot[cabeza[inicio:fin]]
+            k = int(np.argmin(reducidos))
+            arco, inicio = inicio + k, fin % n_arcos
+            if reducidos[k] < -tol:
+                return arco, reducidos[k]
+        return None
+
+    iteraciones = 0
+    while n_arcos and (max_iterations is None or iteraciones < max_iterations):
+        entrante = elegir()
+        if entrante is None:
+            # Confirmar el óptimo con potenciales sin error acumulado
+            arbol.recalcular_potenciales()
+            entrante = elegir()
+            if entrante is None:
+                break
+        arco, reducido = entrante
+        arbol.pivotear(int(origenes[arco]), int(cabeza[arco]), costos[arco], reducido, arco)
+        iteraciones += 1
+
+    flujos = np.zeros(n_arcos)
+    arcos, flujo_base = arbol.aristas()
+    artificiales = arcos >= n_arcos
+    if (flujo_base[artificiales] > tol * (1.0 + ofertas.sum())).any():
+        raise ValueError("No hay solución factible con los arcos disponibles")
+    flujos[arcos[~artificiales]] = flujo_base[~artificiales]
+    return flujos, iteraciones
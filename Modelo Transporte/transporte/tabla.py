@@ -0,0 +1,80 @@
+"""Datos editables de la tabla de transporte, separados de los widgets que los muestran.
+
+La tabla se direcciona como en la interfaz y en los archivos: ``(m+1) x (n+1)``
+celdas, donde ``(i, j)`` con ``i < m`` y ``j < n`` es un costo, la columna
+``n`` son las ofertas y la fila ``m`` las demandas. Una celda vacía vale
+``nan``. Los totales de oferta y demanda y la cantidad de celdas vacías se
+actualizan al cambiar cada celda, sin volver a recorrer la tabla.
+"""
+import numpy as np
+
+from .balanceo import matriz_costos
+
+
+class TablaCostos:
+    """Costos (en la disposición de ``matriz_costos``), ofertas y demandas de un modelo."""
+
+    def __init__(self, num_origenes, num_destinos):
+        self.num_origenes = num_origenes
+        self.num_destinos = num_destinos
+        self.costos = np.full((num_origenes + 1, num_destinos + 1), np.nan)
+        self.ofertas = np.full(num_origenes, np.nan)
+        self.demandas = np.full(num_destinos, np.nan)
+        self.total_oferta = 0.0
+        self.total_demanda = 0.0
+        self.vacias = num_origenes * num_destinos + num_origenes + num_destinos
+
+    @classmethod
+    def desde_arreglos(cls, costos, ofertas, demandas):
+        """Tabla con datos ya cargados; si ``costos`` viene de ``matriz_costos`` no se copia."""
+        tabla = cls.__new__(cls)
+        ofertas = np.array(ofertas, dtype=float)
+        demandas = np.array(demandas, dtype=float)
+        m, n = len(ofertas), len(demandas)
+        costos = np.asarray(costos, dtype=float)
+        if costos.shape == (m, n):
+            costos = matriz_costos(costos)
+        elif costos.shape != (m + 1, n + 1):
+            raise ValueError(f"La matriz de costos debe ser {m}x{n} o {m+1}x{n+1}")
+        tabla.num_origenes, tabla.num_destinos = m, n
+        tabla.costos, tabla.ofertas, tabla.demandas = costos, ofertas, demandas
+        tabla.total_oferta = float(np.nansum(ofertas))
+        tabla.total_demanda = float(np.nansum(demandas))
+        tabla.vacias = int(np.isnan(costos[:m, :n]).sum() + np.isnan(ofertas).sum() + np.isnan(demandas).sum())
+        return tabla
+
+    def _arreglo(self, fila, columna):
+        """Arreglo e índice donde se guarda la celda ``(fila, columna)``."""
+        m, n = self.num_origenes, self.num_destinos
+        if fila == m and columna == n:
+            raise IndexError("La esquina de la tabla no es una celda editable")
+        if columna == n:
+            return self.ofertas, fila
+        if fila == m:
+            return self.demandas, columna
+        return self.costos, (fila, columna)
+
+    def valor(self, fila, columna):
+        arreglo, indice = self._arreglo(fila, columna)
+        return arreglo[indice]
+
+    def asignar(self, fila, columna, valor):
+        """Cambia una celda (``nan`` la deja vacía) y actualiza totales y vacías."""
+        arreglo, indice = self._arreglo(fila, columna)
+        anterior = arreglo[indice]
+        arreglo[indice] = valor
+        self.vacias += int(np.isnan(valor)) - int(np.isnan(anterior))
+        diferencia = (0.0 if np.isnan(valor) else valor) - (0.0 if np.isnan(anterior) else anterior)
+        if arreglo is self.ofertas:
+            self.total_oferta += diferencia
+        elif arreglo is self.demandas:
+            self.total_demanda += diferencia
+
+    def balanceado(self, tol=1e-6):
+        return abs(self.total_oferta - self.total_demanda) <= tol
+
+    def datos(self):
+        """``(costos, ofertas, demandas)`` listos para ``balancear``; error si queda alguna celda vacía."""
+        if self.vacias:
+            raise ValueError(f"Quedan {self.vacias} celdas vacías en la tabla")
+        return self.costos, self.ofertas, self.demandas
@@ -0,0 +1,65 @@
+"""Tiempo de arranque en frío de los módulos del proyecto y bibliotecas pesadas que cargan.
+
+Cada módulo se importa en un proceso nuevo con ``python -X importtime``
+desde su carpeta; se toma su tiempo acumulado del informe (el menor de
+varias repeticiones) y se anotan las bibliotecas pesadas que quedaron
+cargadas. Los motores (simplex, transporte, método gráfico) solo pueden
+cargar NumPy; matplotlib, tkinter y customtkinter se cargan al usarse.
+Termina con código 1 si algún módulo pasa el presupuesto o carga una
+biblioteca que no le corresponde.
+
+    python benchmark_importacion.py [presupuesto_ms] [repeticiones]
+"""
+import os
+import subprocess
+import sys
+
+PESADAS = ("numpy", "scipy", "matplotlib", "tkinter", "customtkinter")
+
+# (carpeta, módulo, bibliotecas pesadas que puede cargar al importarse)
+ENTRADAS = [
+    ("Metodo Simple", "simplex", {"numpy"}),
+    ("Modelo Transporte", "transporte", {"numpy"}),
+    ("grafico", "motor", {"numpy"}),
+    ("grafico", "dibujo", {"numpy"}),
+    ("grafico", "Linealmax", {"numpy"}),
+    ("Metodo Simple", "interfaz", {"tkinter"}),
+]
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+
+def medir_importacion(carpeta, modulo):
+    """``(milisegundos, bibliotecas pesadas cargadas)`` de importar ``modulo`` en un proceso nuevo."""
+    codigo = f"import sys, {modulo}; print(' '.join(m for m in {PESADAS!r} if m in sys.modules))"
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=os.path.join(RAIZ, carpeta), capture_output=True, text=True, check=True,
+    )
+    # Líneas "import time: propio | acumulado | módulo"; el módulo pedido aparece sin sangría
+    for linea in proceso.stderr.splitlines():
+        partes = linea.split("|")
+        if len(partes) == 3 and partes[2].rstrip() == f" {modulo}":
+            microsegundos = int(partes[1])
+            break
+    else:
+        raise RuntimeError(f"No se encontró {modulo} en el informe de -X importtime")
+    return microsegundos / 1e3, set(proceso.stdout.split())
+
+
+if __name__ == "__main__":
+    presupuesto = float(sys.argv[1]) if len(sys.argv) > 1 else 300.0
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    fallas = 0
+    for carpeta, modulo, permitidas in ENTRADAS:
+        mediciones = [medir_importacion(carpeta, modulo) for _ in range(repeticiones)]
+        ms = min(t for t, _ in mediciones)
+        cargadas = mediciones[0][1]
+        sobrantes = cargadas - permitidas
+        ok = ms <= presupuesto and not sobrantes
+        fallas += not ok
+        detalle = f"   de más: {', '.join(sorted(sobrantes))}" if sobrantes else ""
+        print(f"{'ok   ' if ok else 'FALLA'} {carpeta + '/' + modulo:32s} {ms:8.1f} ms   "
+              f"carga: {', '.join(sorted(cargadas)) or '-'}{detalle}")
+    print(f"\nPresupuesto: {presupuesto:.0f} ms por módulo; {fallas} con fallas")
+    sys.exit(1 if fallas else 0)
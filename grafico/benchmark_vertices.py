@@ -0,0 +1,60 @@
+"""Enumeración de vértices del método gráfico: bucle por pares, versión en lote y semiplanos.
+
+Compara ``vertices.vertices_factibles`` con el bucle anterior (un
+``np.linalg.solve`` y una prueba de factibilidad por par, copiado aquí como
+referencia) y con ``semiplanos.region_factible`` (O(m log m)) sobre
+restricciones aleatorias tangentes a un círculo, donde todas forman parte de
+la frontera.
+
+    python benchmark_vertices.py [restricciones...]
+"""
+import sys
+import time
+import numpy as np
+from vertices import vertices_factibles
+from semiplanos import region_factible
+
+
+# ---------------- Versión anterior (referencia) ----------------
+def vertices_pares(A, b):
+    puntos = []
+    for i in range(len(A)):
+        for j in range(i + 1, len(A)):
+            A_sub = np.array([A[i], A[j]])
+            b_sub = np.array([b[i], b[j]])
+            try:
+                punto = np.linalg.solve(A_sub, b_sub)
+                if all(np.dot(A, punto) <= b) and all(punto >= 0):
+                    puntos.append(punto)
+            except np.linalg.LinAlgError:
+                pass
+    return puntos
+
+
+def restricciones_circulo(m, seed=0):
+    """m restricciones tangentes al círculo de radio 10 centrado en (20, 20), en el primer cuadrante."""
+    angulos = np.random.default_rng(seed).uniform(0, np.pi / 2, m)
+    A = np.column_stack([np.cos(angulos), np.sin(angulos)])
+    b = A @ np.array([20.0, 20.0]) + 10.0
+    return A, b
+
+
+def medir(funcion, A, b):
+    inicio = time.perf_counter()
+    resultado = funcion(A, b)
+    return resultado, time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    tamanos = [int(t) for t in sys.argv[1:]] or [50, 200, 1000, 5000, 100000]
+    for m in tamanos:
+        A, b = restricciones_circulo(m)
+        (poligono, _), t_semiplanos = medir(region_factible, A, b)
+        linea = f"{m:6d} restricciones: semiplanos {t_semiplanos * 1e3:9.1f} ms ({len(poligono)} vértices)"
+        if m <= 5000:
+            nuevo, t_nuevo = medir(vertices_factibles, A, b)
+            linea += f"   en lote {t_nuevo * 1e3:9.1f} ms ({len(nuevo)} vértices)"
+        if m <= 200:
+            viejo, t_viejo = medir(vertices_pares, A.tolist(), b.tolist())
+            linea += f"   por pares {t_viejo * 1e3:9.1f} ms ({len(viejo)} vértices, sin los ejes)"
+        print(linea)
@@ -0,0 +1,123 @@
+"""Dibujo del método gráfico sobre figuras explícitas, sin pyplot ni ventanas.
+
+``dibujar`` pinta una ``Solucion`` de ``motor.resolver`` en unos ejes dados
+(de pyplot o de una ``Figure``); ``figura`` y ``guardar`` crean la figura con
+el lienzo Agg, así que funcionan sin pantalla y en varios procesos a la vez.
+matplotlib se importa recién al crear la primera figura.
+``guardar_lote`` resuelve y guarda muchos problemas en procesos paralelos.
+
+    python dibujo.py problemas.json carpeta [png|svg]
+
+donde ``problemas.json`` es una lista de objetos con ``c``, ``A``, ``b`` y,
+opcionalmente, ``operadores``, ``sentido`` y ``nombre``.
+"""
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from motor import resolver
+from semiplanos import region_factible
+
+TITULOS = {"max": "Maximización", "min": "Minimización"}
+ETIQUETAS = {"max": "Óptimo (Máximo)", "min": "Óptimo (Mínimo)"}
+
+
+def dibujar(solucion, ax):
+    """Restricciones, región factible, vértices y óptimo de ``solucion`` en los ejes ``ax``."""
+    limite = solucion.limite_vista()
+    x = np.array([0.0, limite])
+
+    # Restricciones
+    for i, (a, bi) in enumerate(zip(solucion.A, solucion.b)):
+        if a[1] != 0:  # Restricción con x2
+            ax.plot(x, (bi - a[0] * x) / a[1], label=f"Restricción {i+1}")
+        elif a[0] != 0:  # Restricción vertical
+            ax.plot([bi / a[0]] * 2, x, label=f"Restricción {i+1}")
+
+    # Región factible recortada a la zona visible
+    vista, _ = region_factible(solucion.A, solucion.b, solucion.operadores, limite=limite)
+    if len(vista):
+        ax.fill(vista[:, 0], vista[:, 1], alpha=0.3)
+
+    reales = solucion.vertices_reales
+    if len(reales):
+        ax.scatter(reales[:, 0], reales[:, 1], color="red")
+    if solucion.estado == "optimo":
+        mejor, z_opt = solucion.optimo, solucion.z
+        ax.scatter(mejor[0], mejor[1], color="blue", s=100, label=ETIQUETAS[solucion.sentido])
+        ax.text(mejor[0]+0.5, mejor[1]+0.5,
+                f"({mejor[0]:.2f}, {mejor[1]:.2f})\nZ={z_opt:.2f}",
+                fontsize=10, color="blue", bbox=dict(facecolor="white", alpha=0.6))
+    elif solucion.estado == "ilimitado":
+        ax.text(0.5, 0.95, "Problema ilimitado", transform=ax.transAxes, ha="center", va="top", color="red")
+    else:
+        ax.text(0.5, 0.95, "Sin soluciones factibles", transform=ax.transAxes, ha="center", va="top", color="red")
+
+    ax.set_xlim(0, limite)
+    ax.set_ylim(0, limite)
+    ax.set_xlabel("x1")
+    ax.set_ylabel("x2")
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend()
+    ax.grid()
+    ax.set_title(f"Método Gráfico - {TITULOS[solucion.sentido]}")
+
+
+def figura(solucion, tamano=(7, 6), dpi=100):
+    """``Figure`` con lienzo Agg (independiente de pyplot) con la solución dibujada."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=tamano, dpi=dpi)
+    FigureCanvasAgg(fig)
+    dibujar(solucion, fig.add_subplot())
+    return fig
+
+
+def guardar(solucion, ruta, **kwargs):
+    """Guarda la solución como imagen; el formato (png, svg, pdf...) sale de la extensión de ``ruta``."""
+    figura(solucion, **kwargs).savefig(ruta)
+
+
+def _resolver_y_guardar(tarea):
+    """Trabajo de un proceso de ``guardar_lote``: ``(problema, ruta)`` -> ``Solucion``."""
+    problema, ruta = tarea
+    solucion = resolver(problema["c"], problema["A"], problema["b"],
+                        problema.get("operadores"), problema.get("sentido", "max"))
+    guardar(solucion, ruta)
+    return solucion
+
+
+def guardar_lote(problemas, carpeta, formato="png", procesos=None):
+    """Resuelve y guarda cada problema como ``carpeta/<nombre>.<formato>`` en procesos paralelos.
+
+    Cada problema es un diccionario con ``c``, ``A``, ``b`` y, opcionalmente,
+    ``operadores``, ``sentido`` y ``nombre`` (por defecto ``problema_<k>``).
+    ``procesos=1`` trabaja en el proceso actual. Devuelve ``[(ruta, Solucion), ...]``
+    en el orden de ``problemas``.
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    tareas = [
+        (problema, os.path.join(carpeta, f"{problema.get('nombre', f'problema_{k + 1}')}.{formato}"))
+        for k, problema in enumerate(problemas)
+    ]
+    if procesos == 1:
+        soluciones = list(map(_resolver_y_guardar, tareas))
+    else:
+        with ProcessPoolExecutor(procesos) as ejecutor:
+            soluciones = list(ejecutor.map(_resolver_y_guardar, tareas, chunksize=max(1, len(tareas) // 64)))
+    return [(ruta, solucion) for (_, ruta), solucion in zip(tareas, soluciones)]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        sys.exit("Uso: python dibujo.py problemas.json carpeta [png|svg]")
+    with open(sys.argv[1], encoding="utf-8") as archivo:
+        problemas = json.load(archivo)
+    formato = sys.argv[3] if len(sys.argv) > 3 else "png"
+    for ruta, solucion in guardar_lote(problemas, sys.argv[2], formato):
+        z = "" if solucion.estado != "optimo" else f"  Z = {solucion.z:.2f}"
+        print(f"{ruta}: {solucion.estado}{z}")
@@ -0,0 +1,61 @@
+"""Método gráfico sin interfaz: resuelve el PL y devuelve el resultado como datos.
+
+``resolver`` no dibuja ni imprime; la misma ``Solucion`` sirve para mostrarla
+en consola, dibujarla en pantalla (``Linealmax.py``, ``Linealmin.py``) o
+guardarla como imagen en lote (``dibujo.py``).
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from semiplanos import region_factible, optimo_region
+
+ESTADOS = ("optimo", "ilimitado", "infactible")
+
+
+class Solucion(namedtuple("Solucion", "c A b operadores sentido vertices en_caja indice z ilimitado")):
+    """Resultado de ``resolver``.
+
+    Guarda el problema (``c``, ``A``, ``b``, ``operadores``, ``sentido``) junto
+    con el polígono factible de ``region_factible`` (``vertices`` y
+    ``en_caja``), el índice del vértice óptimo, su valor ``z`` y si el problema
+    es ilimitado.
+    """
+
+    __slots__ = ()
+
+    @property
+    def estado(self):
+        if self.ilimitado:
+            return "ilimitado"
+        return "infactible" if self.indice is None else "optimo"
+
+    @property
+    def optimo(self):
+        """Punto óptimo ``(x1, x2)``, o ``None`` si no hay óptimo finito."""
+        return None if self.estado != "optimo" else self.vertices[self.indice]
+
+    @property
+    def vertices_reales(self):
+        """Vértices de la región, sin los que agrega la caja de una región no acotada."""
+        return self.vertices[~self.en_caja]
+
+    def limite_vista(self):
+        """Lado de la zona ``[0, L]^2`` que conviene mostrar: un poco más allá de los vértices reales."""
+        reales = self.vertices_reales
+        if len(reales):
+            return 1.5 * max(float(reales.max()), 1.0)
+        return max(float(np.abs(self.b).max()) * 2 if self.b.size else 0.0, 10.0)
+
+
+def resolver(c, A, b, operadores=None, sentido="max"):
+    """Región factible y óptimo de ``c x`` sujeto a ``A x (<=|>=) b``, ``x >= 0``."""
+    if sentido not in ("max", "min"):
+        raise ValueError(f"Sentido desconocido: {sentido!r} (use 'max' o 'min')")
+    c = np.asarray(c, dtype=float).ravel()
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).ravel()
+    operadores = ["<="] * len(b) if operadores is None else [op.strip() for op in operadores]
+    vertices, en_caja = region_factible(A, b, operadores)
+    indice, z, ilimitado = optimo_region(c, vertices, en_caja, sentido)
+    return Solucion(c, A, b, operadores, sentido, vertices, en_caja, indice, z, ilimitado)
@@ -0,0 +1,164 @@
+"""Región factible exacta de un PL de dos variables por intersección de semiplanos.
+
+Cada restricción ``a x <= b`` (las ``>=`` se invierten) es un semiplano. Se
+ordenan por el ángulo de su recta frontera y se recorren una vez con una
+doble cola (deque), descartando por delante y por detrás los semiplanos que
+dejan de aportar un lado: O(m log m) por el ordenamiento y O(m) el recorrido.
+El resultado son los vértices del polígono factible en orden antihorario.
+
+Una región no acotada se cierra con una caja ``x1 <= L``, ``x2 <= L`` muy
+grande; los vértices que quedan sobre la caja indican hacia dónde no está
+acotada y, si el óptimo solo se alcanza en ellos, el problema es ilimitado.
+Si la región no tiene área (un segmento o un punto, por ejemplo con ``x1 <= 0``)
+la intersección sale vacía y sus extremos se buscan con ``vertices_factibles``.
+"""
+from collections import deque
+
+import numpy as np
+
+from vertices import vertices_factibles
+
+OPERADORES = {"<=": 1.0, ">=": -1.0}
+
+
+def _normalizar(A, b, operadores=None, tol=1e-9):
+    """Restricciones como ``a x <= b`` con ``|a| = 1``; ``None`` si alguna es ``0 <= b < 0``."""
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).ravel()
+    if operadores is not None:
+        try:
+            signo = np.array([OPERADORES[op.strip()] for op in operadores])
+        except KeyError as error:
+            raise ValueError(f"Operador no soportado: {error.args[0]!r} (use '<=' o '>=')") from None
+        A, b = A * signo[:, None], b * signo
+    norma = np.hypot(A[:, 0], A[:, 1])
+    nulas = norma <= tol
+    if (b[nulas] < -tol).any():
+        return None
+    return A[~nulas] / norma[~nulas, None], b[~nulas] / norma[~nulas]
+
+
+def interseccion_semiplanos(A, b, tol=1e-9):
+    """Vértices en sentido antihorario de ``{x : A x <= b}``, que debe ser acotada.
+
+    Devuelve un arreglo (k x 2), vacío si la intersección es vacía o se reduce
+    a un segmento o un punto.
+    """
+    normalizadas = _normalizar(A, b, tol=tol)
+    if normalizadas is None:
+        return np.zeros((0, 2))
+    A, b = normalizadas
+    # Dirección de cada recta con la región a su izquierda y un punto sobre ella
+    direcciones = np.column_stack([-A[:, 1], A[:, 0]])
+    puntos = A * b[:, None]
+    angulos = np.arctan2(direcciones[:, 1], direcciones[:, 0])
+    angulos[angulos <= -np.pi + tol] = np.pi
+    # Con ángulos iguales solo importa el semiplano más restrictivo (menor b)
+    orden = np.lexsort((b, angulos))
+    distintos = np.concatenate([[True], np.diff(angulos[orden]) > tol])
+    orden = orden[distintos]
+    d = direcciones[orden].tolist()
+    p = puntos[orden].tolist()
+
+    def fuera(k, r):
+        """True si el punto r queda estrictamente a la derecha (fuera) del semiplano k."""
+        cruz = d[k][0] * (r[1] - p[k][1]) - d[k][1] * (r[0] - p[k][0])
+        return cruz < -tol * (1.0 + max(abs(r[0]), abs(r[1])))
+
+    def corte(k, l):
+        """Intersección de las rectas frontera de k y l (no paralelas)."""
+        t = (d[l][0] * (p[l][1] - p[k][1]) - d[l][1] * (p[l][0] - p[k][0])) / (d[l][0] * d[k][1] - d[l][1] * d[k][0])
+        return p[k][0] + t * d[k][0], p[k][1] + t * d[k][1]
+
+    cola = deque()
+    for h in range(len(d)):
+        while len(cola) >= 2 and fuera(h, corte(cola[-1], cola[-2])):
+            cola.pop()
+        while len(cola) >= 2 and fuera(h, corte(cola[0], cola[1])):
+            cola.popleft()
+        if cola:
+            ultimo = cola[-1]
+            if abs(d[h][0] * d[ultimo][1] - d[h][1] * d[ultimo][0]) <= tol:
+                if d[h][0] * d[ultimo][0] + d[h][1] * d[ultimo][1] < 0:
+                    # Semiplanos opuestos que quedan juntos: la franja entre ellos es vacía o sin ancho
+                    return np.zeros((0, 2))
+                if fuera(h, p[ultimo]):
+                    cola[-1] = h
+                continue
+        cola.append(h)
+    while len(cola) >= 3 and fuera(cola[0], corte(cola[-1], cola[-2])):
+        cola.pop()
+    while len(cola) >= 3 and fuera(cola[-1], corte(cola[0], cola[1])):
+        cola.popleft()
+    if len(cola) < 3:
+        return np.zeros((0, 2))
+
+    cola = list(cola)
+    # El último y el primero opuestos: región vacía (no tienen corte)
+    for k, l in zip(cola, cola[1:] + cola[:1]):
+        if abs(d[k][0] * d[l][1] - d[k][1] * d[l][0]) <= tol:
+            return np.zeros((0, 2))
+    vertices = np.array([corte(cola[k], cola[(k + 1) % len(cola)]) for k in range(len(cola))])
+    # Vértices repetidos cuando más de dos rectas pasan por el mismo punto
+    siguiente = np.roll(vertices, -1, axis=0)
+    distintos = np.abs(vertices - siguiente).max(axis=1) > tol * (1.0 + np.abs(vertices).max(axis=1))
+    vertices = vertices[distintos]
+    return vertices if len(vertices) >= 3 else np.zeros((0, 2))
+
+
+def limite_caja(b):
+    """Lado de la caja que cierra una región no acotada, lejos de cualquier vértice real."""
+    b = np.asarray(b, dtype=float)
+    return 1e6 * max(1.0, float(np.abs(b).max()) if b.size else 1.0)
+
+
+def region_factible(A, b, operadores=None, limite=None, tol=1e-9):
+    """Polígono factible de ``A x (<=|>=) b``, ``x >= 0``, recortado a ``[0, limite]^2``.
+
+    Devuelve ``(vertices, en_caja)``: los vértices en orden antihorario y una
+    máscara que marca los que están sobre la caja (``x1 = limite`` o
+    ``x2 = limite``), es decir, los que no son vértices de la región real.
+    Una región sin área devuelve sus extremos (dos vértices o uno).
+    """
+    normalizadas = _normalizar(A, b, operadores, tol)
+    if normalizadas is None:
+        return np.zeros((0, 2)), np.zeros(0, dtype=bool)
+    A, b = normalizadas
+    if limite is None:
+        limite = limite_caja(b)
+    # x1 >= 0, x2 >= 0 y la caja x1 <= limite, x2 <= limite
+    A = np.vstack([A, -np.eye(2), np.eye(2)])
+    b = np.concatenate([b, [0.0, 0.0, limite, limite]])
+    vertices = interseccion_semiplanos(A, b, tol)
+    if not len(vertices):
+        # Vacía o sin área: los extremos de un segmento o un punto siguen siendo vértices
+        # (vertices_factibles ya agrega x >= 0; la caja sí hace falta para cerrar un rayo)
+        filas = np.r_[:len(b) - 4, len(b) - 2, len(b) - 1]
+        vertices = vertices_factibles(A[filas], b[filas], tol)
+        if len(vertices) > 2:
+            vertices = vertices[[np.argmin(vertices @ [1.0, 1e-3]), np.argmax(vertices @ [1.0, 1e-3])]]
+    en_caja = (np.abs(vertices - limite) <= tol * limite).any(axis=1)
+    return vertices, en_caja
+
+
+def optimo_region(c, vertices, en_caja, sentido="max", tol=1e-9):
+    """Mejor vértice del polígono: ``(indice, z, ilimitado)``.
+
+    Entre vértices empatados se prefiere uno real; si el mejor valor solo se
+    alcanza sobre la caja, Z crece sin límite y ``ilimitado`` es True. Sin
+    vértices (región vacía) devuelve ``(None, None, False)``.
+    """
+    if not len(vertices):
+        return None, None, False
+    vertices = np.asarray(vertices, dtype=float)
+    c = np.asarray(c, dtype=float)
+    z = vertices @ c
+    puntaje = (1.0 if sentido == "max" else -1.0) * z
+    # El error de redondeo de cada z crece con |c|·|x|: sobre la caja (x ~ limite) no
+    # alcanza una tolerancia relativa a z cuando c es paralelo a un lado no acotado
+    holgura = tol * (1.0 + np.abs(vertices) @ np.abs(c))
+    idx = int(np.argmax(puntaje))
+    reales = np.flatnonzero(~en_caja & (puntaje >= puntaje[idx] - holgura[idx] - holgura))
+    if len(reales):
+        return int(reales[0]), float(z[reales[0]]), False
+    return idx, float(z[idx]), True
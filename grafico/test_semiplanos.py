@@ -0,0 +1,84 @@
+"""Intersección de semiplanos contra scipy.optimize.linprog en PL de dos variables aleatorios.
+
+    python -m pytest test_semiplanos.py
+"""
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+from semiplanos import optimo_region, region_factible
+from vertices import vertices_factibles
+
+
+def pl_aleatorio(m, rng):
+    """Coeficientes enteros pequeños: hay rectas paralelas, repetidas y vértices degenerados."""
+    A = rng.integers(-5, 6, (m, 2)).astype(float)
+    b = rng.integers(-10, 21, m).astype(float)
+    operadores = rng.choice(["<=", ">="], m).tolist()
+    return A, b, operadores, rng.integers(-5, 6, 2).astype(float)
+
+
+def como_menor_igual(A, b, operadores):
+    signo = np.where(np.array(operadores) == "<=", 1.0, -1.0)
+    return A * signo[:, None], b * signo
+
+
+def ordenados(puntos):
+    puntos = np.round(np.asarray(puntos, dtype=float).reshape(-1, 2), 6) + 0.0
+    return puntos[np.lexsort((puntos[:, 1], puntos[:, 0]))]
+
+
+@pytest.mark.parametrize("sentido", ["max", "min"])
+@pytest.mark.parametrize("seed", range(10))
+def test_optimo_igual_a_linprog(sentido, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(50):
+        A, b, operadores, c = pl_aleatorio(rng.integers(1, 8), rng)
+        A_ub, b_ub = como_menor_igual(A, b, operadores)
+        esperado = linprog(-c if sentido == "max" else c, A_ub=A_ub, b_ub=b_ub, method="highs")
+        vertices, en_caja = region_factible(A, b, operadores)
+        indice, z, ilimitado = optimo_region(c, vertices, en_caja, sentido)
+        if esperado.status == 2:
+            assert indice is None
+        elif esperado.status == 3:
+            assert ilimitado
+        elif esperado.status == 4:
+            # HiGHS a veces solo informa "infactible o ilimitado"
+            assert indice is None or ilimitado
+        else:
+            assert esperado.status == 0
+            assert not ilimitado
+            assert z == pytest.approx(-esperado.fun if sentido == "max" else esperado.fun, abs=1e-7)
+            x = vertices[indice]
+            assert (x >= -1e-9).all() and (A_ub @ x <= b_ub + 1e-7).all()
+
+
+def test_optimo_paralelo_a_un_lado_no_acotado():
+    # min -4x1 + 5x2 vale -4 en todo el rayo de -4x1 + 5x2 >= -4; el vértice de la caja empata
+    A = [[-4, 5], [-2, -4], [5, 2], [0, -5], [-3, 4], [-1, 1]]
+    b = [-4, -8, 10, 4, 19, 18]
+    vertices, en_caja = region_factible(A, b, [">=", "<=", ">=", "<=", ">=", "<="])
+    indice, z, ilimitado = optimo_region([-4, 5], vertices, en_caja, "min")
+    assert not ilimitado and not en_caja[indice]
+    assert z == pytest.approx(-4.0)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_vertices_iguales_a_fuerza_bruta(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(50):
+        A, b, operadores, _ = pl_aleatorio(rng.integers(1, 8), rng)
+        vertices, en_caja = region_factible(A, b, operadores)
+        np.testing.assert_allclose(ordenados(vertices[~en_caja]),
+                                   ordenados(vertices_factibles(*como_menor_igual(A, b, operadores))), atol=1e-6)
+
+
+@pytest.mark.parametrize("A, b, operadores, esperado", [
+    ([[1, 0], [1, 1]], [0, 4], ["<=", "<="], [[0, 0], [0, 4]]),
+    ([[1, 1], [1, 1]], [4, 4], ["<=", ">="], [[0, 4], [4, 0]]),
+    ([[1, 0], [0, 1]], [0, 0], ["<=", "<="], [[0, 0]]),
+    ([[1, 1], [1, 1]], [2, 4], ["<=", ">="], []),
+])
+def test_region_sin_area(A, b, operadores, esperado):
+    vertices, en_caja = region_factible(A, b, operadores)
+    assert not en_caja.any()
+    np.testing.assert_allclose(ordenados(vertices), ordenados(esperado))
@@ -0,0 +1,98 @@
+"""Vértices de la región factible de un PL de dos variables, calculados en lote con NumPy.
+
+Las restricciones son ``A x <= b`` más ``x1 >= 0`` y ``x2 >= 0``. Cada recta
+frontera (incluidos los ejes ``x1 = 0`` y ``x2 = 0``) se recorta contra todos
+los semiplanos a la vez: sobre la recta ``i`` (punto ``p_i`` y dirección
+``d_i``) la restricción ``j`` impone ``t (N_j · d_i) <= h_j - N_j · p_i``, y
+los dos productos ``N_j · d_i`` y ``N_j · N_i`` de un bloque de rectas contra
+todas las restricciones son dos productos de matrices. El tramo factible
+``[t_min, t_max]`` de cada recta sale de un mínimo y un máximo por fila; sus
+extremos son los vértices, junto con la restricción que los fija. Cada par
+``(i, j)`` se resuelve una sola vez con la regla de Cramer sobre arreglos.
+
+Como cada extremo es el corte con la restricción que realmente lo limita, tres
+rectas casi concurrentes no generan vértices de más (el corte de las dos de
+los extremos, que queda fuera de la del medio por menos que la tolerancia).
+"""
+import numpy as np
+
+# Pares (recta, restricción) por bloque: acota la memoria con miles de restricciones
+PARES_POR_BLOQUE = 1 << 16
+
+
+def _semiplanos(A, b, tol=1e-9):
+    """Ejes y restricciones como ``N x <= h`` con ``|N[i]| = 1``; ``None`` si alguna es ``0 <= b < 0``."""
+    N = np.vstack([-np.eye(2), np.asarray(A, dtype=float).reshape(-1, 2)])
+    h = np.concatenate([np.zeros(2), np.asarray(b, dtype=float).ravel()])
+    norma = np.hypot(N[:, 0], N[:, 1])
+    nulas = norma <= tol
+    if (h[nulas] < -tol).any():
+        return None
+    return N[~nulas] / norma[~nulas, None], h[~nulas] / norma[~nulas]
+
+
+def tramos(N, h, tol=1e-9):
+    """Tramo factible de cada recta ``N[i] x = h[i]`` (filas de norma 1), por bloques de rectas.
+
+    Devuelve por bloque ``(filas, t_min, j_min, t_max, j_max)``: sobre la recta
+    ``i``, con ``x = h[i] N[i] + t (-N[i,1], N[i,0])``, la región es
+    ``t_min <= t <= t_max`` y ``j_min``/``j_max`` son las restricciones que la
+    limitan (``-inf``/``inf`` si no hay). Una recta fuera de la región (por una
+    restricción paralela) tiene ``t_min = inf`` y ``t_max = -inf``.
+    """
+    m = len(h)
+    direcciones = np.column_stack([-N[:, 1], N[:, 0]])
+    margen = tol * (1.0 + np.abs(h))
+    paso = max(1, PARES_POR_BLOQUE // m)
+    for inicio in range(0, m, paso):
+        filas = np.arange(inicio, min(m, inicio + paso))
+        den = direcciones[filas] @ N.T
+        num = N[filas] @ N.T
+        num *= -h[filas, None]
+        num += h[None, :]
+        paralelas = np.abs(den) <= tol
+        fuera = (paralelas & (num < -margen[None, :])).any(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(num, den, out=num)
+        t = np.where(den > tol, num, np.inf)
+        j_max = t.argmin(axis=1)
+        t_max = t[np.arange(len(filas)), j_max]
+        np.copyto(num, -np.inf, where=den >= -tol)
+        j_min = num.argmax(axis=1)
+        t_min = num[np.arange(len(filas)), j_min]
+        t_min[fuera], t_max[fuera] = np.inf, -np.inf
+        yield filas, t_min, j_min, t_max, j_max
+
+
+def cortes(N, h, i, j):
+    """Puntos de corte de las rectas ``i`` y ``j`` (arreglos de índices), por la regla de Cramer."""
+    det = N[i, 0] * N[j, 1] - N[i, 1] * N[j, 0]
+    x1 = (h[i] * N[j, 1] - N[i, 1] * h[j]) / det
+    x2 = (N[i, 0] * h[j] - h[i] * N[j, 0]) / det
+    return np.column_stack([x1, x2])
+
+
+def vertices_factibles(A, b, tol=1e-9):
+    """Vértices (sin repetir) de ``{x : A x <= b, x >= 0}``, incluidos los que están sobre los ejes."""
+    semiplanos = _semiplanos(A, b, tol)
+    if semiplanos is None:
+        return np.zeros((0, 2))
+    N, h = semiplanos
+    pares = []
+    for filas, t_min, j_min, t_max, j_max in tramos(N, h, tol):
+        largo = np.where(np.isfinite(t_min), np.abs(t_min), 0.0) + np.where(np.isfinite(t_max), np.abs(t_max), 0.0)
+        validas = t_min <= t_max + tol * (1.0 + largo)
+        for t, j in ((t_min, j_min), (t_max, j_max)):
+            extremo = validas & np.isfinite(t)
+            pares.append(np.column_stack([filas[extremo], j[extremo]]))
+    pares = np.vstack(pares)
+    if not len(pares):
+        return np.zeros((0, 2))
+    # Cada vértice sale de sus dos rectas: se resuelve cada par una vez
+    pares = np.unique(np.sort(pares, axis=1), axis=0)
+    puntos = cortes(N, h, pares[:, 0], pares[:, 1])
+    # Un vértice degenerado (más de dos rectas por el mismo punto) sale de varios pares
+    escala = max(1.0, float(np.abs(puntos).max()))
+    puntos = np.where(np.abs(puntos) <= tol * escala, 0.0, puntos)
+    _, unicos = np.unique(np.round(puntos / (tol * escala)), axis=0, return_index=True)
+    return puntos[unicos]